@@ -70,6 +70,32 @@ def setup_logging() -> None:
     ws_server_logger.addFilter(WebSocketHandshakeFilter())
 
 
+def install_uvloop() -> bool:
+    """
+    Usa uvloop como event loop asyncio, se disponível.
+    
+    Vale para os modos WebSocket/dual (providers realtime e sender loops do
+    FreeSWITCH rodam inteiramente em asyncio). uvloop só existe para
+    Linux/macOS; sem ele, segue com o loop padrão. UVLOOP_ENABLED=false
+    desativa.
+    
+    Returns:
+        True se uvloop foi instalado
+    """
+    if os.getenv("UVLOOP_ENABLED", "true").lower() in ("false", "0", "no"):
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not available, using default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("uvloop event loop policy installed")
+    return True
+
+
 def run_websocket_server(host: str, port: int) -> None:
     """Inicia servidor WebSocket (asyncio)."""
     from .server import run_server
@@ -184,6 +210,7 @@ def main() -> None:
     
     if audio_mode == "websocket":
         # Modo WebSocket apenas (via mod_audio_stream)
+        install_uvloop()
         run_websocket_server(ws_host, ws_port)
         
     elif audio_mode == "rtp" or audio_mode == "esl":
@@ -192,6 +219,8 @@ def main() -> None:
         
     elif audio_mode == "dual":
         # Ambos os modos simultaneamente
+        # (ESL roda em thread gevent própria; uvloop só afeta o asyncio)
+        install_uvloop()
         run_dual_mode(ws_host, ws_port, esl_host, esl_port)
         
     else:
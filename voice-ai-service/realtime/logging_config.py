@@ -15,6 +15,7 @@ Features:
 import logging
 import logging.handlers
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -22,6 +23,8 @@ from typing import Any, Dict, Optional
 import structlog
 from structlog.types import Processor
 
+from .utils import json_codec
+
 
 def add_timestamp(
     logger: logging.Logger,
@@ -44,6 +47,24 @@ def add_service_info(
     return event_dict
 
 
+# Campos de texto livre truncados apenas quando o evento é de fato renderizado
+_TRUNCATED_KEYS = ("user_text", "ai_text")
+_TRUNCATE_LEN = 100
+
+
+def truncate_texts(
+    logger: logging.Logger,
+    method_name: str,
+    event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Trunca textos de conversa longos (user_text, ai_text)."""
+    for key in _TRUNCATED_KEYS:
+        value = event_dict.get(key)
+        if value and len(value) > _TRUNCATE_LEN:
+            event_dict[key] = value[:_TRUNCATE_LEN]
+    return event_dict
+
+
 def extract_from_record(
     logger: logging.Logger,
     method_name: str,
@@ -59,6 +80,21 @@ def extract_from_record(
     return event_dict
 
 
+# Bibliotecas verbosas: records abaixo de WARNING são descartados
+_NOISY_LOGGERS = ("websockets", "asyncio", "httpx")
+_NOISY_PREFIXES = tuple(f"{name}." for name in _NOISY_LOGGERS)
+
+
+class _NoiseFilter(logging.Filter):
+    """Descarta records de bibliotecas verbosas abaixo de WARNING."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not (
+            record.levelno < logging.WARNING
+            and (record.name in _NOISY_LOGGERS or record.name.startswith(_NOISY_PREFIXES))
+        )
+
+
 def configure_logging(
     log_level: str = "INFO",
     log_dir: Optional[str] = None,
@@ -77,51 +113,60 @@ def configure_logging(
         backup_count: Número de backups a manter
     """
     
-    # Processors para structlog
+    level = getattr(logging, log_level.upper())
+    
+    # Processors comuns a eventos structlog e a records do logging padrão
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_logger_name,
         structlog.processors.add_log_level,
         add_timestamp,
         add_service_info,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        truncate_texts,
     ]
     
-    if json_format:
-        # Formato JSON para produção
-        shared_processors.append(structlog.processors.JSONRenderer())
-    else:
-        # Formato legível para desenvolvimento
-        shared_processors.append(structlog.dev.ConsoleRenderer(colors=True))
-    
-    # Configurar structlog
+    # Configurar structlog: eventos seguem para o logging padrão e são
+    # renderizados uma única vez pelo ProcessorFormatter do handler
     structlog.configure(
-        processors=shared_processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper())
-        ),
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
+            structlog.processors.StackInfoRenderer(),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
     
-    # Configurar logging padrão para bibliotecas
+    def _build_formatter(as_json: bool) -> structlog.stdlib.ProcessorFormatter:
+        if as_json:
+            # Formato JSON para produção
+            renderer: Processor = structlog.processors.JSONRenderer(serializer=json_codec.dumps)
+        else:
+            # Formato legível para desenvolvimento
+            renderer = structlog.dev.ConsoleRenderer(colors=True)
+        return structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=shared_processors,
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.format_exc_info,
+                renderer,
+            ],
+        )
+    
+    # Configurar logging padrão (bibliotecas + structlog)
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
+    
+    noise_filter = _NoiseFilter()
     
     # Handler para stdout
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    
-    if json_format:
-        console_handler.setFormatter(
-            logging.Formatter('{"time": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s"}')
-        )
-    else:
-        console_handler.setFormatter(
-            logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
-        )
-    
+    console_handler.setLevel(level)
+    console_handler.setFormatter(_build_formatter(json_format))
+    console_handler.addFilter(noise_filter)
     root_logger.addHandler(console_handler)
     
     # Handler para arquivo (com rotation)
@@ -134,16 +179,14 @@ def configure_logging(
             maxBytes=max_bytes,
             backupCount=backup_count
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(
-            logging.Formatter('{"time": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s"}')
-        )
+        file_handler.setLevel(level)
+        file_handler.setFormatter(_build_formatter(True))
+        file_handler.addFilter(noise_filter)
         root_logger.addHandler(file_handler)
     
     # Silenciar logs verbose de bibliotecas
-    logging.getLogger("websockets").setLevel(logging.WARNING)
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 
 def get_logger(name: str = __name__) -> structlog.stdlib.BoundLogger:
@@ -177,7 +220,8 @@ class SessionLogger:
         self.domain_uuid = domain_uuid
         self.secretary_name = secretary_name
         self._logger = structlog.get_logger()
-        self._start_time = datetime.now()
+        # monotonic: imune a ajustes de NTP durante chamadas longas
+        self._start_ns = time.monotonic_ns()
     
     def __enter__(self) -> 'SessionLogger':
         structlog.contextvars.clear_contextvars()
@@ -190,7 +234,7 @@ class SessionLogger:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self._start_time).total_seconds()
+        duration = (time.monotonic_ns() - self._start_ns) / 1e9
         self.info("Session context ended", duration_seconds=duration)
         structlog.contextvars.clear_contextvars()
     
@@ -240,8 +284,8 @@ class SessionLogger:
         self._logger.info(
             f"Turn {turn_number}",
             turn_number=turn_number,
-            user_text=user_text[:100] if user_text else None,
-            ai_text=ai_text[:100] if ai_text else None,
+            user_text=user_text,
+            ai_text=ai_text,
             latency_ms=latency_ms
         )
     
@@ -45,11 +45,14 @@ class ProviderEventType(Enum):
     SESSION_ENDED = "session_ended"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderEvent:
     """
     Evento emitido por um provider realtime.
     Estrutura unificada para todos os providers.
+    
+    slots=True: dezenas de eventos/s por chamada (AUDIO_DELTA) sem __dict__
+    por instância.
     """
     
     type: ProviderEventType
@@ -131,6 +134,10 @@ class RealtimeConfig:
     # - "g711_alaw" or "pcma": G.711 A-law
     # G.711 μ-law nativo - requer mod_audio_stream NETPLAY FORK
     audio_format: str = "g711_ulaw"  # G.711 μ-law (menor latência)
+    
+    # Coalescência de frames de entrada: acumula até N ms de áudio por mensagem
+    # WebSocket (menos send()/frames). 0 = envia cada frame imediatamente.
+    audio_coalesce_ms: int = 60
 
 
 class BaseRealtimeProvider(ABC):
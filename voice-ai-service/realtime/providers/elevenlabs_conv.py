@@ -48,6 +48,7 @@ import asyncio
 import base64
 import json
 import logging
+import time
 from typing import Any, AsyncIterator, Dict, Optional
 
 import websockets
@@ -59,6 +60,7 @@ from .base import (
     ProviderEventType,
     RealtimeConfig,
 )
+from ..utils import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +125,16 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         self._receive_task: Optional[asyncio.Task] = None
         self._event_queue: asyncio.Queue[ProviderEvent] = asyncio.Queue()
         
+        # Batching do áudio de entrada: acumula ~100ms (5 frames de 20ms) por
+        # user_audio_chunk em vez de 1 mensagem JSON/base64 por frame.
+        # audio_batch_ms=0 desabilita (envio imediato de cada frame).
+        audio_batch_ms = int(credentials.get("audio_batch_ms", 100) or 0)
+        self._audio_batch_s = audio_batch_ms / 1000.0
+        self._audio_batch_bytes = audio_batch_ms * 16000 * 2 // 1000  # PCM16 @ 16kHz
+        self._audio_buf = bytearray()
+        self._audio_last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+        
         # Sample rate de saída (atualizado dinamicamente pelo conversation_initiation_metadata)
         # IMPORTANTE: O ElevenLabs pode retornar áudio em 22050Hz ou 44100Hz, não apenas 16000Hz!
         self._actual_output_sample_rate = 16000  # Default, será atualizado no connect()
@@ -162,7 +174,7 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         
         # Aguardar conversation_initiation_metadata
         response = await asyncio.wait_for(self._ws.recv(), timeout=10)
-        event = json.loads(response)
+        event = json_codec.loads(response)
         
         if event.get("type") != "conversation_initiation_metadata":
             raise ConnectionError(f"Unexpected initial event: {event.get('type')}")
@@ -196,6 +208,8 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         
         self._connected = True
         self._receive_task = asyncio.create_task(self._receive_loop())
+        if self._audio_batch_bytes > 0:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         
         # Log explícito com sample rate para debug
         logger.info(
@@ -343,17 +357,48 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         Formato: base64 PCM16 @ 16kHz
         Ref: SDK oficial elevenlabs-python/conversation.py
         IMPORTANTE: NÃO incluir "type" - apenas {"user_audio_chunk": "base64..."}
+        
+        Os frames são acumulados em lotes de ~audio_batch_ms antes do envio
+        (ver flush()).
         """
         if not self._ws:
             raise RuntimeError("Not connected")
         
-        audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
+        self._audio_buf.extend(audio_bytes)
+        if (
+            len(self._audio_buf) >= self._audio_batch_bytes
+            or time.monotonic() - self._audio_last_flush >= self._audio_batch_s
+        ):
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """Envia o áudio acumulado (se houver) como um único user_audio_chunk."""
+        if not self._audio_buf or not self._ws:
+            return
+        
+        audio_b64 = base64.b64encode(self._audio_buf).decode("utf-8")
+        self._audio_buf.clear()
+        self._audio_last_flush = time.monotonic()
         
         # SDK oficial NÃO inclui "type" no payload de áudio!
         await self._ws.send(json.dumps({
             "user_audio_chunk": audio_b64,
         }))
     
+    async def _flush_loop(self) -> None:
+        """Garante que áudio residual não fique retido mais que audio_batch_ms."""
+        try:
+            while self._connected:
+                await asyncio.sleep(self._audio_batch_s)
+                if time.monotonic() - self._audio_last_flush >= self._audio_batch_s:
+                    await self.flush()
+        except asyncio.CancelledError:
+            pass
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.warning(f"Audio flush loop error: {e}")
+    
     async def send_text(self, text: str) -> None:
         """
         Envia texto para ElevenLabs.
@@ -382,6 +427,7 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         Ref: https://elevenlabs.io/docs/agents-platform/api-reference/agents-platform/websocket
         """
         if self._ws:
+            await self.flush()
             await self._ws.send(json.dumps({
                 "type": "user_activity",
             }))
@@ -427,7 +473,9 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         
         try:
             async for message in self._ws:
-                event = json.loads(message)
+                # orjson (quando disponível): parse em C, bem mais rápido que json
+                # para o fluxo contínuo de eventos "audio" (~50/s)
+                event = json_codec.loads(message)
                 
                 # Responder ping com pong IMEDIATAMENTE para manter conexão ativa
                 # Ref: SDK oficial elevenlabs-python/conversation.py - ping_ms é só para medir latência
@@ -612,6 +660,20 @@ class ElevenLabsConversationalProvider(BaseRealtimeProvider):
         """Encerra conexão."""
         self._connected = False
         
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        if self._ws:
+            try:
+                await self.flush()
+            except websockets.exceptions.ConnectionClosed:
+                pass
+        
         if self._receive_task:
             self._receive_task.cancel()
             try:
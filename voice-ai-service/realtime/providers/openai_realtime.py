@@ -130,11 +130,12 @@ Ref: Context7 /websites/platform_openai - session.update, realtime-vad
 """
 
 import asyncio
-import base64
+import binascii
 import json
 import logging
 import time
-from typing import Any, AsyncIterator, Dict, List, Optional
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 
 import websockets
 from websockets.asyncio.client import ClientConnection
@@ -147,9 +148,54 @@ from .base import (
 )
 from ..config.prompts import get_enhanced_prompt
 from ..tools import get_openai_tools_with_defaults
+from ..utils import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Envelope pré-montado de input_audio_buffer.append (caminho mais quente de saída):
+# evita dict + serialização JSON por frame; base64 é ASCII puro, sem escapes.
+_AUDIO_APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_SUFFIX = b'"}'
+
+# Mensagens constantes pré-serializadas
+_MSG_RESPONSE_CREATE = '{"type":"response.create"}'
+_MSG_RESPONSE_CANCEL = '{"type":"response.cancel"}'
+_MSG_AUDIO_COMMIT = '{"type":"input_audio_buffer.commit"}'
+
+# Eventos conhecidos sem handler (confirmações/metadados): ignorados sem log.
+# COMPATIBILIDADE: inclui formatos antigos e novos (GA 2026)
+_KNOWN_UNHANDLED_EVENTS = frozenset({
+    # Transcrição do usuário (STT)
+    "conversation.item.input_audio_transcription.delta",  # Novo em 2026
+    # Response lifecycle
+    "response.content_part.added", "response.content_part.done",
+    "response.output_item.added", "response.output_item.done",
+    # Text output (se modality text habilitada)
+    "response.text.delta", "response.text.done",
+    # Function calls
+    "response.function_call_arguments.delta",
+    # Session
+    "session.created",
+    # Buffers
+    "input_audio_buffer.committed", "input_audio_buffer.cleared",
+    # Conversation items lifecycle
+    "conversation.item.created", "conversation.item.truncated",
+    "conversation.item.done",  # Item concluído (formato GA 2026)
+    # Rate limits (info, não erro)
+    "rate_limits.updated",
+})
+
+# Limite da fila de saída (mensagens aguardando o writer)
+_OUT_QUEUE_MAX = 512
+
+# Prazo para o writer escoar a fila de saída no disconnect() antes de ser
+# cancelado (mensagens enfileiradas logo antes de um transfer/hangup)
+_WRITER_DRAIN_TIMEOUT_S = 2.0
+
+# Limite da fila de eventos: cheia, descarta o AUDIO_DELTA mais antigo
+# (o playout downstream tolera perda) ou aplica backpressure ao WebSocket
+_EVENT_QUEUE_MAX = 256
+
 
 # Tools padrão conforme design.md Decision 7
 # NOTA: Todos os tools devem ter "required" (mesmo que vazio) conforme Context7
@@ -257,12 +303,25 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         
         self._ws: Optional[ClientConnection] = None
         self._receive_task: Optional[asyncio.Task] = None
-        self._event_queue: asyncio.Queue[ProviderEvent] = asyncio.Queue()
+        # Escritor único: todas as mensagens saem por _out_queue na ordem de
+        # envio; put() só aguarda com a fila cheia (backpressure explícito).
+        # None encerra o writer após as mensagens anteriores (disconnect)
+        self._out_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=_OUT_QUEUE_MAX)
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_error: Optional[Exception] = None
+        # deque + Event em vez de asyncio.Queue: append/popleft O(1) sem
+        # criar um Future por put/get (produtor e consumidor únicos)
+        self._event_deque: Deque[ProviderEvent] = deque()
+        self._event_waker = asyncio.Event()
+        self._event_space = asyncio.Event()  # Setado quando há espaço na fila
+        self._event_space.set()
+        self._dropped_audio_events = 0
         self._session_id: Optional[str] = None
         
         # Tracking de tempo de sessão (limite OpenAI: 60 minutos)
         self._session_start_time: Optional[float] = None
         self._max_session_duration_seconds: int = 55 * 60  # 55 min (5 min de margem)
+        self._session_expiry_timer: Optional[asyncio.TimerHandle] = None
         self._response_active: bool = False
         
         # Contadores para agregação de logs de áudio (reduzir ruído)
@@ -272,6 +331,15 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         self._audio_bytes_received: int = 0
         self._last_audio_log_time: float = 0.0
         self._AUDIO_LOG_INTERVAL: float = 5.0  # Logar a cada 5 segundos
+        
+        # Coalescência de áudio de entrada (ver RealtimeConfig.audio_coalesce_ms)
+        coalesce_ms = max(0, int(getattr(config, "audio_coalesce_ms", 0) or 0))
+        bytes_per_sample = 1 if self.input_sample_rate == 8000 else 2  # G.711 vs PCM16
+        self._audio_coalesce_s: float = coalesce_ms / 1000.0
+        self._audio_coalesce_target: int = self.input_sample_rate * bytes_per_sample * coalesce_ms // 1000
+        self._audio_coalesce_buf = bytearray()
+        self._audio_coalesce_deadline: Optional[asyncio.TimerHandle] = None
+        self._audio_flush_task: Optional[asyncio.Task] = None
     
     @property
     def name(self) -> str:
@@ -334,15 +402,24 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         
         # Aguardar session.created
         response = await asyncio.wait_for(self._ws.recv(), timeout=10)
-        event = json.loads(response)
+        event = json_codec.loads(response)
         
         if event.get("type") != "session.created":
             raise ConnectionError(f"Unexpected initial event: {event.get('type')}")
         
         self._session_id = event.get("session", {}).get("id")
         self._connected = True
-        self._session_start_time = time.time()  # Registrar início da sessão
+        # Relógio monotônico: o mesmo do timer de expiração (imune a NTP)
+        self._session_start_time = time.monotonic()
         self._receive_task = asyncio.create_task(self._receive_loop())
+        self._writer_error = None
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        
+        # Acordar receive_events quando a sessão estiver a 60s do limite,
+        # em vez de re-checar por timeout a cada segundo
+        self._session_expiry_timer = asyncio.get_running_loop().call_later(
+            max(0, self._max_session_duration_seconds - 60), self._on_session_expiry_timer
+        )
         
         logger.info("Connected to OpenAI Realtime", extra={
             "domain_uuid": self.config.domain_uuid,
@@ -509,7 +586,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
             })
             
             try:
-                await self._ws.send(json.dumps(audio_config))
+                await self._send(json_codec.dumps(audio_config))
                 logger.debug(f"session.update #1 payload: {json.dumps(audio_config)[:1500]}")
             except Exception as e:
                 logger.error(f"Failed to send session.update #1: {e}")
@@ -536,7 +613,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
             })
             
             try:
-                await self._ws.send(json.dumps(tools_config))
+                await self._send(json_codec.dumps(tools_config))
                 logger.debug(f"session.update #2 payload: {json.dumps(tools_config)[:1500]}")
                 logger.info(f"session.update sent successfully ({format_label} format)", extra={
                     "tools_count": len(tools),
@@ -599,7 +676,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
             logger.debug(f"session.update payload: {json.dumps(session_config, indent=2)[:2000]}")
             
             try:
-                await self._ws.send(json.dumps(session_config))
+                await self._send(json_codec.dumps(session_config))
                 logger.info(f"session.update sent successfully ({format_label} format)", extra={
                     "tools_count": len(tools),
                 })
@@ -694,19 +771,22 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         
         Formato: base64 PCM16 @ 24kHz
         Ref: input_audio_buffer.append event (SDK oficial)
+        
+        Frames são coalescidos até audio_coalesce_ms em um único
+        input_audio_buffer.append (flush por tamanho ou por deadline).
         """
         if not self._ws:
             raise RuntimeError("Not connected")
         
-        audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
-        
-        await self._ws.send(json.dumps({
-            "type": "input_audio_buffer.append",
-            "audio": audio_b64
-        }))
+        self._audio_coalesce_buf.extend(audio_bytes)
+        if len(self._audio_coalesce_buf) >= self._audio_coalesce_target:
+            await self._flush_audio()
+        elif self._audio_coalesce_deadline is None:
+            self._audio_coalesce_deadline = asyncio.get_running_loop().call_later(
+                self._audio_coalesce_s, self._on_audio_coalesce_deadline
+            )
         
         # Agregação de logs - logar resumo a cada N segundos em vez de cada chunk
-        import time
         self._audio_chunks_sent += 1
         self._audio_bytes_sent += len(audio_bytes)
         
@@ -723,15 +803,95 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
             self._audio_chunks_sent = 0
             self._audio_bytes_sent = 0
             self._last_audio_log_time = now
+    
+    async def _send(self, message: str) -> None:
+        """Enfileira mensagem para o writer (re-levanta o erro do writer, se houver)."""
+        if self._writer_error is not None:
+            raise self._writer_error
+        await self._out_queue.put(message)
+    
+    async def _writer_loop(self) -> None:
+        """Único escritor do WebSocket: drena _out_queue em ordem até None."""
+        ws = self._ws
+        queue = self._out_queue
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    return
+                await ws.send(message)
+        except websockets.exceptions.ConnectionClosed as e:
+            # O receive loop já sinaliza SESSION_ENDED
+            self._writer_error = e
+            logger.debug(f"OpenAI writer stopped, WebSocket closed: {e}", extra={
+                "domain_uuid": self.config.domain_uuid,
+            })
+        except Exception as e:
+            self._writer_error = e
+            logger.error(f"OpenAI writer loop error: {e}", extra={
+                "domain_uuid": self.config.domain_uuid,
+            })
+    
+    async def _stop_writer(self) -> None:
+        """Enfileira o sentinela de parada e aguarda o writer escoar a fila."""
+        writer = self._writer_task
+        if not writer.done():
+            await self._out_queue.put(None)
+        await writer
+    
+    def _on_audio_coalesce_deadline(self) -> None:
+        """Deadline de coalescência atingido: envia o que estiver acumulado."""
+        self._audio_coalesce_deadline = None
+        if not self._audio_coalesce_buf or not self._ws:
+            return
+        task = self._audio_flush_task
+        if task is not None and not task.done():
+            # Flush anterior ainda aguarda espaço na fila: tenta de novo depois
+            self._audio_coalesce_deadline = asyncio.get_running_loop().call_later(
+                self._audio_coalesce_s, self._on_audio_coalesce_deadline
+            )
+            return
+        self._audio_flush_task = asyncio.create_task(self._flush_audio_on_deadline())
+    
+    async def _flush_audio(self) -> None:
+        """Envia o áudio coalescido como um único input_audio_buffer.append."""
+        if self._audio_coalesce_deadline is not None:
+            self._audio_coalesce_deadline.cancel()
+            self._audio_coalesce_deadline = None
+        if not self._audio_coalesce_buf or not self._ws:
+            return
+        
+        # Frame de TEXTO (str): a API não aceita frames binários
+        frame = b"".join((
+            _AUDIO_APPEND_PREFIX,
+            binascii.b2a_base64(self._audio_coalesce_buf, newline=False),
+            _AUDIO_APPEND_SUFFIX,
+        ))
+        self._audio_coalesce_buf.clear()
+        await self._send(frame.decode("ascii"))
+    
+    async def _flush_audio_on_deadline(self) -> None:
+        try:
+            await self._flush_audio()
+        except websockets.exceptions.ConnectionClosed as e:
+            # O receive loop já sinaliza SESSION_ENDED
+            logger.debug(f"Audio flush skipped, WebSocket closed: {e}", extra={
+                "domain_uuid": self.config.domain_uuid,
+            })
+        except Exception as e:
+            # Task sem await: o erro precisa ser logado aqui
+            logger.error(f"Audio flush on deadline failed: {e}", extra={
+                "domain_uuid": self.config.domain_uuid,
+            })
 
     async def commit_audio_buffer(self) -> None:
         """Commit manual do buffer de áudio (necessário quando VAD está desabilitado)."""
         if not self._ws:
             raise RuntimeError("Not connected")
 
-        await self._ws.send(json.dumps({
-            "type": "input_audio_buffer.commit"
-        }))
+        # Áudio coalescido pendente precisa entrar no buffer antes do commit
+        await self._flush_audio()
+        await self._send(_MSG_AUDIO_COMMIT)
         logger.debug("Audio buffer committed", extra={
             "domain_uuid": self.config.domain_uuid,
         })
@@ -741,7 +901,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         if not self._ws:
             raise RuntimeError("Not connected")
         if not self._response_active:
-            await self._ws.send(json.dumps({"type": "response.create"}))
+            await self._send(_MSG_RESPONSE_CREATE)
             logger.debug("Response requested from OpenAI", extra={
                 "domain_uuid": self.config.domain_uuid,
             })
@@ -766,7 +926,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         if not self._ws:
             raise RuntimeError("Not connected")
         
-        await self._ws.send(json.dumps({
+        await self._send(json_codec.dumps({
             "type": "conversation.item.create",
             "item": {
                 "type": "message",
@@ -782,7 +942,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         # Solicitar resposta do modelo (gera áudio TTS)
         if request_response:
             if not self._response_active:
-                await self._ws.send(json.dumps({"type": "response.create"}))
+                await self._send(_MSG_RESPONSE_CREATE)
                 logger.debug("Response requested from OpenAI", extra={
                     "domain_uuid": self.config.domain_uuid,
                 })
@@ -808,7 +968,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         if not self._ws:
             raise RuntimeError("Not connected")
         
-        await self._ws.send(json.dumps({
+        await self._send(json_codec.dumps({
             "type": "conversation.item.create",
             "item": {
                 "type": "message",
@@ -848,7 +1008,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         # Usar response.create com instructions claras
         # O instructions sobrescreve as instruções da sessão APENAS para esta resposta
         # Isso faz a IA responder com o texto especificado
-        await self._ws.send(json.dumps({
+        await self._send(json_codec.dumps({
             "type": "response.create",
             "response": {
                 "instructions": (
@@ -871,7 +1031,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         Ref: response.cancel event (SDK oficial)
         """
         if self._ws and self._response_active:
-            await self._ws.send(json.dumps({"type": "response.cancel"}))
+            await self._send(_MSG_RESPONSE_CANCEL)
             logger.debug("Interrupt signal sent to OpenAI", extra={
                 "domain_uuid": self.config.domain_uuid,
             })
@@ -905,12 +1065,12 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         if not self._ws:
             raise RuntimeError("Not connected")
         
-        await self._ws.send(json.dumps({
+        await self._send(json_codec.dumps({
             "type": "conversation.item.create",
             "item": {
                 "type": "function_call_output",
                 "call_id": call_id or "",
-                "output": json.dumps(result)
+                "output": json_codec.dumps(result)
             }
         }))
         
@@ -918,7 +1078,7 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         # APENAS se request_response=True (default) E não há resposta ativa
         if request_response:
             if not self._response_active:
-                await self._ws.send(json.dumps({"type": "response.create"}))
+                await self._send(_MSG_RESPONSE_CREATE)
                 logger.debug(f"Response requested after function: {function_name}", extra={
                     "domain_uuid": self.config.domain_uuid,
                     "call_id": call_id,
@@ -954,10 +1114,23 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         if not self._session_start_time:
             return None
         
-        elapsed = time.time() - self._session_start_time
+        elapsed = time.monotonic() - self._session_start_time
         remaining = self._max_session_duration_seconds - elapsed
         return max(0, int(remaining))
     
+    def _on_session_expiry_timer(self) -> None:
+        """Acorda receive_events perto do limite; cedo demais, rearma pelo restante."""
+        self._session_expiry_timer = None
+        if not self._connected:
+            return
+        remaining = self.get_session_remaining_seconds()
+        if remaining is not None and remaining >= 60:
+            self._session_expiry_timer = asyncio.get_running_loop().call_later(
+                remaining - 59, self._on_session_expiry_timer
+            )
+            return
+        self._event_waker.set()
+    
     def is_session_expiring_soon(self, threshold_seconds: int = 300) -> bool:
         """
         Verifica se sessão está perto de expirar.
@@ -1000,12 +1173,17 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
                     )
                     break
                 
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
+                if not self._event_deque:
+                    # Acordado por novo evento, disconnect() ou timer de expiração
+                    self._event_waker.clear()
+                    await self._event_waker.wait()
+                    continue
+                
+                event = self._event_deque.popleft()
+                self._event_space.set()
                 yield event
                 if event.type in (ProviderEventType.SESSION_ENDED, ProviderEventType.ERROR):
                     break
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
     
@@ -1014,17 +1192,25 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         if not self._ws:
             return
         
+        ws = self._ws
         try:
-            async for message in self._ws:
-                event = json.loads(message)
+            while True:
+                # decode=False: frames de texto chegam como bytes, sem a
+                # validação/decodificação UTF-8 em Python; o parser JSON
+                # (orjson) valida UTF-8 internamente
+                message = await ws.recv(decode=False)
+                event = json_codec.loads(message)
                 provider_event = self._parse_event(event)
                 if provider_event:
-                    await self._event_queue.put(provider_event)
+                    await self._enqueue_event(provider_event)
+        except websockets.exceptions.ConnectionClosedOK:
+            # Fechamento normal: mesmo comportamento do antigo `async for`
+            pass
         except websockets.exceptions.ConnectionClosed as e:
             logger.info(f"OpenAI WebSocket closed: {e}", extra={
                 "domain_uuid": self.config.domain_uuid,
             })
-            await self._event_queue.put(ProviderEvent(
+            self._push_event(ProviderEvent(
                 type=ProviderEventType.SESSION_ENDED,
                 data={"reason": str(e)}
             ))
@@ -1032,15 +1218,62 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
             logger.error(f"OpenAI receive loop error: {e}", extra={
                 "domain_uuid": self.config.domain_uuid,
             })
-            await self._event_queue.put(ProviderEvent(
+            self._push_event(ProviderEvent(
                 type=ProviderEventType.ERROR,
                 data={"error": str(e)}
             ))
     
+    async def _enqueue_event(self, event: ProviderEvent) -> None:
+        """
+        Enfileira evento respeitando _EVENT_QUEUE_MAX.
+        
+        Fila cheia: AUDIO_DELTA descarta o áudio mais antigo; demais eventos
+        aguardam espaço (backpressure: para de ler o WebSocket).
+        """
+        if len(self._event_deque) >= _EVENT_QUEUE_MAX:
+            if not (
+                event.type is ProviderEventType.AUDIO_DELTA
+                and self._drop_oldest_audio_event()
+            ):
+                while len(self._event_deque) >= _EVENT_QUEUE_MAX and self._connected:
+                    self._event_space.clear()
+                    await self._event_space.wait()
+        
+        self._push_event(event)
+    
+    def _drop_oldest_audio_event(self) -> bool:
+        """Remove o AUDIO_DELTA mais antigo da fila. Retorna False se não houver."""
+        for index, queued in enumerate(self._event_deque):
+            if queued.type is ProviderEventType.AUDIO_DELTA:
+                del self._event_deque[index]
+                self._dropped_audio_events += 1
+                if self._dropped_audio_events % 100 == 1:
+                    logger.warning("OpenAI event queue full, dropping audio", extra={
+                        "domain_uuid": self.config.domain_uuid,
+                        "dropped_audio_events": self._dropped_audio_events,
+                    })
+                return True
+        return False
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Estatísticas da fila de eventos (para alertas operacionais)."""
+        return {
+            "queued_events": len(self._event_deque),
+            "dropped_audio_events": self._dropped_audio_events,
+        }
+    
+    def _push_event(self, event: ProviderEvent) -> None:
+        """Enfileira evento para receive_events e acorda o consumidor."""
+        self._event_deque.append(event)
+        self._event_waker.set()
+    
     def _parse_event(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
         """
         Converte evento OpenAI para ProviderEvent.
         
+        Despacho por dict (_EVENT_HANDLERS): um único lookup por evento em vez
+        de uma cadeia de comparações de string.
+        
         IMPORTANTE - Nomes de eventos conforme documentação oficial (Jan/2026):
         - response.output_audio.delta (NÃO response.audio.delta!)
         - response.output_audio.done
@@ -1049,247 +1282,275 @@ class OpenAIRealtimeProvider(BaseRealtimeProvider):
         """
         etype = event.get("type", "")
         
-        # Log para debug de eventos desconhecidos
-        # COMPATIBILIDADE: Inclui formatos antigos (response.audio.*) e novos (response.output_audio.*)
-        KNOWN_EVENTS = {
-            # Áudio (formatos antigo e novo)
-            "response.audio.delta", "response.output_audio.delta",
-            "response.audio.done", "response.output_audio.done",
-            # Transcrição do assistente (formatos antigo e novo)
-            "response.audio_transcript.delta", "response.audio_transcript.done",
-            "response.output_audio_transcript.delta", "response.output_audio_transcript.done",  # Formato GA 2026
-            # Transcrição do usuário (STT)
-            "conversation.item.input_audio_transcription.completed",
-            "conversation.item.input_audio_transcription.failed",
-            "conversation.item.input_audio_transcription.delta",  # Novo em 2026
-            # VAD
-            "input_audio_buffer.speech_started", "input_audio_buffer.speech_stopped",
-            # Response lifecycle
-            "response.created", "response.done",
-            "response.content_part.added", "response.content_part.done",
-            "response.output_item.added", "response.output_item.done",
-            # Text output (se modality text habilitada)
-            "response.text.delta", "response.text.done",
-            # Function calls
-            "response.function_call_arguments.delta", "response.function_call_arguments.done",
-            # Session
-            "session.created", "session.updated",
-            # Buffers
-            "input_audio_buffer.committed", "input_audio_buffer.cleared",
-            # Conversation items lifecycle
-            "conversation.item.created", "conversation.item.truncated",
-            "conversation.item.done",  # Item concluído (formato GA 2026)
-            # Rate limits (info, não erro)
-            "rate_limits.updated",
-            # Errors
-            "error",
-        }
+        handler = self._EVENT_HANDLERS.get(etype)
+        if handler is not None:
+            return handler(self, event)
         
-        if etype not in KNOWN_EVENTS:
+        # Log para debug de eventos desconhecidos
+        if etype not in _KNOWN_UNHANDLED_EVENTS:
             logger.debug(f"OpenAI event received: {etype}", extra={
                 "domain_uuid": self.config.domain_uuid,
                 "event_data_preview": str(event)[:200],
             })
         
-        # ===== ÁUDIO OUTPUT =====
-        # COMPATIBILIDADE: API pode retornar response.audio.delta OU response.output_audio.delta
-        # dependendo da versão/modelo. Suportamos ambos.
-        if etype in ("response.audio.delta", "response.output_audio.delta"):
-            audio_b64 = event.get("delta", "")
-            audio_bytes = base64.b64decode(audio_b64) if audio_b64 else b""
-            
-            # Agregação de logs - contar chunks, logar apenas no primeiro
-            self._audio_chunks_received += 1
-            self._audio_bytes_received += len(audio_bytes)
-            
-            # Log apenas no primeiro chunk de cada resposta
-            if self._audio_chunks_received == 1:
-                logger.info(
-                    f"🔊 [OPENAI] First audio chunk: {len(audio_bytes)}B",
-                    extra={"domain_uuid": self.config.domain_uuid}
-                )
-            
-            return ProviderEvent(
-                type=ProviderEventType.AUDIO_DELTA,
-                data={"audio": audio_bytes},
-                response_id=event.get("response_id"),
-                item_id=event.get("item_id"),
-            )
-        
-        # COMPATIBILIDADE: Suporta ambos os formatos de audio.done
-        if etype in ("response.audio.done", "response.output_audio.done"):
-            # Log agregado do total de áudio recebido nesta resposta
+        return None
+    
+    # ===== ÁUDIO OUTPUT =====
+    # COMPATIBILIDADE: API pode retornar response.audio.* OU response.output_audio.*
+    # dependendo da versão/modelo. Suportamos ambos.
+    
+    def _handle_audio_delta(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        audio_b64 = event.get("delta", "")
+        # a2b_base64: decodificação direta em C, sem a camada de validação
+        # do base64.b64decode; o consumidor recebe bytes (dono do buffer)
+        audio_bytes = binascii.a2b_base64(audio_b64) if audio_b64 else b""
+        
+        # Agregação de logs - contar chunks, logar apenas no primeiro
+        self._audio_chunks_received += 1
+        self._audio_bytes_received += len(audio_bytes)
+        
+        # Log apenas no primeiro chunk de cada resposta
+        if self._audio_chunks_received == 1:
             logger.info(
-                f"🔊 [OPENAI] Audio complete: {self._audio_chunks_received} chunks, {self._audio_bytes_received}B",
-                extra={
-                    "domain_uuid": self.config.domain_uuid,
-                    "chunks": self._audio_chunks_received,
-                    "bytes": self._audio_bytes_received,
-                }
-            )
-            # Resetar contadores para próxima resposta
-            self._audio_chunks_received = 0
-            self._audio_bytes_received = 0
-            
-            return ProviderEvent(type=ProviderEventType.AUDIO_DONE, data={})
-        
-        # ===== TRANSCRIÇÃO DO ASSISTENTE =====
-        # COMPATIBILIDADE: Suporta formatos antigo (response.audio_transcript.*) 
-        # e novo GA (response.output_audio_transcript.*)
-        if etype in ("response.audio_transcript.delta", "response.output_audio_transcript.delta"):
-            return ProviderEvent(
-                type=ProviderEventType.TRANSCRIPT_DELTA,
-                data={"transcript": event.get("delta", "")}
-            )
-        
-        if etype in ("response.audio_transcript.done", "response.output_audio_transcript.done"):
-            return ProviderEvent(
-                type=ProviderEventType.TRANSCRIPT_DONE,
-                data={"transcript": event.get("transcript", "")}
+                f"🔊 [OPENAI] First audio chunk: {len(audio_bytes)}B",
+                extra={"domain_uuid": self.config.domain_uuid}
             )
         
-        # ===== TRANSCRIÇÃO DO USUÁRIO (STT) =====
-        if etype == "conversation.item.input_audio_transcription.completed":
-            transcript = event.get("transcript", "")
-            logger.debug(f"User transcript: {transcript[:50]}...", extra={
-                "domain_uuid": self.config.domain_uuid,
-            })
-            return ProviderEvent(
-                type=ProviderEventType.USER_TRANSCRIPT,
-                data={"transcript": transcript}
-            )
-        
-        if etype == "conversation.item.input_audio_transcription.failed":
-            logger.warning("User audio transcription failed", extra={
+        return ProviderEvent(
+            type=ProviderEventType.AUDIO_DELTA,
+            data={"audio": audio_bytes},
+            response_id=event.get("response_id"),
+            item_id=event.get("item_id"),
+        )
+    
+    def _handle_audio_done(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        # Log agregado do total de áudio recebido nesta resposta
+        logger.info(
+            f"🔊 [OPENAI] Audio complete: {self._audio_chunks_received} chunks, {self._audio_bytes_received}B",
+            extra={
                 "domain_uuid": self.config.domain_uuid,
-                "error": event.get("error"),
-            })
-            return None  # Não é erro crítico
+                "chunks": self._audio_chunks_received,
+                "bytes": self._audio_bytes_received,
+            }
+        )
+        # Resetar contadores para próxima resposta
+        self._audio_chunks_received = 0
+        self._audio_bytes_received = 0
         
-        # ===== VAD (Voice Activity Detection) =====
-        if etype == "input_audio_buffer.speech_started":
-            logger.debug("Speech started (VAD)", extra={
-                "domain_uuid": self.config.domain_uuid,
-            })
-            return ProviderEvent(type=ProviderEventType.SPEECH_STARTED, data={})
+        return ProviderEvent(type=ProviderEventType.AUDIO_DONE, data={})
+    
+    # ===== TRANSCRIÇÃO DO ASSISTENTE =====
+    # COMPATIBILIDADE: Suporta formatos antigo (response.audio_transcript.*) 
+    # e novo GA (response.output_audio_transcript.*)
+    
+    def _handle_transcript_delta(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        return ProviderEvent(
+            type=ProviderEventType.TRANSCRIPT_DELTA,
+            data={"transcript": event.get("delta", "")}
+        )
+    
+    def _handle_transcript_done(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        return ProviderEvent(
+            type=ProviderEventType.TRANSCRIPT_DONE,
+            data={"transcript": event.get("transcript", "")}
+        )
+    
+    # ===== TRANSCRIÇÃO DO USUÁRIO (STT) =====
+    
+    def _handle_user_transcript(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        transcript = event.get("transcript", "")
+        logger.debug(f"User transcript: {transcript[:50]}...", extra={
+            "domain_uuid": self.config.domain_uuid,
+        })
+        return ProviderEvent(
+            type=ProviderEventType.USER_TRANSCRIPT,
+            data={"transcript": transcript}
+        )
+    
+    def _handle_user_transcript_failed(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        logger.warning("User audio transcription failed", extra={
+            "domain_uuid": self.config.domain_uuid,
+            "error": event.get("error"),
+        })
+        return None  # Não é erro crítico
+    
+    # ===== VAD (Voice Activity Detection) =====
+    
+    def _handle_speech_started(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        logger.debug("Speech started (VAD)", extra={
+            "domain_uuid": self.config.domain_uuid,
+        })
+        return ProviderEvent(type=ProviderEventType.SPEECH_STARTED, data={})
+    
+    def _handle_speech_stopped(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        logger.debug("Speech stopped (VAD)", extra={
+            "domain_uuid": self.config.domain_uuid,
+        })
+        return ProviderEvent(type=ProviderEventType.SPEECH_STOPPED, data={})
+    
+    # ===== RESPONSE LIFECYCLE =====
+    
+    def _handle_response_created(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        self._response_active = True
+        logger.debug("Response started", extra={
+            "domain_uuid": self.config.domain_uuid,
+        })
+        return ProviderEvent(type=ProviderEventType.RESPONSE_STARTED, data={})
+    
+    def _handle_response_done(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        self._response_active = False
+        response = event.get("response", {})
+        status = response.get("status", "completed")
+        logger.debug(f"Response done: {status}", extra={
+            "domain_uuid": self.config.domain_uuid,
+            "status": status,
+        })
         
-        if etype == "input_audio_buffer.speech_stopped":
-            logger.debug("Speech stopped (VAD)", extra={
-                "domain_uuid": self.config.domain_uuid,
-            })
-            return ProviderEvent(type=ProviderEventType.SPEECH_STOPPED, data={})
+        # NOTA: Removida lógica de _pending_function_result que causava respostas duplicadas.
+        # Quando uma função é chamada durante uma resposta ativa, a OpenAI Realtime API
+        # já incorpora o resultado na resposta atual. Pedir nova resposta causava duplicação.
         
-        # ===== RESPONSE LIFECYCLE =====
-        if etype == "response.created":
-            self._response_active = True
-            logger.debug("Response started", extra={
-                "domain_uuid": self.config.domain_uuid,
-            })
-            return ProviderEvent(type=ProviderEventType.RESPONSE_STARTED, data={})
+        return ProviderEvent(
+            type=ProviderEventType.RESPONSE_DONE,
+            data={"status": status}
+        )
+    
+    # ===== FUNCTION CALLS =====
+    
+    def _handle_function_call(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        func_name = event.get("name", "")
+        try:
+            arguments = json_codec.loads(event.get("arguments", "{}"))
+        except json.JSONDecodeError:
+            arguments = {}
         
-        if etype == "response.done":
-            self._response_active = False
-            response = event.get("response", {})
-            status = response.get("status", "completed")
-            logger.debug(f"Response done: {status}", extra={
-                "domain_uuid": self.config.domain_uuid,
-                "status": status,
-            })
-            
-            # NOTA: Removida lógica de _pending_function_result que causava respostas duplicadas.
-            # Quando uma função é chamada durante uma resposta ativa, a OpenAI Realtime API
-            # já incorpora o resultado na resposta atual. Pedir nova resposta causava duplicação.
-            
-            return ProviderEvent(
-                type=ProviderEventType.RESPONSE_DONE,
-                data={"status": status}
-            )
+        logger.info(f"Function call: {func_name}", extra={
+            "domain_uuid": self.config.domain_uuid,
+            "call_id": event.get("call_id"),
+        })
         
-        # ===== FUNCTION CALLS =====
-        if etype == "response.function_call_arguments.done":
-            func_name = event.get("name", "")
-            try:
-                arguments = json.loads(event.get("arguments", "{}"))
-            except json.JSONDecodeError:
-                arguments = {}
-            
-            logger.info(f"Function call: {func_name}", extra={
+        return ProviderEvent(
+            type=ProviderEventType.FUNCTION_CALL,
+            data={
+                "function_name": func_name,
+                "arguments": arguments,
+                "call_id": event.get("call_id", ""),
+            }
+        )
+    
+    # ===== ERRORS =====
+    
+    def _handle_error(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        error = event.get("error", {})
+        error_code = error.get("code", "unknown")
+        error_message = error.get("message", "Unknown error")
+        
+        # Erros não-críticos (esperados em alguns fluxos)
+        non_critical_errors = [
+            "response_cancel_not_active",  # Tentar cancelar quando não há resposta
+            "conversation_already_has_active_response",  # Já tem resposta ativa
+        ]
+        
+        if error_code in non_critical_errors:
+            logger.warning(f"OpenAI non-critical: {error_code} - {error_message}", extra={
                 "domain_uuid": self.config.domain_uuid,
-                "call_id": event.get("call_id"),
             })
-            
-            return ProviderEvent(
-                type=ProviderEventType.FUNCTION_CALL,
-                data={
-                    "function_name": func_name,
-                    "arguments": arguments,
-                    "call_id": event.get("call_id", ""),
-                }
-            )
+            return None  # Ignorar, não é erro crítico
         
-        # ===== ERRORS =====
-        if etype == "error":
-            error = event.get("error", {})
-            error_code = error.get("code", "unknown")
-            error_message = error.get("message", "Unknown error")
-            
-            # Erros não-críticos (esperados em alguns fluxos)
-            non_critical_errors = [
-                "response_cancel_not_active",  # Tentar cancelar quando não há resposta
-                "conversation_already_has_active_response",  # Já tem resposta ativa
-            ]
-            
-            if error_code in non_critical_errors:
-                logger.warning(f"OpenAI non-critical: {error_code} - {error_message}", extra={
-                    "domain_uuid": self.config.domain_uuid,
-                })
-                return None  # Ignorar, não é erro crítico
-            
-            # Log detalhado do erro para debug
-            logger.error(f"OpenAI error: {error_code} - {error_message}", extra={
-                "domain_uuid": self.config.domain_uuid,
-                "error_type": error.get("type"),
-                "error_param": error.get("param"),
-                "full_error": json.dumps(error)[:500],
-            })
-            
-            if error_code == "rate_limit_exceeded":
-                return ProviderEvent(type=ProviderEventType.RATE_LIMITED, data={"error": error})
-            
-            return ProviderEvent(type=ProviderEventType.ERROR, data={"error": error})
+        # Log detalhado do erro para debug
+        logger.error(f"OpenAI error: {error_code} - {error_message}", extra={
+            "domain_uuid": self.config.domain_uuid,
+            "error_type": error.get("type"),
+            "error_param": error.get("param"),
+            "full_error": json.dumps(error)[:500],
+        })
         
-        # ===== SESSION UPDATED - CONFIRMAÇÃO DA CONFIGURAÇÃO =====
-        if etype == "session.updated":
-            session_data = event.get("session", {})
-            tools_count = len(session_data.get("tools", []))
-            tools_names = [t.get("name") for t in session_data.get("tools", [])]
-            
-            logger.info("OpenAI session.updated - configuration confirmed", extra={
-                "domain_uuid": self.config.domain_uuid,
-                "model": session_data.get("model"),
-                "voice": session_data.get("audio", {}).get("output", {}).get("voice"),
-                "tools_count": tools_count,
-                "tools_names": tools_names,
-                "has_turn_detection": session_data.get("audio", {}).get("input", {}).get("turn_detection") is not None,
-            })
-            return None
+        if error_code == "rate_limit_exceeded":
+            return ProviderEvent(type=ProviderEventType.RATE_LIMITED, data={"error": error})
         
-        # ===== SESSION/META EVENTS (confirmações, ignorar) =====
-        if etype in (
-            "session.created",
-            "input_audio_buffer.committed", "input_audio_buffer.cleared",
-            "conversation.item.created", "conversation.item.done",  # Item lifecycle
-            "response.content_part.added", "response.content_part.done",
-            "response.output_item.added", "response.output_item.done",
-            "rate_limits.updated",  # Info de rate limits (não é erro)
-        ):
-            return None  # Eventos de confirmação, não precisam de handling
+        return ProviderEvent(type=ProviderEventType.ERROR, data={"error": error})
+    
+    # ===== SESSION UPDATED - CONFIRMAÇÃO DA CONFIGURAÇÃO =====
+    
+    def _handle_session_updated(self, event: Dict[str, Any]) -> Optional[ProviderEvent]:
+        session_data = event.get("session", {})
+        tools_count = len(session_data.get("tools", []))
+        tools_names = [t.get("name") for t in session_data.get("tools", [])]
         
+        logger.info("OpenAI session.updated - configuration confirmed", extra={
+            "domain_uuid": self.config.domain_uuid,
+            "model": session_data.get("model"),
+            "voice": session_data.get("audio", {}).get("output", {}).get("voice"),
+            "tools_count": tools_count,
+            "tools_names": tools_names,
+            "has_turn_detection": session_data.get("audio", {}).get("input", {}).get("turn_detection") is not None,
+        })
         return None
     
+    # Tabela de despacho de _parse_event (tipo de evento → handler)
+    _EVENT_HANDLERS = {
+        "response.audio.delta": _handle_audio_delta,
+        "response.output_audio.delta": _handle_audio_delta,
+        "response.audio.done": _handle_audio_done,
+        "response.output_audio.done": _handle_audio_done,
+        "response.audio_transcript.delta": _handle_transcript_delta,
+        "response.output_audio_transcript.delta": _handle_transcript_delta,
+        "response.audio_transcript.done": _handle_transcript_done,
+        "response.output_audio_transcript.done": _handle_transcript_done,
+        "conversation.item.input_audio_transcription.completed": _handle_user_transcript,
+        "conversation.item.input_audio_transcription.failed": _handle_user_transcript_failed,
+        "input_audio_buffer.speech_started": _handle_speech_started,
+        "input_audio_buffer.speech_stopped": _handle_speech_stopped,
+        "response.created": _handle_response_created,
+        "response.done": _handle_response_done,
+        "response.function_call_arguments.done": _handle_function_call,
+        "error": _handle_error,
+        "session.updated": _handle_session_updated,
+    }
+    
     async def disconnect(self) -> None:
         """Encerra conexão."""
         self._connected = False
+        self._event_waker.set()  # Libera receive_events
+        self._event_space.set()  # Libera _receive_loop em backpressure
+        
+        if self._session_expiry_timer is not None:
+            self._session_expiry_timer.cancel()
+            self._session_expiry_timer = None
+        
+        if self._audio_coalesce_deadline is not None:
+            self._audio_coalesce_deadline.cancel()
+            self._audio_coalesce_deadline = None
+        self._audio_coalesce_buf.clear()
+        
+        if self._audio_flush_task is not None:
+            self._audio_flush_task.cancel()
+            try:
+                await self._audio_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._audio_flush_task = None
+        
+        if self._writer_task:
+            # Escoa o que já foi enfileirado (ex.: function output antes de
+            # um transfer); cancela só se o socket não escoar a tempo
+            try:
+                await asyncio.wait_for(self._stop_writer(), _WRITER_DRAIN_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                logger.warning("OpenAI writer did not drain in time, cancelling", extra={
+                    "domain_uuid": self.config.domain_uuid,
+                    "pending": self._out_queue.qsize(),
+                })
+                self._writer_task.cancel()
+                try:
+                    await self._writer_task
+                except asyncio.CancelledError:
+                    pass
+            self._writer_task = None
+        
+        # Descarta mensagens não enviadas (writer cancelado ou já encerrado)
+        while not self._out_queue.empty():
+            self._out_queue.get_nowait()
         
         if self._receive_task:
             self._receive_task.cancel()
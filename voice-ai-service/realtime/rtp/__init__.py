@@ -11,8 +11,15 @@
 # - RFC 3550: RTP Protocol
 # - openspec/changes/refactor-esl-rtp-bridge/
 
-from .protocol import RTPHeader, RTPPacket, RTPPacketBuilder, PayloadType
-from .bridge import RTPBridge, RTPBridgeConfig
+from .protocol import (
+    RTPHeader,
+    RTPPacket,
+    RTPFrame,
+    RTPPacketBuilder,
+    PayloadType,
+    parse_rtp_frame,
+)
+from .bridge import RTPBridge, RTPBridgeConfig, RTPBridgeMetrics
 from .jitter_buffer import JitterBuffer, JitterStats
 from .port_pool import PortPool, get_port_pool
 
@@ -20,11 +27,14 @@ __all__ = [
     # Protocol
     "RTPHeader",
     "RTPPacket",
+    "RTPFrame",
     "RTPPacketBuilder",
+    "parse_rtp_frame",
     "PayloadType",
     # Bridge
     "RTPBridge",
     "RTPBridgeConfig",
+    "RTPBridgeMetrics",
     # Jitter Buffer
     "JitterBuffer",
     "JitterStats",
@@ -12,20 +12,60 @@ Referências:
 - openspec/changes/refactor-esl-rtp-bridge/design.md
 """
 
+import asyncio
+import errno
 import logging
 import os
 import socket
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
-from .protocol import RTPPacket, RTPPacketBuilder, PayloadType
+from .protocol import RTPPacketBuilder, PayloadType, parse_rtp_frame
 from .jitter_buffer import JitterBuffer, JitterStats
 from .port_pool import get_port_pool
 
 logger = logging.getLogger(__name__)
 
+# Buffers de socket maiores absorvem rajadas de jitter sem descartar pacotes
+SOCKET_BUFFER_BYTES = 1 << 20  # 1MB
+
+# QoS do tráfego de voz: DSCP EF (46) no byte TOS e prioridade de fila
+# local (Linux); roteadores/switches com QoS priorizam os pacotes RTP
+RTP_IP_TOS = 0xB8
+RTP_SO_PRIORITY = 6
+
+# Tentativas de bind com outro par de portas quando a porta alocada está
+# ocupada por outro processo (o pool não sonda bind na alocação)
+BIND_RETRIES = 3
+
+# Buffer de recepção reutilizado (recvfrom_into): maior que qualquer pacote
+# RTP de voz; datagramas maiores são truncados pelo kernel
+RECV_BUFFER_BYTES = 2048
+
+# Máximo de datagramas lidos por evento de leitura antes de devolver o loop
+MAX_DATAGRAMS_PER_READ = 64
+
+
+@dataclass(slots=True)
+class RTPBridgeMetrics:
+    """Contadores do bridge (um objeto só, snapshot barato via copy())."""
+    packets_sent: int = 0
+    packets_received: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    last_recv_ns: int = 0  # time.monotonic_ns() do último pacote (0 = nunca)
+    
+    def copy(self) -> "RTPBridgeMetrics":
+        return RTPBridgeMetrics(
+            self.packets_sent,
+            self.packets_received,
+            self.bytes_sent,
+            self.bytes_received,
+            self.last_recv_ns,
+        )
+
 
 @dataclass
 class RTPBridgeConfig:
@@ -64,7 +104,10 @@ class RTPBridge:
         bridge.stop()
     
     Callbacks:
-    - on_audio_received(audio_bytes): Chamado quando áudio chega do FreeSWITCH
+    - on_audio_received(audio_bytes): Chamado quando áudio chega do FreeSWITCH.
+      O payload é um bytes próprio (cópia do buffer de recepção): o consumidor
+      pode retê-lo após o retorno (ex.: run_coroutine_threadsafe), por isso
+      não é reciclado num slab de buffers.
     - on_underrun(): Chamado quando jitter buffer tem underrun
     - on_error(exception): Chamado em erro fatal
     """
@@ -104,6 +147,7 @@ class RTPBridge:
             max_delay_ms=config.jitter_max_ms,
             target_delay_ms=config.jitter_target_ms,
             on_underrun=self._handle_underrun,
+            sample_rate=config.sample_rate,
         )
         
         # Builder para pacotes de saída
@@ -113,16 +157,33 @@ class RTPBridge:
         )
         
         # Estado
+        # Recepção e consumo rodam em um único event loop asyncio por bridge
+        # (uma thread); o consumo é disparado pela própria chegada de pacotes.
         self._running = False
-        self._recv_thread: Optional[threading.Thread] = None
-        self._consumer_thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # Buffer de recepção reutilizado: recvfrom_into não aloca por pacote;
+        # só o payload é copiado (o jitter buffer precisa ser dono dele)
+        self._recv_buf = bytearray(RECV_BUFFER_BYTES)
+        self._recv_mv = memoryview(self._recv_buf)
+        
+        # Peer fixado via connect() assim que o RTP simétrico é confirmado
+        # (send() evita resolver o endereço a cada pacote no kernel)
+        self._remote_connected = False
         
         # Métricas
-        self._packets_sent = 0
-        self._packets_received = 0
-        self._bytes_sent = 0
-        self._bytes_received = 0
-        self._last_recv_time: Optional[float] = None
+        self._metrics = RTPBridgeMetrics()
+        
+        # Relógio do playout: um tick por pacote (packet_duration_ms) via
+        # call_at; armado pela chegada de pacotes e parado com o bridge ocioso
+        self._playout_timer: Optional[asyncio.TimerHandle] = None
+        self._playout_interval = self._jitter_buffer.packet_duration_ms / 1000
+        self._playout_next = 0.0
+        
+        # Timer de silêncio: armado pelo primeiro pacote após silêncio e
+        # reagendado para o prazo restante (nenhum wakeup com o bridge ocioso)
+        self._silence_timer: Optional[asyncio.TimerHandle] = None
         
         logger.info(
             f"RTPBridge created: local={config.local_address}:{self.local_rtp_port}, "
@@ -130,38 +191,66 @@ class RTPBridge:
         )
     
     def start(self) -> None:
-        """Inicia o bridge (threads de recepção e consumo)."""
+        """Inicia o bridge (event loop de recepção e consumo)."""
         if self._running:
             return
         
         logger.info(f"Starting RTPBridge on port {self.local_rtp_port}")
         
-        # Criar socket RTP
-        self._rtp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._rtp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._rtp_socket.bind((self.config.local_address, self.local_rtp_port))
-        self._rtp_socket.settimeout(1.0)  # Timeout para verificar _running
+        # Criar socket RTP (trocando de porta se outro processo a ocupa)
+        for attempt in range(BIND_RETRIES):
+            try:
+                self._rtp_socket = self._create_socket()
+                break
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE or attempt == BIND_RETRIES - 1:
+                    raise
+                pool = get_port_pool()
+                pool.mark_in_use_externally(self.local_rtp_port)
+                ports = pool.allocate()
+                if not ports:
+                    raise RuntimeError("No RTP ports available") from e
+                self.local_rtp_port, self.local_rtcp_port = ports
         
         self._running = True
+        self._loop = asyncio.new_event_loop()
         
-        # Thread para receber pacotes
-        self._recv_thread = threading.Thread(
-            target=self._receive_loop,
-            name=f"RTPRecv-{self.local_rtp_port}",
-            daemon=True,
-        )
-        self._recv_thread.start()
-        
-        # Thread para consumir jitter buffer
-        self._consumer_thread = threading.Thread(
-            target=self._consumer_loop,
-            name=f"RTPConsumer-{self.local_rtp_port}",
+        ready = threading.Event()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop,
+            args=(ready,),
+            name=f"RTPBridge-{self.local_rtp_port}",
             daemon=True,
         )
-        self._consumer_thread.start()
+        self._loop_thread.start()
+        ready.wait(timeout=2.0)
         
         logger.debug("RTPBridge started")
     
+    def _create_socket(self) -> socket.socket:
+        """Cria o socket UDP com todas as opções aplicadas num só bloco."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_BYTES)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_BYTES)
+            
+            # QoS é best-effort: falha (ex.: sem permissão) não impede o bridge
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, RTP_IP_TOS)
+                if hasattr(socket, "SO_PRIORITY"):  # Linux
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, RTP_SO_PRIORITY)
+            except OSError as e:
+                logger.debug(f"Could not set RTP QoS socket options: {e}")
+            
+            sock.bind((self.config.local_address, self.local_rtp_port))
+            sock.setblocking(False)
+        except Exception:
+            sock.close()
+            raise
+        
+        return sock
+    
     def stop(self) -> None:
         """Para o bridge graciosamente."""
         if not self._running:
@@ -170,13 +259,17 @@ class RTPBridge:
         logger.info(f"Stopping RTPBridge on port {self.local_rtp_port}")
         
         self._running = False
+        self._remote_connected = False
         
-        # Aguardar threads
-        if self._recv_thread and self._recv_thread.is_alive():
-            self._recv_thread.join(timeout=2.0)
+        # Parar event loop e aguardar thread
+        if self._loop and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            except RuntimeError:
+                pass  # Loop já encerrado
         
-        if self._consumer_thread and self._consumer_thread.is_alive():
-            self._consumer_thread.join(timeout=2.0)
+        if self._loop_thread and self._loop_thread.is_alive():
+            self._loop_thread.join(timeout=2.0)
         
         # Fechar socket
         if self._rtp_socket:
@@ -193,8 +286,8 @@ class RTPBridge:
         self._jitter_buffer.clear()
         
         logger.info(
-            f"RTPBridge stopped: sent={self._packets_sent} pkts/{self._bytes_sent} bytes, "
-            f"recv={self._packets_received} pkts/{self._bytes_received} bytes"
+            f"RTPBridge stopped: sent={self._metrics.packets_sent} pkts/{self._metrics.bytes_sent} bytes, "
+            f"recv={self._metrics.packets_received} pkts/{self._metrics.bytes_received} bytes"
         )
     
     def send_audio(self, audio: bytes, marker: bool = False) -> bool:
@@ -216,18 +309,21 @@ class RTPBridge:
             return False
         
         try:
-            # Construir pacote RTP
-            packet = self._packet_builder.build(audio, marker=marker)
+            # Serializar no buffer do builder (enviado antes do próximo build)
+            data = self._packet_builder.build_into(audio, marker=marker)
             
             # Enviar
-            data = packet.to_bytes()
-            self._rtp_socket.sendto(
-                data,
-                (self.config.remote_address, self.config.remote_rtp_port)
-            )
+            if self._remote_connected:
+                self._rtp_socket.send(data)
+            else:
+                self._rtp_socket.sendto(
+                    data,
+                    (self.config.remote_address, self.config.remote_rtp_port)
+                )
             
-            self._packets_sent += 1
-            self._bytes_sent += len(data)
+            metrics = self._metrics
+            metrics.packets_sent += 1
+            metrics.bytes_sent += len(data)
             
             return True
             
@@ -244,71 +340,172 @@ class RTPBridge:
         """
         self.config.remote_address = address
         self.config.remote_rtp_port = port
+        if self._remote_connected:
+            self._connect_remote()
         logger.info(f"Remote RTP set to {address}:{port}")
     
-    def _receive_loop(self) -> None:
-        """Loop de recepção de pacotes RTP."""
-        logger.debug("RTP receive loop started")
+    def _connect_remote(self) -> None:
+        """
+        Fixa o peer do socket com connect().
         
-        while self._running:
+        Só é chamado quando o pacote recebido vem do endereço remoto
+        (RTP simétrico): um socket UDP conectado descarta datagramas de
+        qualquer outra origem.
+        """
+        try:
+            self._rtp_socket.connect(
+                (self.config.remote_address, self.config.remote_rtp_port)
+            )
+            self._remote_connected = True
+        except OSError as e:
+            self._remote_connected = False
+            logger.warning(f"Could not connect RTP socket to remote: {e}")
+    
+    def _run_loop(self, ready: threading.Event) -> None:
+        """Thread do bridge: executa o event loop de recepção/consumo."""
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        logger.debug("RTP event loop started")
+        
+        sock = self._rtp_socket
+        try:
+            loop.add_reader(sock.fileno(), self._on_readable)
+            ready.set()
+            loop.run_forever()
+        except Exception as e:
+            if self._running:
+                logger.error(f"RTP event loop error: {e}")
+                if self.on_error:
+                    self.on_error(e)
+        finally:
+            ready.set()
             try:
-                # Receber pacote
-                data, addr = self._rtp_socket.recvfrom(2048)
-                
-                # Auto-detect remote address
-                if not self.config.remote_address:
-                    self.set_remote(addr[0], addr[1])
-                
-                # Parse pacote
-                packet = RTPPacket.parse(data)
-                
-                self._packets_received += 1
-                self._bytes_received += len(data)
-                self._last_recv_time = time.time()
-                
-                # Adicionar ao jitter buffer
-                self._jitter_buffer.push(packet)
-                
-            except socket.timeout:
-                # Verificar timeout de silêncio
-                if self._last_recv_time:
-                    silence = (time.time() - self._last_recv_time) * 1000
-                    if silence > self.config.silence_timeout_ms:
-                        logger.warning(f"Silence timeout ({silence:.0f}ms)")
-                        # Não encerrar, apenas logar
-                continue
-                
+                loop.remove_reader(sock.fileno())
+            except (ValueError, OSError):
+                pass  # Socket já fechado
+            loop.close()
+            logger.debug("RTP event loop ended")
+    
+    def _on_readable(self) -> None:
+        """
+        Socket legível: lê os datagramas pendentes no buffer reutilizado.
+        
+        Caminho por pacote mínimo: recvfrom_into → parse_rtp_frame; o lote
+        inteiro entra no jitter buffer com um único push_batch (um lock e
+        uma leitura de relógio por lote, não por pacote).
+        """
+        sock = self._rtp_socket
+        if sock is None:
+            return
+        
+        recvfrom_into = sock.recvfrom_into
+        recv_buf = self._recv_buf
+        recv_mv = self._recv_mv
+        metrics = self._metrics
+        frames = []
+        
+        for _ in range(MAX_DATAGRAMS_PER_READ):
+            try:
+                nbytes, addr = recvfrom_into(recv_buf)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                # Ex.: ICMP port unreachable em socket conectado
+                if self._running:
+                    logger.error(f"Error receiving RTP: {e}")
+                break
+            
+            if not self._remote_connected:
+                self._detect_remote(addr)
+            
+            try:
+                # Parse enxuto (sem RTPHeader/CSRCs): o jitter buffer só usa
+                # sequence/timestamp e o consumidor só o payload
+                frames.append(parse_rtp_frame(recv_mv[:nbytes]))
             except Exception as e:
                 if self._running:
                     logger.error(f"Error receiving RTP: {e}")
+                continue
+            
+            metrics.bytes_received += nbytes
         
-        logger.debug("RTP receive loop ended")
+        if frames:
+            self._jitter_buffer.push_batch(frames)
+            metrics.packets_received += len(frames)
+            metrics.last_recv_ns = time.monotonic_ns()
+            if self._silence_timer is None:
+                self._silence_timer = self._loop.call_later(
+                    self.config.silence_timeout_ms / 1000, self._check_silence
+                )
+            self._ensure_playout()
+    
+    def _detect_remote(self, addr: Tuple[str, int]) -> None:
+        """Auto-detect do remoto e connect() quando o RTP for simétrico."""
+        if not self.config.remote_address:
+            self.set_remote(addr[0], addr[1])
+        if (
+            addr[0] == self.config.remote_address
+            and addr[1] == self.config.remote_rtp_port
+        ):
+            self._connect_remote()
+    
+    def _ensure_playout(self) -> None:
+        """Relógio do playout parado (bridge ocioso): tick imediato o rearma."""
+        if self._playout_timer is None:
+            self._playout_next = self._loop.time()
+            self._playout_tick()
     
-    def _consumer_loop(self) -> None:
-        """Loop que consome jitter buffer e chama callback."""
-        logger.debug("RTP consumer loop started")
+    def _playout_tick(self) -> None:
+        """
+        Tick do playout: entrega os pacotes cujo prazo chegou e reagenda.
         
-        packet_interval_s = self.config.jitter_min_ms / 1000 / 3  # ~20ms por pacote
+        Um pop_due() por intervalo de pacote: uma lacuna só é pulada quando
+        o prazo do slot passa (o delay de início dá tempo ao pacote
+        reordenado). Atrasos do loop são compensados no mesmo callback.
+        """
+        self._playout_timer = None
+        if not self._running:
+            return
         
-        while self._running:
-            try:
-                # Tentar obter pacote do buffer
-                packet = self._jitter_buffer.pop(timeout_ms=int(packet_interval_s * 1000))
-                
-                if packet and self.on_audio_received:
+        loop = self._loop
+        jitter_buffer = self._jitter_buffer
+        interval = self._playout_interval
+        now = loop.time()
+        
+        try:
+            while self._playout_next <= now:
+                self._playout_next += interval
+                packet = jitter_buffer.pop_due()
+                if packet is not None and self.on_audio_received:
                     self.on_audio_received(packet.payload)
-                
-                if not packet:
-                    # Sleep se não há pacotes
-                    time.sleep(packet_interval_s)
-                    
-            except Exception as e:
-                if self._running:
-                    logger.error(f"Error in consumer loop: {e}")
-                    if self.on_error:
-                        self.on_error(e)
+                if not jitter_buffer.size and not jitter_buffer.is_playing:
+                    break
+        except Exception as e:
+            logger.error(f"Error in consumer loop: {e}")
+            if self.on_error:
+                self.on_error(e)
+        
+        # Ocioso (vazio e fora do playout): o próximo pacote rearma o relógio
+        if not jitter_buffer.size and not jitter_buffer.is_playing:
+            return
+        self._playout_timer = loop.call_at(self._playout_next, self._playout_tick)
+    
+    def _check_silence(self) -> None:
+        """Prazo de silêncio atingido: loga uma vez ou reagenda pelo restante."""
+        self._silence_timer = None
+        if not self._running:
+            return
         
-        logger.debug("RTP consumer loop ended")
+        silence = (time.monotonic_ns() - self._metrics.last_recv_ns) / 1e6
+        remaining_ms = self.config.silence_timeout_ms - silence
+        if remaining_ms > 0:
+            self._silence_timer = self._loop.call_later(
+                remaining_ms / 1000, self._check_silence
+            )
+        else:
+            # Não encerrar, apenas logar (uma vez por período de silêncio;
+            # o próximo pacote rearma o timer)
+            logger.warning(f"Silence timeout ({silence:.0f}ms)")
     
     def _handle_underrun(self) -> None:
         """Callback interno para buffer underrun."""
@@ -323,6 +520,10 @@ class RTPBridge:
         """Retorna estatísticas do jitter buffer."""
         return self._jitter_buffer.get_stats()
     
+    def get_metrics(self) -> RTPBridgeMetrics:
+        """Retorna snapshot dos contadores de envio/recepção."""
+        return self._metrics.copy()
+    
     @property
     def is_running(self) -> bool:
         """True se bridge está ativo."""
@@ -331,6 +532,7 @@ class RTPBridge:
     @property
     def is_receiving(self) -> bool:
         """True se está recebendo pacotes recentemente."""
-        if not self._last_recv_time:
+        last_recv_ns = self._metrics.last_recv_ns
+        if not last_recv_ns:
             return False
-        return (time.time() - self._last_recv_time) < 5.0
+        return (time.monotonic_ns() - last_recv_ns) < 5_000_000_000
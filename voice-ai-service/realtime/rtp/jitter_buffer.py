@@ -11,17 +11,36 @@ Referências:
 
 import logging
 import threading
-import time
-from collections import deque
+from time import monotonic as _monotonic, time as _now
 from dataclasses import dataclass, field
-from typing import Optional, Deque, Callable
+from typing import Optional, List, Callable, Sequence, Tuple, Union
 
-from .protocol import RTPPacket
+from .protocol import RTPPacket, RTPFrame
+
+# Pacote aceito pelo buffer: RTPPacket completo ou RTPFrame (caminho rápido)
+BufferedPacket = Union[RTPPacket, RTPFrame]
 
 logger = logging.getLogger(__name__)
 
+# Anel indexado por sequence: slot = seq & RING_MASK (O(1) insert/dup/pop)
+RING_SIZE = 4096
+RING_MASK = RING_SIZE - 1
+
+# Salto máximo de sequence aceito à frente do head (como MaxDropout do
+# mediasoup); acima disso o stream é tratado como reiniciado
+MAX_DROPOUT = 3000
+
+# Atraso máximo de sequence atrás do head tratado como reordenação/atraso
+# (como MaxMisorder do mediasoup); acima disso o stream é tratado como
+# reiniciado (ex.: novo SSRC com sequence inicial aleatória)
+MAX_MISORDER = 100
+
+# Pops consecutivos sem underrun (~5s com pacotes de 20ms) antes de tentar
+# reduzir o delay de início do playout
+ADAPT_DECREASE_POPS = 250
+
 
-@dataclass
+@dataclass(slots=True)
 class JitterStats:
     """Estatísticas do jitter buffer."""
     packets_received: int = 0
@@ -34,6 +53,7 @@ class JitterStats:
     average_jitter_ms: float = 0.0
     max_jitter_ms: float = 0.0
     current_buffer_size: int = 0
+    playout_delay_ms: float = 0.0
 
 
 class JitterBuffer:
@@ -41,14 +61,21 @@ class JitterBuffer:
     Jitter Buffer adaptativo para pacotes RTP.
     
     Funcionamento:
-    1. Pacotes chegam e são inseridos ordenados por sequence
-    2. Consumer retira pacotes em ordem
+    1. Pacotes chegam e são inseridos no slot do anel dado pela sequence
+    2. Consumer retira pacotes em ordem a partir do head: pop_due() a cada
+       tick do playout (espera o prazo de cada slot) ou pop() (pula perdas)
     3. Buffer adapta tamanho baseado no jitter observado
     
     Parâmetros adaptativos:
     - min_delay_ms: Delay mínimo (default: 60ms = 3 pacotes de 20ms)
     - max_delay_ms: Delay máximo (default: 200ms = 10 pacotes)
     - target_delay_ms: Delay alvo (default: 100ms = 5 pacotes)
+    
+    O delay de início (pacotes acumulados antes de liberar o playout) parte
+    de min_delay_ms, sobe um pacote a cada underrun (tick de pop_due() ou
+    prazo de pop(timeout_ms) sem pacote) e desce um pacote após
+    ADAPT_DECREASE_POPS pops sem underrun com jitter abaixo da metade do
+    delay atual, sempre entre min_delay_ms e max_delay_ms.
     """
     
     def __init__(
@@ -58,6 +85,7 @@ class JitterBuffer:
         target_delay_ms: int = 100,
         packet_duration_ms: int = 20,
         on_underrun: Optional[Callable[[], None]] = None,
+        sample_rate: int = 8000,
     ):
         """
         Args:
@@ -66,216 +94,460 @@ class JitterBuffer:
             target_delay_ms: Delay alvo
             packet_duration_ms: Duração de cada pacote (20ms para RTP típico)
             on_underrun: Callback chamado em buffer underrun
+            sample_rate: Clock rate do RTP timestamp (8000 para G.711)
         """
         self.min_delay_ms = min_delay_ms
         self.max_delay_ms = max_delay_ms
         self.target_delay_ms = target_delay_ms
         self.packet_duration_ms = packet_duration_ms
         self.on_underrun = on_underrun
+        self.sample_rate = sample_rate
         
         # Calcular tamanhos em pacotes
         self._min_packets = max(1, min_delay_ms // packet_duration_ms)
         self._max_packets = max_delay_ms // packet_duration_ms
         self._target_packets = target_delay_ms // packet_duration_ms
         
-        # Buffer ordenado por sequence
-        self._buffer: Deque[RTPPacket] = deque(maxlen=self._max_packets * 2)
+        # Delay de início adaptativo (em pacotes) e pops desde o último underrun
+        self._start_packets = self._min_packets
+        self._stable_pops = 0
+        # Duração de um pacote em unidades de timestamp (compara com o jitter)
+        self._packet_ts = sample_rate * packet_duration_ms // 1000
+        
+        # Anel indexado por sequence (head = próxima sequence a sair)
+        self._slots: List[Optional[BufferedPacket]] = [None] * RING_SIZE
+        self._head_seq: Optional[int] = None
+        self._high_offset = -1  # Maior distância (seq - head) presente no anel
+        self._count = 0
+        self._capacity = self._max_packets * 2
+        self._popped_any = False
         
         # Estado
         self._lock = threading.Lock()
-        self._expected_seq: Optional[int] = None
+        # pop(timeout_ms) dorme aqui até push() sinalizar (sem polling)
+        self._cv = threading.Condition(self._lock)
         self._last_pop_time: Optional[float] = None
         self._started = False
         
         # Estatísticas
         self._stats = JitterStats()
         
-        # Jitter calculation (RFC 3550)
-        self._last_arrival_time: Optional[float] = None
-        self._last_rtp_timestamp: Optional[int] = None
-        self._jitter: float = 0.0
+        # Jitter calculation (RFC 3550, aritmética inteira em unidades de
+        # timestamp; _jitter guarda J*16 como no Appendix A.8).
+        # Estado do produtor (thread de recepção), atualizado fora do lock;
+        # _jitter_seq é ímpar durante a escrita (leitura estilo seqlock)
+        self._last_transit: Optional[int] = None
+        self._jitter = 0
+        self._max_jitter = 0
+        self._jitter_seq = 0
+        # ms por unidade de timestamp (conversão só ao expor estatísticas)
+        self._ts_scale_ms = 1000.0 / sample_rate
         
         logger.debug(
             f"JitterBuffer initialized: {min_delay_ms}-{max_delay_ms}ms "
             f"(target={target_delay_ms}ms, packets={self._min_packets}-{self._max_packets})"
         )
     
-    def push(self, packet: RTPPacket) -> bool:
+    def push(self, packet: BufferedPacket) -> bool:
         """
         Adiciona pacote ao buffer.
         
+        Deve ser chamado por um único produtor (a thread de recepção): o
+        jitter é calculado antes de tomar o lock.
+        
         Args:
             packet: Pacote RTP a adicionar
             
         Returns:
             True se pacote foi aceito, False se descartado
         """
+        # Calcular jitter (RFC 3550), sem o lock
+        self._update_jitter(packet, _now())
+        
         with self._lock:
-            self._stats.packets_received += 1
-            arrival_time = time.time()
-            
-            # Calcular jitter (RFC 3550)
-            self._update_jitter(packet, arrival_time)
+            stats = self._stats
+            stats.packets_received += 1
+            overflows = stats.buffer_overflows
             
-            # Inicializar expected sequence se primeiro pacote
-            if self._expected_seq is None:
-                self._expected_seq = packet.sequence
-            
-            # Verificar overflow
-            if len(self._buffer) >= self._max_packets * 2:
-                self._stats.buffer_overflows += 1
-                # Descartar pacote mais antigo
-                self._buffer.popleft()
-                logger.warning("Jitter buffer overflow, dropping oldest packet")
-            
-            # Inserir ordenado por sequence
-            inserted = self._insert_ordered(packet)
+            inserted = self._insert(packet)
+            stats.current_buffer_size = self._count
+            overflows = stats.buffer_overflows - overflows
+            if inserted:
+                self._cv.notify()
+        
+        # Log fora do lock (o handler pode fazer I/O)
+        if overflows:
+            self._log_overflows(overflows)
+        return inserted
+    
+    def push_batch(self, packets: Sequence[BufferedPacket]) -> int:
+        """
+        Adiciona um lote de pacotes lidos juntos do socket.
+        
+        Um único lock e uma única leitura de relógio para o lote (os pacotes
+        já estavam enfileirados no kernel, a chegada é a mesma).
+        
+        Returns:
+            Número de pacotes aceitos
+        """
+        if not packets:
+            return 0
+        
+        self._update_jitter_batch(packets, _now())
+        
+        with self._lock:
+            stats = self._stats
+            overflows = stats.buffer_overflows
             
-            if not inserted:
-                self._stats.packets_duplicated += 1
-                return False
+            accepted = 0
+            for packet in packets:
+                if self._insert(packet):
+                    accepted += 1
             
-            self._stats.current_buffer_size = len(self._buffer)
-            return True
+            stats.packets_received += len(packets)
+            stats.current_buffer_size = self._count
+            overflows = stats.buffer_overflows - overflows
+            if accepted:
+                self._cv.notify()
+        
+        if overflows:
+            self._log_overflows(overflows)
+        return accepted
     
-    def pop(self, timeout_ms: Optional[int] = None) -> Optional[RTPPacket]:
+    @staticmethod
+    def _log_overflows(count: int) -> None:
+        """Loga descartes por overflow (chamado sem o lock)."""
+        if count == 1:
+            logger.warning("Jitter buffer overflow, dropping oldest packet")
+        else:
+            logger.warning(f"Jitter buffer overflow, dropped {count} oldest packets")
+    
+    def pop(self, timeout_ms: Optional[int] = None) -> Optional[BufferedPacket]:
         """
         Remove e retorna próximo pacote em ordem.
         
+        Com timeout_ms, pop() é o relógio do playout: se o prazo expira com
+        o playout iniciado e nenhum pacote disponível, conta um underrun.
+        Sem timeout (consumidor que esvazia o buffer), vazio não é underrun.
+        
         Args:
             timeout_ms: Timeout para aguardar pacote (None = não bloqueia)
             
         Returns:
-            RTPPacket ou None se buffer vazio
+            Pacote (RTPPacket/RTPFrame) ou None se buffer vazio
         """
-        start_time = time.time()
+        deadline = None if timeout_ms is None else _monotonic() + timeout_ms / 1000
         
+        with self._cv:
+            packet, underrun = self._pop_wait(deadline)
+        
+        # Callback e log fora do lock: o handler de log pode fazer I/O e o
+        # callback pode consultar o próprio buffer
+        if underrun:
+            if self.on_underrun:
+                self.on_underrun()
+            logger.warning("Jitter buffer underrun")
+        return packet
+    
+    def _pop_wait(self, deadline: Optional[float]) -> Tuple[Optional[BufferedPacket], bool]:
+        """
+        Corpo de pop() (chamado com o lock).
+        
+        Returns:
+            Tuple (pacote ou None, True se houve underrun)
+        """
+        underrun = False
         while True:
-            with self._lock:
-                # Verificar se buffer tem pacotes suficientes para iniciar
-                if not self._started:
-                    if len(self._buffer) >= self._min_packets:
-                        self._started = True
-                        self._last_pop_time = time.time()
-                        logger.debug(
-                            f"Jitter buffer started with {len(self._buffer)} packets"
-                        )
-                    else:
-                        # Ainda em warmup
-                        if timeout_ms is None:
-                            return None
-                        # Continuar esperando
-                        pass
-                
-                if self._started and self._buffer:
-                    packet = self._buffer.popleft()
-                    self._expected_seq = (packet.sequence + 1) & 0xFFFF
-                    self._last_pop_time = time.time()
-                    self._stats.current_buffer_size = len(self._buffer)
-                    return packet
-                
-                if self._started and not self._buffer:
-                    # Buffer underrun
-                    self._stats.buffer_underruns += 1
-                    self._started = False  # Precisa warmup novamente
-                    
-                    if self.on_underrun:
-                        self.on_underrun()
-                    
-                    logger.warning("Jitter buffer underrun")
+            # Verificar se buffer tem pacotes suficientes para iniciar
+            if not self._started and self._count >= self._start_packets:
+                self._started = True
+                self._last_pop_time = _now()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Jitter buffer started with {self._count} packets"
+                    )
+            
+            if self._started and self._count:
+                return self._take(self._pop_head()), underrun
             
-            # Verificar timeout
-            if timeout_ms is None:
-                return None
+            # Sem timeout: consumidor que esvazia o buffer a cada leitura do
+            # socket; buffer vazio aqui não é underrun
+            if deadline is None:
+                return None, underrun
             
-            elapsed_ms = (time.time() - start_time) * 1000
-            if elapsed_ms >= timeout_ms:
-                return None
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
+                if self._started:
+                    # Underrun: o prazo do playout passou sem pacote
+                    self._underrun()
+                    underrun = True
+                return None, underrun
             
-            # Aguardar um pouco e tentar novamente
-            time.sleep(0.005)  # 5ms
+            # Aguardar push() (ou o timeout)
+            self._cv.wait(remaining)
+    
+    def pop_due(self) -> Optional[BufferedPacket]:
+        """
+        Um tick do playout (consumidor cadenciado, um tick por pacote).
+        
+        Retorna o pacote cuja vez chegou. Se o próximo pacote em ordem ainda
+        não chegou mas há posteriores, o slot é dado como perdido e nada sai
+        neste tick: o pacote reordenado teve o delay de início para chegar.
+        Buffer vazio com o playout iniciado conta um underrun.
+        
+        Returns:
+            Pacote (RTPPacket/RTPFrame) ou None (warmup, perda ou vazio)
+        """
+        with self._lock:
+            packet, underrun = self._pop_due_locked()
+        
+        if underrun:
+            if self.on_underrun:
+                self.on_underrun()
+            logger.warning("Jitter buffer underrun")
+        return packet
+    
+    def _pop_due_locked(self) -> Tuple[Optional[BufferedPacket], bool]:
+        """Corpo de pop_due() (chamado com o lock)."""
+        if not self._started:
+            if self._count < self._start_packets:
+                return None, False
+            self._started = True
+            self._last_pop_time = _now()
+        
+        if not self._count:
+            self._underrun()
+            return None, True
+        
+        head = self._head_seq
+        packet = self._slots[head & RING_MASK]
+        if packet is None:
+            # Prazo do slot passou sem o pacote: perdido (se chegar, é tarde)
+            self._head_seq = (head + 1) & 0xFFFF
+            self._high_offset -= 1
+            self._popped_any = True
+            return None, False
+        
+        return self._take(self._pop_head()), False
     
-    def _insert_ordered(self, packet: RTPPacket) -> bool:
+    def _take(self, packet: BufferedPacket) -> BufferedPacket:
+        """Contabiliza um pop bem-sucedido (chamado com o lock)."""
+        self._last_pop_time = _now()
+        self._stats.current_buffer_size = self._count
+        stable = self._stable_pops + 1
+        if stable >= ADAPT_DECREASE_POPS:
+            stable = 0
+            self._shrink_start_delay()
+        self._stable_pops = stable
+        return packet
+    
+    def _underrun(self) -> None:
+        """
+        Registra underrun: volta ao warmup, agora um pacote mais longo
+        (chamado com o lock).
         """
-        Insere pacote mantendo ordem por sequence.
+        self._stats.buffer_underruns += 1
+        self._started = False  # Precisa warmup novamente
+        self._stable_pops = 0
+        if self._start_packets < self._max_packets:
+            self._start_packets += 1
+    
+    def _shrink_start_delay(self) -> None:
+        """
+        Reduz o delay de início em um pacote se o jitter medido estiver
+        abaixo da metade do delay atual (chamado com o lock).
+        """
+        start = self._start_packets
+        if start <= self._min_packets:
+            return
+        # Leitura direta do produtor: valor defasado em um pacote é aceitável
+        if (self._jitter >> 4) * 2 < start * self._packet_ts:
+            self._start_packets = start - 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Jitter buffer playout delay reduced to "
+                    f"{(start - 1) * self.packet_duration_ms}ms"
+                )
+    
+    def _insert(self, packet: BufferedPacket) -> bool:
+        """
+        Insere pacote no slot da sua sequence.
         
         Returns:
-            True se inserido, False se duplicado
+            True se inserido, False se duplicado ou atrasado demais
         """
         seq = packet.sequence
+        stats = self._stats
         
-        # Buffer vazio
-        if not self._buffer:
-            self._buffer.append(packet)
-            return True
+        if self._head_seq is None:
+            self._head_seq = seq
         
-        # Verificar duplicado
-        for existing in self._buffer:
-            if existing.sequence == seq:
+        offset = (seq - self._head_seq) & 0xFFFF
+        
+        if offset >= 0x8000 and 0x10000 - offset > MAX_MISORDER:
+            # Muito atrás do head: reinício do stream, descarta o conteúdo atual
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Jitter buffer sequence restart ({0x10000 - offset} behind), resetting"
+                )
+            self._reset_ring()
+            self._popped_any = False
+            self._head_seq = seq
+            offset = 0
+        elif offset >= 0x8000:
+            # Anterior ao head: antes do primeiro pop, o head recua (reordenação
+            # no início do stream); depois, o pacote chegou tarde demais
+            behind = 0x10000 - offset
+            if self._popped_any or self._high_offset + behind >= RING_SIZE:
+                stats.packets_dropped += 1
                 return False
+            self._head_seq = seq
+            self._high_offset += behind
+            offset = 0
+            stats.packets_reordered += 1
+        elif offset >= MAX_DROPOUT:
+            # Salto grande (reinício do stream): descarta o conteúdo atual
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Jitter buffer sequence jump ({offset}), resetting")
+            self._reset_ring()
+            self._head_seq = seq
+            offset = 0
+        elif offset < self._high_offset:
+            stats.packets_reordered += 1
         
-        # Encontrar posição correta
-        # Sequence wrap-around: considerar distância circular
-        insert_pos = len(self._buffer)
-        
-        for i, existing in enumerate(self._buffer):
-            # Comparação com wrap-around
-            diff = (seq - existing.sequence) & 0xFFFF
-            if diff > 0x8000:  # seq é "menor" que existing (wrap)
-                insert_pos = i
-                self._stats.packets_reordered += 1
-                break
-            elif diff == 0:
-                return False  # Duplicado
-        
-        # Inserir na posição
-        if insert_pos == len(self._buffer):
-            self._buffer.append(packet)
-        else:
-            self._buffer.insert(insert_pos, packet)
+        idx = seq & RING_MASK
+        if self._slots[idx] is not None:
+            stats.packets_duplicated += 1
+            return False
         
+        # Verificar overflow: descartar pacote mais antigo
+        if self._count >= self._capacity:
+            stats.buffer_overflows += 1  # Logado pelo chamador, fora do lock
+            if offset < self._first_offset():
+                return False  # O próprio pacote é o mais antigo
+            self._pop_head()
+            offset = (seq - self._head_seq) & 0xFFFF
+        
+        self._slots[idx] = packet
+        self._count += 1
+        if offset > self._high_offset:
+            self._high_offset = offset
         return True
     
-    def _update_jitter(self, packet: RTPPacket, arrival_time: float) -> None:
+    def _first_offset(self) -> int:
+        """Distância do head até o primeiro slot ocupado (anel não vazio)."""
+        slots = self._slots
+        head = self._head_seq
+        offset = 0
+        while slots[(head + offset) & RING_MASK] is None:
+            offset += 1
+        return offset
+    
+    def _pop_head(self) -> BufferedPacket:
+        """Remove o próximo pacote a partir do head, pulando slots perdidos."""
+        slots = self._slots
+        seq = self._head_seq
+        skipped = 0
+        packet = slots[seq & RING_MASK]
+        while packet is None:
+            seq = (seq + 1) & 0xFFFF
+            skipped += 1
+            packet = slots[seq & RING_MASK]
+        
+        slots[seq & RING_MASK] = None
+        self._count -= 1
+        self._head_seq = (seq + 1) & 0xFFFF
+        self._high_offset = -1 if not self._count else self._high_offset - skipped - 1
+        self._popped_any = True
+        return packet
+    
+    def _reset_ring(self) -> None:
+        """Esvazia o anel (percorre só o trecho ocupado)."""
+        if self._head_seq is not None:
+            for offset in range(self._high_offset + 1):
+                self._slots[(self._head_seq + offset) & RING_MASK] = None
+        self._head_seq = None
+        self._high_offset = -1
+        self._count = 0
+    
+    def _update_jitter(self, packet: BufferedPacket, arrival_time: float) -> None:
         """
         Calcula jitter inter-pacote (RFC 3550).
         
         J(i) = J(i-1) + (|D(i-1,i)| - J(i-1)) / 16
         
-        Onde D(i-1,i) é a diferença entre intervalos de chegada
-        e intervalos de RTP timestamp.
+        Onde D(i-1,i) é a variação do tempo de trânsito (chegada - RTP
+        timestamp), tudo em unidades de timestamp. O jitter é mantido
+        escalado por 16 para que o /16 vire um shift sem perder precisão.
         """
-        if self._last_arrival_time is not None and self._last_rtp_timestamp is not None:
-            # Calcular intervalos
-            arrival_delta = (arrival_time - self._last_arrival_time) * 1000  # ms
-            
-            # Assumir sample rate de 8000Hz para timestamp (160 samples = 20ms)
-            timestamp_delta = (
-                (packet.timestamp - self._last_rtp_timestamp) & 0xFFFFFFFF
-            ) / 8.0  # ms (8 samples/ms for 8kHz)
-            
-            # Diferença
-            d = abs(arrival_delta - timestamp_delta)
-            
-            # Atualizar jitter (exponential moving average)
-            self._jitter = self._jitter + (d - self._jitter) / 16.0
+        transit = int(arrival_time * self.sample_rate) - packet.timestamp
+        
+        if self._last_transit is not None:
+            # Diferença com sinal (wrap de 32 bits)
+            d = (transit - self._last_transit) & 0xFFFFFFFF
+            if d >= 0x80000000:
+                d = 0x100000000 - d
             
-            self._stats.average_jitter_ms = self._jitter
-            self._stats.max_jitter_ms = max(self._stats.max_jitter_ms, d)
+            # Atualizar jitter (exponential moving average, RFC 3550 A.8)
+            self._jitter_seq += 1
+            self._jitter += d - ((self._jitter + 8) >> 4)
+            if d > self._max_jitter:
+                self._max_jitter = d
+            self._jitter_seq += 1
         
-        self._last_arrival_time = arrival_time
-        self._last_rtp_timestamp = packet.timestamp
+        self._last_transit = transit
+    
+    def _update_jitter_batch(
+        self, packets: Sequence[BufferedPacket], arrival_time: float
+    ) -> None:
+        """
+        Mesmo cálculo de _update_jitter para um lote com chegada comum.
+        
+        Estado em variáveis locais e gravado uma vez ao final (o lote vem de
+        uma única leitura do socket, tipicamente poucos pacotes).
+        """
+        arrival = int(arrival_time * self.sample_rate)
+        last_transit = self._last_transit
+        jitter = self._jitter
+        max_jitter = self._max_jitter
+        
+        for packet in packets:
+            transit = arrival - packet.timestamp
+            if last_transit is not None:
+                d = (transit - last_transit) & 0xFFFFFFFF
+                if d >= 0x80000000:
+                    d = 0x100000000 - d
+                jitter += d - ((jitter + 8) >> 4)
+                if d > max_jitter:
+                    max_jitter = d
+            last_transit = transit
+        
+        self._last_transit = last_transit
+        self._jitter_seq += 1
+        self._jitter = jitter
+        self._max_jitter = max_jitter
+        self._jitter_seq += 1
     
     def clear(self) -> None:
         """Limpa o buffer."""
         with self._lock:
-            self._buffer.clear()
-            self._expected_seq = None
+            self._reset_ring()
+            self._popped_any = False
             self._started = False
             self._stats.current_buffer_size = 0
     
+    def _read_jitter(self) -> Tuple[int, int]:
+        """Lê (jitter*16, jitter máximo) consistentes sem bloquear o produtor."""
+        while True:
+            seq = self._jitter_seq
+            jitter = self._jitter
+            max_jitter = self._max_jitter
+            if not seq & 1 and seq == self._jitter_seq:
+                return jitter, max_jitter
+    
     def get_stats(self) -> JitterStats:
         """Retorna cópia das estatísticas."""
+        jitter, max_jitter = self._read_jitter()
         with self._lock:
             return JitterStats(
                 packets_received=self._stats.packets_received,
@@ -284,24 +556,32 @@ class JitterBuffer:
                 packets_duplicated=self._stats.packets_duplicated,
                 buffer_underruns=self._stats.buffer_underruns,
                 buffer_overflows=self._stats.buffer_overflows,
-                current_delay_ms=len(self._buffer) * self.packet_duration_ms,
-                average_jitter_ms=self._stats.average_jitter_ms,
-                max_jitter_ms=self._stats.max_jitter_ms,
-                current_buffer_size=len(self._buffer),
+                current_delay_ms=self._count * self.packet_duration_ms,
+                average_jitter_ms=(jitter >> 4) * self._ts_scale_ms,
+                max_jitter_ms=max_jitter * self._ts_scale_ms,
+                current_buffer_size=self._count,
+                playout_delay_ms=self._start_packets * self.packet_duration_ms,
             )
     
+    # Leituras sem lock: _count/_started só mudam sob o lock e leitura de
+    # int/bool é atômica no CPython (valor pode estar um pacote defasado)
+    
     @property
     def size(self) -> int:
         """Número de pacotes no buffer."""
-        with self._lock:
-            return len(self._buffer)
+        return self._count
     
     @property
     def delay_ms(self) -> float:
         """Delay atual em ms."""
         return self.size * self.packet_duration_ms
     
+    @property
+    def is_playing(self) -> bool:
+        """True se o playout foi iniciado (fora do warmup)."""
+        return self._started
+    
     @property
     def is_ready(self) -> bool:
         """True se buffer tem pacotes suficientes para playback."""
-        return self._started and self.size > 0
+        return self._started and self._count > 0
@@ -9,14 +9,38 @@ Referências:
 - openspec/changes/refactor-esl-rtp-bridge/design.md
 """
 
+import heapq
 import os
 import logging
 import threading
 import socket
-from typing import Optional, Set, Tuple
+import time
+from typing import Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Intervalo mínimo entre re-testes das portas em quarentena
+QUARANTINE_RECHECK_SECONDS = 60.0
+
+# Número de shards do pool: cada um com lock próprio, para que alocações
+# concorrentes (rajadas de chamadas) não serializem num único mutex
+DEFAULT_SHARDS = 8
+
+
+class _PortShard:
+    """Sub-faixa do pool com estado e lock próprios."""
+    
+    __slots__ = ("available", "in_use", "quarantine", "lock")
+    
+    def __init__(self, ports: List[int]):
+        # Min-heap: a menor porta livre sai em O(log n), sem ordenar
+        self.available: List[int] = list(ports)
+        heapq.heapify(self.available)
+        self.in_use: Set[int] = set()
+        # Portas ocupadas por outro processo (bind real falhou)
+        self.quarantine: Set[int] = set()
+        self.lock = threading.Lock()
+
 
 class PortPool:
     """
@@ -25,7 +49,11 @@ class PortPool:
     Por convenção, RTP usa portas pares e RTCP usa ímpares.
     Ex: RTP=10000, RTCP=10001
     
-    O pool gerencia alocação e liberação de portas.
+    O pool gerencia alocação e liberação de portas sem sondar bind a cada
+    alocação: se o bind real do chamador falhar, ele devolve a porta via
+    mark_in_use_externally() (quarentena, re-testada periodicamente). As portas são
+    divididas em shards contíguos; allocate() começa pelo shard "da casa"
+    (pela thread) e rouba dos seguintes quando ele está vazio.
     """
     
     def __init__(
@@ -33,12 +61,14 @@ class PortPool:
         start_port: int = 10000,
         end_port: int = 10100,
         bind_address: str = "0.0.0.0",
+        shards: int = DEFAULT_SHARDS,
     ):
         """
         Args:
             start_port: Primeira porta do range (deve ser par)
             end_port: Última porta do range
             bind_address: IP para bind dos sockets
+            shards: Número de sub-faixas com lock próprio
         """
         # Garantir que start é par
         if start_port % 2 != 0:
@@ -48,18 +78,25 @@ class PortPool:
         self.end_port = end_port
         self.bind_address = bind_address
         
-        # Portas disponíveis (apenas pares para RTP)
-        self._available: Set[int] = set(range(start_port, end_port, 2))
+        # Portas disponíveis (apenas pares para RTP), em faixas contíguas
+        rtp_ports = list(range(start_port, end_port, 2))
+        shard_count = max(1, min(shards, len(rtp_ports)))
+        stripe = -(-len(rtp_ports) // shard_count) if rtp_ports else 1
+        self._shards: List[_PortShard] = [
+            _PortShard(rtp_ports[i:i + stripe])
+            for i in range(0, max(len(rtp_ports), 1), stripe)
+        ]
         
-        # Portas em uso
-        self._in_use: Set[int] = set()
+        # Porta RTP → shard dono (roteia release())
+        self._shard_of: Dict[int, _PortShard] = {
+            port: shard for shard in self._shards for port in shard.available
+        }
         
-        # Lock para thread safety
-        self._lock = threading.Lock()
+        self._quarantine_checked_at = time.monotonic()
         
         logger.info(
             f"PortPool initialized: {start_port}-{end_port} "
-            f"({len(self._available)} ports available)"
+            f"({len(rtp_ports)} ports available, {len(self._shards)} shards)"
         )
     
     def allocate(self) -> Optional[Tuple[int, int]]:
@@ -69,28 +106,84 @@ class PortPool:
         Returns:
             Tuple (rtp_port, rtcp_port) ou None se não há portas
         """
-        with self._lock:
-            if not self._available:
-                logger.error("No ports available in pool")
+        shards = self._shards
+        home = threading.get_ident() % len(shards)
+        
+        if time.monotonic() - self._quarantine_checked_at >= QUARANTINE_RECHECK_SECONDS:
+            self._recheck_quarantine()
+        
+        for i in range(len(shards)):
+            shard = shards[(home + i) % len(shards)]
+            ports = self._allocate_from(shard)
+            if ports:
+                return ports
+        
+        logger.error("All ports are in use or unavailable")
+        return None
+    
+    def _allocate_from(self, shard: _PortShard) -> Optional[Tuple[int, int]]:
+        """Tenta alocar um par dentro de um shard."""
+        with shard.lock:
+            if not shard.available:
                 return None
             
-            # Tentar portas até encontrar uma que funcione
-            for rtp_port in sorted(self._available):
-                rtcp_port = rtp_port + 1
-                
-                # Verificar se podemos fazer bind
-                if self._can_bind(rtp_port) and self._can_bind(rtcp_port):
-                    self._available.remove(rtp_port)
-                    self._in_use.add(rtp_port)
-                    
-                    logger.debug(
-                        f"Allocated ports RTP={rtp_port}, RTCP={rtcp_port} "
-                        f"({len(self._available)} remaining)"
-                    )
-                    return (rtp_port, rtcp_port)
+            # Sem sondar bind: o bind real do chamador é o teste
+            rtp_port = heapq.heappop(shard.available)
+            shard.in_use.add(rtp_port)
+            
+            logger.debug(
+                f"Allocated ports RTP={rtp_port}, RTCP={rtp_port + 1} "
+                f"({len(shard.available)} remaining in shard)"
+            )
+            return (rtp_port, rtp_port + 1)
+    
+    def mark_in_use_externally(self, rtp_port: int) -> bool:
+        """
+        Move uma porta alocada para quarentena (bind real falhou: EADDRINUSE).
+        
+        O chamador deve alocar outro par em seguida. Portas em quarentena são
+        re-testadas a cada QUARANTINE_RECHECK_SECONDS e voltam ao pool se
+        estiverem livres.
+        
+        Returns:
+            True se a porta estava alocada e foi para quarentena
+        """
+        shard = self._shard_of.get(rtp_port)
+        if shard is None:
+            return False
+        
+        with shard.lock:
+            if rtp_port not in shard.in_use:
+                return False
+            shard.in_use.remove(rtp_port)
+            shard.quarantine.add(rtp_port)
+        
+        logger.warning(f"Port {rtp_port} in use by another process, quarantined")
+        return True
+    
+    def _recheck_quarantine(self) -> None:
+        """
+        Re-testa portas em quarentena e devolve as livres ao pool.
+        
+        Os binds de teste (syscalls) rodam sem o lock do shard: o lock só é
+        tomado para copiar a quarentena e para efetivar cada porta liberada.
+        """
+        self._quarantine_checked_at = time.monotonic()
+        
+        for shard in self._shards:
+            with shard.lock:
+                candidates = list(shard.quarantine)
             
-            logger.error("All ports are in use or unavailable")
-            return None
+            for rtp_port in candidates:
+                if not (self._can_bind(rtp_port) and self._can_bind(rtp_port + 1)):
+                    continue
+                with shard.lock:
+                    # Outra thread pode ter re-testado a mesma porta
+                    if rtp_port not in shard.quarantine:
+                        continue
+                    shard.quarantine.remove(rtp_port)
+                    heapq.heappush(shard.available, rtp_port)
+                logger.info(f"Port {rtp_port} released from quarantine")
     
     def release(self, rtp_port: int) -> bool:
         """
@@ -102,17 +195,23 @@ class PortPool:
         Returns:
             True se liberado, False se não estava alocado
         """
-        with self._lock:
-            if rtp_port not in self._in_use:
+        shard = self._shard_of.get(rtp_port)
+        if shard is None:
+            logger.warning(f"Port {rtp_port} not in use")
+            return False
+        
+        with shard.lock:
+            if rtp_port not in shard.in_use:
                 logger.warning(f"Port {rtp_port} not in use")
                 return False
             
-            self._in_use.remove(rtp_port)
-            self._available.add(rtp_port)
+            # in_use garante que a porta não está duplicada no heap
+            shard.in_use.remove(rtp_port)
+            heapq.heappush(shard.available, rtp_port)
             
             logger.debug(
                 f"Released port {rtp_port} "
-                f"({len(self._available)} available)"
+                f"({len(shard.available)} available in shard)"
             )
             return True
     
@@ -138,14 +237,20 @@ class PortPool:
     @property
     def available_count(self) -> int:
         """Número de portas disponíveis."""
-        with self._lock:
-            return len(self._available)
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.available)
+        return total
     
     @property
     def in_use_count(self) -> int:
         """Número de portas em uso."""
-        with self._lock:
-            return len(self._in_use)
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.in_use)
+        return total
     
     @property
     def total_ports(self) -> int:
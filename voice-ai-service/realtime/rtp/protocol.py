@@ -10,8 +10,8 @@ Referências:
 """
 
 import struct
-from dataclasses import dataclass, field
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple, Union
 import time
 
 
@@ -39,8 +39,20 @@ SAMPLE_RATES = {
     PayloadType.G729: 8000,
 }
 
+# Mesma tabela indexada por PT (0..127), 8kHz onde não há entrada
+_SAMPLE_RATE_TABLE = [SAMPLE_RATES.get(pt, 8000) for pt in range(128)]
 
-@dataclass
+
+# Cabeçalho fixo: V/P/X/CC, M/PT, sequence, timestamp, SSRC
+_HEADER_STRUCT = struct.Struct("!BBHII")
+# Mesmo cabeçalho para parse: os dois primeiros bytes como uma palavra de 16
+# bits (V/P/X/CC/M/PT extraídos com shift+máscara de um único int)
+_HEADER_WORDS_STRUCT = struct.Struct("!HHII")
+_EXT_HEADER_STRUCT = struct.Struct("!HH")
+_CSRC_STRUCT = struct.Struct("!I")
+
+
+@dataclass(slots=True)
 class RTPHeader:
     """
     Cabeçalho RTP (12 bytes mínimo).
@@ -65,7 +77,7 @@ class RTPHeader:
     sequence: int = 0      # Sequence number (0-65535)
     timestamp: int = 0     # Timestamp
     ssrc: int = 0          # Synchronization source ID
-    csrc: list = field(default_factory=list)  # Contributing source IDs
+    csrc: Tuple[int, ...] = ()  # Contributing source IDs (cc=0: sem alocar lista)
     
     # Extension header (se extension=True)
     extension_profile: int = 0
@@ -82,53 +94,50 @@ class RTPHeader:
         Returns:
             Tuple (RTPHeader, offset onde payload começa)
         """
-        if len(data) < 12:
-            raise ValueError(f"RTP packet too short: {len(data)} bytes")
+        length = len(data)
+        if length < 12:
+            raise ValueError(f"RTP packet too short: {length} bytes")
         
-        # Primeiro byte: V(2) P(1) X(1) CC(4)
-        byte0 = data[0]
-        version = (byte0 >> 6) & 0x03
-        padding = bool((byte0 >> 5) & 0x01)
-        extension = bool((byte0 >> 4) & 0x01)
-        cc = byte0 & 0x0F
+        # Cabeçalho fixo num único unpack_from (sem fatiar o buffer)
+        w, sequence, timestamp, ssrc = _HEADER_WORDS_STRUCT.unpack_from(data, 0)
         
+        # Palavra de 16 bits: V(2) P(1) X(1) CC(4) M(1) PT(7)
+        version = w >> 14
         if version != 2:
             raise ValueError(f"Unsupported RTP version: {version}")
-        
-        # Segundo byte: M(1) PT(7)
-        byte1 = data[1]
-        marker = bool((byte1 >> 7) & 0x01)
-        payload_type = byte1 & 0x7F
-        
-        # Sequence (2 bytes), Timestamp (4 bytes), SSRC (4 bytes)
-        sequence, timestamp, ssrc = struct.unpack("!HII", data[2:12])
+        padding = (w & 0x2000) != 0
+        extension = (w & 0x1000) != 0
+        cc = (w >> 8) & 0x0F
+        marker = (w & 0x80) != 0
+        payload_type = w & 0x7F
         
         offset = 12
         
         # Parse CSRCs se cc > 0
-        csrc = []
-        if cc > 0:
-            for i in range(cc):
-                csrc_id = struct.unpack("!I", data[offset:offset+4])[0]
-                csrc.append(csrc_id)
-                offset += 4
+        csrc: Tuple[int, ...] = ()
+        if cc:
+            end = offset + 4 * cc
+            if length < end:
+                raise ValueError("RTP CSRC list truncated")
+            csrc = tuple(c for (c,) in _CSRC_STRUCT.iter_unpack(data[offset:end]))
+            offset = end
         
         # Parse extension header se presente
         extension_profile = 0
         extension_data = b""
         
         if extension:
-            if len(data) < offset + 4:
+            if length < offset + 4:
                 raise ValueError("RTP extension header truncated")
             
-            extension_profile, ext_length = struct.unpack("!HH", data[offset:offset+4])
+            extension_profile, ext_length = _EXT_HEADER_STRUCT.unpack_from(data, offset)
             offset += 4
             
             ext_bytes = ext_length * 4
-            if len(data) < offset + ext_bytes:
+            if length < offset + ext_bytes:
                 raise ValueError("RTP extension data truncated")
             
-            extension_data = data[offset:offset+ext_bytes]
+            extension_data = bytes(data[offset:offset+ext_bytes])
             offset += ext_bytes
         
         header = cls(
@@ -161,9 +170,28 @@ class RTPHeader:
         # Byte 1
         byte1 = ((1 if self.marker else 0) << 7) | (self.payload_type & 0x7F)
         
+        csrc = self.csrc[:15]  # Max 15 CSRCs
+        has_ext = self.extension and self.extension_data
+        
+        # Caso comum (sem CSRCs/extension): um único pack
+        if not csrc and not has_ext:
+            return _HEADER_STRUCT.pack(
+                byte0,
+                byte1,
+                self.sequence & 0xFFFF,
+                self.timestamp & 0xFFFFFFFF,
+                self.ssrc & 0xFFFFFFFF,
+            )
+        
+        # Tamanho final conhecido: um bytearray e pack_into (sem += de bytes)
+        ext_length = (len(self.extension_data) + 3) // 4 if has_ext else 0  # Pad to 4 bytes
+        size = 12 + 4 * len(csrc) + (4 + ext_length * 4 if has_ext else 0)
+        buf = bytearray(size)
+        
         # Header básico
-        header = struct.pack(
-            "!BBHII",
+        _HEADER_STRUCT.pack_into(
+            buf,
+            0,
             byte0,
             byte1,
             self.sequence & 0xFFFF,
@@ -172,19 +200,21 @@ class RTPHeader:
         )
         
         # CSRCs
-        for csrc_id in self.csrc[:15]:  # Max 15 CSRCs
-            header += struct.pack("!I", csrc_id)
+        offset = 12
+        for csrc_id in csrc:
+            _CSRC_STRUCT.pack_into(buf, offset, csrc_id)
+            offset += 4
         
-        # Extension
-        if self.extension and self.extension_data:
-            ext_length = (len(self.extension_data) + 3) // 4  # Pad to 4 bytes
-            header += struct.pack("!HH", self.extension_profile, ext_length)
-            header += self.extension_data.ljust(ext_length * 4, b'\x00')
+        # Extension (padding já zerado pelo bytearray)
+        if has_ext:
+            _EXT_HEADER_STRUCT.pack_into(buf, offset, self.extension_profile, ext_length)
+            offset += 4
+            buf[offset:offset + len(self.extension_data)] = self.extension_data
         
-        return header
+        return bytes(buf)
 
 
-@dataclass
+@dataclass(slots=True)
 class RTPPacket:
     """
     Pacote RTP completo (header + payload).
@@ -226,6 +256,64 @@ class RTPPacket:
         return self.header.ssrc
 
 
+class RTPFrame(NamedTuple):
+    """
+    Visão enxuta de um pacote RTP recebido.
+    
+    Usada no caminho quente do RTPBridge: só os campos que o jitter buffer
+    e o consumidor usam, sem construir RTPHeader/lista de CSRCs.
+    Compatível por atributo com RTPPacket (sequence, timestamp, payload).
+    """
+    sequence: int
+    timestamp: int
+    marker: bool
+    payload_type: int
+    payload: bytes
+
+
+def parse_rtp_frame(data: Union[bytes, bytearray, memoryview]) -> RTPFrame:
+    """
+    Parse rápido de um pacote RTP para RTPFrame.
+    
+    Lê o cabeçalho fixo com um único Struct.unpack_from e fatia o payload
+    via memoryview (uma única cópia, para o bytes final).
+    
+    Raises:
+        ValueError: pacote curto, versão inválida ou extensão truncada
+    """
+    length = len(data)
+    if length < 12:
+        raise ValueError(f"RTP packet too short: {length} bytes")
+    
+    w, sequence, timestamp, _ssrc = _HEADER_WORDS_STRUCT.unpack_from(data, 0)
+    if w >> 14 != 2:
+        raise ValueError(f"Unsupported RTP version: {w >> 14}")
+    
+    # CSRCs são apenas pulados
+    offset = 12 + 4 * ((w >> 8) & 0x0F)
+    
+    if w & 0x1000:  # Extension
+        if length < offset + 4:
+            raise ValueError("RTP extension header truncated")
+        _profile, ext_length = _EXT_HEADER_STRUCT.unpack_from(data, offset)
+        offset += 4 + ext_length * 4
+    
+    end = length
+    if w & 0x2000 and end > offset:  # Padding
+        end -= data[end - 1]
+    
+    if offset > end:
+        raise ValueError("RTP packet truncated")
+    
+    return RTPFrame(
+        sequence,
+        timestamp,
+        (w & 0x80) != 0,
+        w & 0x7F,
+        bytes(memoryview(data)[offset:end]),
+    )
+
+
 class RTPPacketBuilder:
     """
     Builder para criar pacotes RTP em sequência.
@@ -246,7 +334,14 @@ class RTPPacketBuilder:
         """
         self.payload_type = payload_type
         self.ssrc = ssrc or self._generate_ssrc()
-        self.sample_rate = sample_rate or SAMPLE_RATES.get(payload_type, 8000)
+        self.sample_rate = sample_rate or _SAMPLE_RATE_TABLE[payload_type & 0x7F]
+        
+        # Samples de 20ms (default quando build não informa samples)
+        self._default_samples = self.sample_rate // 50
+        # Byte 1 do cabeçalho sem/com marker
+        self._pt_byte = self.payload_type & 0x7F
+        # Buffer de saída reutilizado por build_into()
+        self._out_buf = bytearray(_HEADER_STRUCT.size)
         
         self._sequence = 0
         self._timestamp = 0
@@ -287,21 +382,50 @@ class RTPPacketBuilder:
         )
         
         packet = RTPPacket(header=header, payload=payload)
+        self._advance(samples)
+        return packet
+    
+    def build_into(
+        self,
+        payload: bytes,
+        marker: bool = False,
+        samples: Optional[int] = None,
+    ) -> memoryview:
+        """
+        Constrói um pacote RTP serializado num bytearray do próprio builder
+        (caminho quente de envio).
         
+        Equivalente a build(...).to_bytes(), sem criar RTPHeader/RTPPacket
+        nem alocar bytes por pacote: o retorno é uma view válida apenas até
+        a próxima chamada (enviar imediatamente, não guardar).
+        """
+        size = _HEADER_STRUCT.size + len(payload)
+        buf = self._out_buf
+        if len(buf) != size:
+            buf = self._out_buf = bytearray(size)
+        
+        _HEADER_STRUCT.pack_into(
+            buf,
+            0,
+            0x80,  # V=2, sem padding/extension/CSRC
+            (0x80 | self._pt_byte) if marker else self._pt_byte,
+            self._sequence,
+            self._timestamp,
+            self.ssrc & 0xFFFFFFFF,
+        )
+        buf[_HEADER_STRUCT.size:] = payload
+        self._advance(samples)
+        return memoryview(buf)
+    
+    def _advance(self, samples: Optional[int]) -> None:
+        """Avança sequence e timestamp após um pacote."""
         # Incrementar sequence (wrap at 65536)
         self._sequence = (self._sequence + 1) & 0xFFFF
         
-        # Incrementar timestamp
-        if samples is not None:
-            self._timestamp += samples
-        else:
-            # Assumir 20ms de áudio
-            samples_per_20ms = self.sample_rate // 50
-            self._timestamp += samples_per_20ms
-        
-        self._timestamp &= 0xFFFFFFFF
-        
-        return packet
+        # Incrementar timestamp (assumir 20ms de áudio se não informado)
+        self._timestamp = (
+            self._timestamp + (samples if samples is not None else self._default_samples)
+        ) & 0xFFFFFFFF
     
     def reset(self) -> None:
         """Reseta sequence e timestamp."""
@@ -9,12 +9,13 @@ Referências:
 """
 
 import asyncio
+import collections
 import contextlib
-import base64
 import json
 import logging
 import os
 import time
+from binascii import b2a_base64
 from typing import Dict, List, Optional
 
 import websockets
@@ -22,6 +23,7 @@ from websockets.asyncio.server import ServerConnection, serve
 
 from .session import RealtimeSessionConfig
 from .session_manager import get_session_manager
+from .utils import json_codec
 from .utils.metrics import get_metrics
 from .config_loader import (
     get_config_loader,
@@ -36,6 +38,15 @@ from .handlers.time_condition_checker import (
 
 logger = logging.getLogger(__name__)
 
+# Atributo de estado de fechamento resolvido uma vez na importação:
+# a implementação asyncio (websockets >= 13) expõe close_code (None = aberta);
+# a legada expõe o booleano closed.
+_WS_USES_CLOSE_CODE = hasattr(ServerConnection, 'close_code')
+
+# Strings aceitas como verdadeiro / como "sem limite" nos campos do banco
+_TRUTHY = frozenset(('true', '1', 'yes', 't'))
+_UNLIMITED = frozenset(('inf', 'infinite', 'infinity', 'none', ''))
+
 
 def _parse_bool(value, default: bool = True) -> bool:
     """
@@ -58,7 +69,7 @@ def _parse_bool(value, default: bool = True) -> bool:
     if isinstance(value, int):
         return value != 0
     if isinstance(value, str):
-        return value.lower() in ('true', '1', 'yes', 't')
+        return value.lower() in _TRUTHY
     return default
 
 
@@ -83,7 +94,7 @@ def _parse_max_tokens(value, default: int = 4096) -> Optional[int]:
         return value
     if isinstance(value, str):
         value_lower = value.strip().lower()
-        if value_lower in ('inf', 'infinite', 'infinity', 'none', ''):
+        if value_lower in _UNLIMITED:
             return None  # OpenAI interpreta None como infinito
         try:
             return int(value_lower)
@@ -119,6 +130,12 @@ def _parse_guardrails_topics(value) -> Optional[List[str]]:
     return None
 
 
+# Cache de business_info recebido como str JSON (mesmo tenant → mesma string
+# a cada chamada). FIFO limitado; a string muda quando a config muda.
+_BUSINESS_INFO_CACHE_MAX = 256
+_business_info_cache: Dict[str, Dict[str, str]] = {}
+
+
 def _parse_business_info(value) -> Dict[str, str]:
     """
     Converte business_info do banco para dict.
@@ -140,15 +157,165 @@ def _parse_business_info(value) -> Dict[str, str]:
         return value
     
     if isinstance(value, str):
-        try:
-            parsed = json.loads(value)
-            return parsed if isinstance(parsed, dict) else {}
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        cached = _business_info_cache.get(value)
+        if cached is None:
+            try:
+                parsed = json_codec.loads(value)
+                cached = parsed if isinstance(parsed, dict) else {}
+            except (json.JSONDecodeError, TypeError):
+                cached = {}
+            if len(_business_info_cache) >= _BUSINESS_INFO_CACHE_MAX:
+                del _business_info_cache[next(iter(_business_info_cache))]
+            _business_info_cache[value] = cached
+        # Cópia rasa: o dict em cache não pode ser alterado pelo chamador
+        return dict(cached)
     
     return {}
 
 
+# Rótulos em português das chaves de business_info no prompt
+_BUSINESS_INFO_LABELS = {
+    "servicos": "Serviços",
+    "precos": "Preços/Planos",
+    "promocoes": "Promoções",
+    "horarios": "Horários",
+    "localizacao": "Endereço",
+    "contato": "Contato",
+    "sobre": "Sobre a empresa",
+    "geral": "Informações gerais",
+}
+
+
+def _derive_secretary_fields(row) -> Dict[str, object]:
+    """
+    Campos derivados só da linha da secretária (cacheados junto com ela).
+    
+    Returns:
+        Dict com business_info, business_info_text, handoff_keywords e
+        farewell_keywords (None = keywords padrão do RealtimeSession)
+    """
+    # Incluir business_info no prompt para evitar chamadas desnecessárias à tool
+    business_info = _parse_business_info(row.get("business_info"))
+    business_info_text = ""
+    if business_info:
+        business_info_text = (
+            "\n\n# Informações da Empresa (USE DIRETAMENTE, NÃO PRECISA CHAMAR get_business_info)\n"
+            + "".join(
+                f"- {_BUSINESS_INFO_LABELS.get(key) or key.title()}: {value}\n"
+                for key, value in business_info.items() if value
+            )
+        )
+    
+    # Parse handoff keywords from comma-separated string
+    handoff_keywords_str = row.get("handoff_keywords") or "atendente,humano,pessoa,operador"
+    handoff_keywords = [k.strip() for k in handoff_keywords_str.split(",") if k.strip()]
+    
+    # Parse farewell keywords from newline-separated string (configurável no frontend)
+    # Cada região pode ter gírias diferentes (falou, valeu, flw, vlw, etc)
+    farewell_keywords_str = row.get("farewell_keywords") or ""
+    if farewell_keywords_str:
+        # Keywords separadas por newline no frontend
+        farewell_keywords = [k.strip().lower() for k in farewell_keywords_str.split("\n") if k.strip()]
+    else:
+        # Fallback para keywords padrão
+        farewell_keywords = None  # Usará as keywords padrão no RealtimeSession
+    
+    return {
+        "business_info": business_info,
+        "business_info_text": business_info_text,
+        "handoff_keywords": handoff_keywords,
+        "farewell_keywords": farewell_keywords,
+        "guardrails_topics": _parse_guardrails_topics(row.get("guardrails_topics")),
+        "config_fields": _secretary_config_fields(row),
+    }
+
+
+def _secretary_config_fields(row) -> Dict[str, object]:
+    """
+    Argumentos de RealtimeSessionConfig que dependem só da linha da
+    secretária (já com SECRETARY_DEFAULTS aplicados).
+    
+    Convertidos uma vez por preenchimento do cache; os valores são imutáveis
+    (str/int/float/bool/None), então o mesmo dict serve a todas as chamadas.
+    """
+    ptt_rms = row.get("ptt_rms_threshold")
+    if ptt_rms is not None and int(ptt_rms) <= 0:
+        ptt_rms = None
+    ptt_hits = row.get("ptt_hits")
+    if ptt_hits is not None and int(ptt_hits) <= 0:
+        ptt_hits = None
+    
+    return {
+        "secretary_name": row["name"] or "Voice Secretary",
+        "company_name": row.get("company_name"),
+        "provider_name": row["provider_name"] or "elevenlabs_conversational",
+        "greeting": row["greeting"],
+        "farewell": row["farewell"],
+        "voice_id": row.get("tts_voice_id"),  # ElevenLabs voice_id para anúncios de transferência
+        "omniplay_webhook_url": row.get("omniplay_webhook_url"),
+        # Handoff OmniPlay config
+        "handoff_enabled": _parse_bool(row.get("handoff_enabled"), default=True),
+        "handoff_timeout_ms": int(row.get("handoff_timeout") or 30) * 1000,  # seconds to ms
+        "handoff_max_ai_turns": int(row.get("max_turns") or 20),
+        "handoff_queue_id": row.get("handoff_queue_id"),
+        "handoff_tool_fallback_enabled": _parse_bool(row.get("handoff_tool_fallback_enabled"), default=True),
+        "handoff_tool_timeout_seconds": int(row.get("handoff_tool_timeout_seconds") or 3),
+        "omniplay_company_id": row.get("omniplay_company_id"),
+        # Fallback Configuration (from database)
+        "fallback_ticket_enabled": _parse_bool(row.get("fallback_ticket_enabled"), default=True),
+        "fallback_action": row.get("fallback_action") or "ticket",
+        "fallback_user_id": row.get("fallback_user_id"),
+        "fallback_priority": row.get("fallback_priority") or "medium",
+        "fallback_notify_enabled": _parse_bool(row.get("fallback_notify_enabled"), default=True),
+        "presence_check_enabled": _parse_bool(row.get("presence_check_enabled"), default=True),
+        # Audio Configuration
+        "audio_warmup_chunks": int(row.get("audio_warmup_chunks") or 30),  # AUMENTADO 2026-01-25
+        "audio_warmup_ms": int(row.get("audio_warmup_ms") or 600),  # AUMENTADO 2026-01-25
+        "audio_adaptive_warmup": _parse_bool(row.get("audio_adaptive_warmup"), default=True),
+        "jitter_buffer_min": int(row.get("jitter_buffer_min") or 100),
+        "jitter_buffer_max": int(row.get("jitter_buffer_max") or 300),
+        "jitter_buffer_step": int(row.get("jitter_buffer_step") or 40),
+        "stream_buffer_size": int(row.get("stream_buffer_size") or 20),  # 20ms default
+        # Call Timeouts (from database)
+        "idle_timeout_seconds": int(row.get("idle_timeout_seconds") or 30),
+        "max_duration_seconds": int(row.get("max_duration_seconds") or 600),
+        # Input Normalization
+        "input_normalize_enabled": _parse_bool(row.get("input_normalize_enabled"), default=False),
+        "input_target_rms": int(row.get("input_target_rms") or 2000),
+        "input_min_rms": int(row.get("input_min_rms") or 300),
+        "input_max_gain": float(row.get("input_max_gain") or 3.0),
+        # Call State logging/metrics
+        "call_state_log_enabled": _parse_bool(row.get("call_state_log_enabled"), default=True),
+        "call_state_metrics_enabled": _parse_bool(row.get("call_state_metrics_enabled"), default=True),
+        # Unbridge behavior
+        "unbridge_behavior": row.get("unbridge_behavior") or "hangup",
+        "unbridge_resume_message": row.get("unbridge_resume_message"),
+        # Hold return message
+        "hold_return_message": row.get("hold_return_message") or "Obrigado por aguardar.",
+        # Silence Fallback
+        "silence_fallback_enabled": _parse_bool(row.get("silence_fallback_enabled"), default=False),
+        "silence_fallback_seconds": int(row.get("silence_fallback_seconds") or 10),
+        "silence_fallback_action": row.get("silence_fallback_action") or "reprompt",
+        "silence_fallback_prompt": row.get("silence_fallback_prompt"),
+        "silence_fallback_max_retries": int(row.get("silence_fallback_max_retries") or 2),
+        # VAD Configuration (migration 023)
+        "vad_type": row.get("vad_type") or "semantic_vad",
+        "vad_eagerness": row.get("vad_eagerness") or "high",
+        # Guardrails Configuration (migration 023)
+        "guardrails_enabled": _parse_bool(row.get("guardrails_enabled"), default=True),
+        # Transfer Mode Configuration (migrations 013, 022)
+        "transfer_announce_enabled": _parse_bool(row.get("transfer_announce_enabled"), default=True),
+        "transfer_realtime_enabled": _parse_bool(row.get("transfer_realtime_enabled"), default=False),
+        "transfer_realtime_prompt": row.get("transfer_realtime_prompt"),
+        "transfer_realtime_timeout": float(row.get("transfer_realtime_timeout") or 15),
+        # Announcement TTS Provider (migration 023)
+        "announcement_tts_provider": row.get("announcement_tts_provider") or "elevenlabs",
+        # Push-to-talk tuning
+        "ptt_rms_threshold": ptt_rms,
+        "ptt_hits": ptt_hits,
+    }
+
+
 # 20ms @ 16kHz PCM16 mono:
 # 16000 samples/sec * 2 bytes/sample = 32000 bytes/sec
 # 20ms => 640 bytes
@@ -162,8 +329,95 @@ PCM16_CHUNK_MS = 20
 # IMPORTANTE: Frames muito pequenos causam áudio picotado (gaps entre playbacks)
 # Recomendado: 1000ms+ para evitar stuttering
 STREAMAUDIO_FRAME_MS = int(os.getenv("FS_STREAMAUDIO_FRAME_MS", "1000"))
+
+# Modo de playback no FreeSWITCH (lido uma vez, não a cada conexão)
+FS_PLAYBACK_MODE = os.getenv("FS_PLAYBACK_MODE", "rawAudio").lower()
+FS_STREAMAUDIO_FALLBACK = _parse_bool(os.getenv("FS_STREAMAUDIO_FALLBACK"), default=True)
 STREAMAUDIO_FRAME_BYTES = PCM16_16K_CHUNK_BYTES * max(1, STREAMAUDIO_FRAME_MS // 20)
 
+# Granularidade da fila de playback: frames de 20ms agrupados em blocos de
+# N ms antes de entrar na fila (menos put/get e itens por segundo de fala).
+# O sender loop continua acumulando até o batch de envio.
+FS_SEND_COALESCE_MS = int(os.getenv("FS_SEND_COALESCE_MS", "40"))
+
+# streamAudio como mensagem fragmentada (prefixo, base64, sufixo em frames de
+# continuação) em vez de concatenar o JSON. Desligado por padrão: só ativar
+# com um mod_audio_stream validado para remontar frames de texto fragmentados.
+FS_STREAMAUDIO_FRAGMENTED = _parse_bool(os.getenv("FS_STREAMAUDIO_FRAGMENTED"), default=False)
+
+# Tools de transferência montadas uma vez; as definições são compartilhadas
+# entre sessões (como as *_FUNCTION_DEFINITION de session.py) e não são
+# alteradas depois de entregues ao provider
+_TRANSFER_TOOLS_SCHEMA = tuple(build_transfer_tools_schema())
+
+# Defaults de sessão vindos do ambiente (lidos uma vez na importação;
+# provider_config do banco continua podendo sobrescrever por chamada)
+REALTIME_VAD_THRESHOLD = float(os.getenv("REALTIME_VAD_THRESHOLD", "0.65"))
+REALTIME_SILENCE_MS = int(os.getenv("REALTIME_SILENCE_MS", "900"))
+REALTIME_PREFIX_PADDING_MS = int(os.getenv("REALTIME_PREFIX_PADDING_MS", "300"))
+REALTIME_MAX_OUTPUT_TOKENS = _parse_max_tokens(os.getenv("REALTIME_MAX_OUTPUT_TOKENS", "4096"))
+REALTIME_VOICE = os.getenv("REALTIME_VOICE", "").strip()
+REALTIME_FALLBACK_PROVIDERS = os.getenv("REALTIME_FALLBACK_PROVIDERS", "").strip()
+REALTIME_BARGE_IN = _parse_bool(os.getenv("REALTIME_BARGE_IN"), default=True)
+AUDIO_MODE = os.getenv("AUDIO_MODE", "websocket").lower()
+
+# Defaults das colunas anuláveis de v_voice_secretaries (aplicados em Python
+# sobre NULL, no lugar de COALESCE no SELECT). business_info NULL já vira {}
+# em _parse_business_info.
+SECRETARY_DEFAULTS = {
+    "fallback_action": "ticket",
+    "fallback_priority": "medium",
+    "fallback_notify_enabled": True,
+    "handoff_enabled": True,
+    "handoff_timeout": 30,
+    "handoff_keywords": "atendente,humano,pessoa,operador",
+    "handoff_tool_fallback_enabled": True,
+    "handoff_tool_timeout_seconds": 3,
+    "fallback_ticket_enabled": True,
+    "presence_check_enabled": True,
+    "audio_warmup_chunks": 30,
+    "audio_warmup_ms": 600,
+    "audio_adaptive_warmup": True,
+    "jitter_buffer_min": 100,
+    "jitter_buffer_max": 300,
+    "jitter_buffer_step": 40,
+    "stream_buffer_size": 20,  # 20ms default (NOT samples!)
+    "idle_timeout_seconds": 30,
+    "max_duration_seconds": 600,
+    "input_normalize_enabled": False,
+    "input_target_rms": 2000,
+    "input_min_rms": 300,
+    "input_max_gain": 3.0,
+    "call_state_log_enabled": True,
+    "call_state_metrics_enabled": True,
+    "unbridge_behavior": "hangup",
+    "hold_return_message": "Obrigado por aguardar.",
+    "silence_fallback_enabled": False,
+    "silence_fallback_seconds": 10,
+    "silence_fallback_action": "reprompt",
+    "silence_fallback_max_retries": 2,
+    "vad_type": "semantic_vad",
+    "vad_eagerness": "high",
+    "guardrails_enabled": True,
+    "announcement_tts_provider": "elevenlabs",
+    "transfer_announce_enabled": True,
+    "transfer_realtime_enabled": False,
+    "transfer_realtime_timeout": 15,
+}
+
+# Cache da linha da secretária (+ provider_config parseado) por UUID: chamadas
+# em rajada não repetem o SELECT. 0 desativa. Não há invalidação: edições ou
+# desativação da secretária/provider valem para novas chamadas em até TTL s.
+SECRETARY_CACHE_TTL = float(os.getenv("SECRETARY_CACHE_TTL", "30"))
+SECRETARY_CACHE_MAX = 1000
+
+# Sentinelas de controle da fila de playback (comparadas por identidade)
+_PLAYBACK_STOP = object()
+_PLAYBACK_FLUSH = object()
+
+# Frames de entrada acumulados antes de publicar métricas (~1s com frames de 20ms)
+IN_METRICS_FLUSH_CHUNKS = 50
+
 
 class RealtimeServer:
     """
@@ -185,6 +439,9 @@ class RealtimeServer:
         self.db_pool = db_pool
         self._server = None
         self._running = False
+        # secretary_uuid -> (expira_em, row, provider_config, derived)
+        self._secretary_cache: Dict[str, tuple] = {}
+        self._secretary_locks: Dict[str, asyncio.Lock] = {}
     
     async def start(self) -> None:
         """Inicia o servidor WebSocket."""
@@ -250,15 +507,17 @@ class RealtimeServer:
         
         # Parsear path: /stream/{secretary_uuid}/{call_uuid}/{caller_id}
         # caller_id é opcional para compatibilidade com versões antigas
-        parts = path.strip("/").split("/")
-        if len(parts) < 3 or parts[0] != "stream":
+        # partition() em vez de split(): sem lista intermediária e rejeita
+        # prefixo inválido logo no primeiro segmento
+        head, _, rest = path.strip("/").partition("/")
+        secretary_uuid, sep, rest = rest.partition("/")
+        if head != "stream" or not sep:
             logger.warning(f"Invalid path: {path}")
             await websocket.close(1008, "Invalid path")
             return
         
-        secretary_uuid = parts[1]
-        call_uuid = parts[2]
-        caller_id = parts[3] if len(parts) > 3 else "unknown"
+        call_uuid, sep, rest = rest.partition("/")
+        caller_id = rest.partition("/")[0] if sep else "unknown"
         
         # Log estruturado conforme backend-specialist.md
         logger.info("WebSocket connection received", extra={
@@ -287,7 +546,23 @@ class RealtimeServer:
     ) -> None:
         """Gerencia uma sessão de chamada."""
         manager = get_session_manager()
+        # extra de log fixo da conexão (o logging só lê o dict)
+        log_extra = {"call_uuid": call_uuid}
+        # Métricas de entrada acumuladas localmente e publicadas em lote
+        # (a cada IN_METRICS_FLUSH_CHUNKS frames) em vez de 50x/s por chamada
         metrics = get_metrics()
+        record_audio = metrics.record_audio
+        in_chunks_pending = 0
+        in_bytes_pending = 0
+
+        def _flush_in_metrics() -> None:
+            nonlocal in_chunks_pending, in_bytes_pending
+            if in_chunks_pending:
+                try:
+                    record_audio(call_uuid, "in", in_bytes_pending, in_chunks_pending)
+                except Exception:
+                    pass
+                in_chunks_pending = in_bytes_pending = 0
         session = None
         cleanup_playback = None
 
@@ -340,15 +615,20 @@ class RealtimeServer:
         audio_bytes_total = 0
         last_message_time = asyncio.get_event_loop().time()
         
+        # Qualquer session.stop (hangup, end_call, timeouts) publica o lote
+        # pendente antes de encerrar as métricas da sessão
+        metrics.register_audio_flush(call_uuid, _flush_in_metrics)
         try:
             # Verificar estado do WebSocket antes de entrar no loop
-            # Nota: websockets >= 12.0 usa close_code ao invés de closed
-            ws_closed = getattr(websocket, 'closed', None) or getattr(websocket, 'close_code', None) is not None
+            if _WS_USES_CLOSE_CODE:
+                ws_closed = websocket.close_code is not None
+            else:
+                ws_closed = websocket.closed
             if ws_closed:
-                logger.error("WebSocket already closed before message loop!", extra={"call_uuid": call_uuid})
+                logger.error("WebSocket already closed before message loop!", extra=log_extra)
                 return
             
-            logger.debug(f"WebSocket ready for messages", extra={"call_uuid": call_uuid})
+            logger.debug(f"WebSocket ready for messages", extra=log_extra)
             
             async for message in websocket:
                 message_count += 1
@@ -362,10 +642,10 @@ class RealtimeServer:
                 # Processar mensagens
                 if isinstance(message, bytes):
                     audio_bytes_total += len(message)
-                    try:
-                        metrics.record_audio(call_uuid, "in", len(message))
-                    except Exception:
-                        pass
+                    in_chunks_pending += 1
+                    in_bytes_pending += len(message)
+                    if in_chunks_pending >= IN_METRICS_FLUSH_CHUNKS:
+                        _flush_in_metrics()
                     # Áudio binário do FreeSWITCH
                     if session and session.is_active:
                         await session.handle_audio_input(message)
@@ -379,7 +659,7 @@ class RealtimeServer:
                 elif isinstance(message, str):
                     # Comando de texto (metadata ou comandos)
                     try:
-                        data = json.loads(message)
+                        data = json_codec.loads(message)
                         msg_type = data.get("type")
                         
                         if msg_type == "metadata":
@@ -391,20 +671,23 @@ class RealtimeServer:
                             })
                         
                         elif msg_type == "dtmf":
-                            logger.debug(f"DTMF: {data.get('digit')}", extra={"call_uuid": call_uuid})
+                            logger.debug(f"DTMF: {data.get('digit')}", extra=log_extra)
                         
                         elif msg_type == "hangup":
-                            logger.info("Hangup received", extra={"call_uuid": call_uuid})
+                            logger.info("Hangup received", extra=log_extra)
                             if session:
                                 await session.stop("hangup")
                             break
                     except json.JSONDecodeError:
-                        logger.warning(f"Invalid JSON message: {message[:100]}", extra={"call_uuid": call_uuid})
+                        logger.warning(f"Invalid JSON message: {message[:100]}", extra=log_extra)
         
         except websockets.exceptions.ConnectionClosed as e:
-            logger.info(f"WebSocket closed: {e}", extra={"call_uuid": call_uuid})
+            logger.info(f"WebSocket closed: {e}", extra=log_extra)
         
         finally:
+            _flush_in_metrics()
+            metrics.unregister_audio_flush(call_uuid, _flush_in_metrics)
+
             # Log de estatísticas finais
             logger.info(f"Session ended - Stats: {message_count} messages, {audio_bytes_total} audio bytes", extra={
                 "call_uuid": call_uuid,
@@ -419,7 +702,7 @@ class RealtimeServer:
                 if getattr(session, "in_transfer", False):
                     logger.warning(
                         "WebSocket closed during transfer/handoff - mantendo sessão ativa",
-                        extra={"call_uuid": call_uuid}
+                        extra=log_extra
                     )
                 else:
                     await session.stop("connection_closed")
@@ -433,22 +716,29 @@ class RealtimeServer:
         Cria handlers de áudio ligados a uma conexão WS específica.
         Usado tanto na criação da sessão quanto em reconexões.
         """
-        audio_out_queue: asyncio.Queue[Optional[tuple[int, bytes]]] = asyncio.Queue()
+        # extra de log fixo da conexão (o logging só lê o dict)
+        log_extra = {"call_uuid": call_uuid}
+
+        # Fila produtor único → sender task (mesmo event loop): deque + Event,
+        # sem os futures/locks de asyncio.Queue a cada bloco
+        audio_out: collections.deque = collections.deque()
+        audio_out_ready = asyncio.Event()
         pending = bytearray()
         sender_task: Optional[asyncio.Task] = None
         cleanup_started = False
         format_sent = False
         playback_generation = 0
         playback_lock = asyncio.Lock()
-        playback_mode = os.getenv("FS_PLAYBACK_MODE", "rawAudio").lower()
-        allow_streamaudio_fallback = os.getenv("FS_STREAMAUDIO_FALLBACK", "true").lower() in ("1", "true", "yes")
+        playback_mode = FS_PLAYBACK_MODE
+        allow_streamaudio_fallback = FS_STREAMAUDIO_FALLBACK
 
         # Determinar sample rate e chunk size para OUTPUT
         fs_sample_rate = 8000
-        fs_chunk_size = 320   # L16: 8000 samples/s * 0.020s * 2 bytes/sample
+        fs_bytes_per_ms = fs_sample_rate * 2 // 1000  # L16: 16 bytes/ms @ 8kHz
+        fs_chunk_size = fs_bytes_per_ms * PCM16_CHUNK_MS  # 320B por frame de 20ms
         logger.info(
             f"Audio output format: L16 PCM @ {fs_sample_rate}Hz, {fs_chunk_size}B/chunk",
-            extra={"call_uuid": call_uuid}
+            extra=log_extra
         )
 
         # Forçar streamAudio para compatibilidade
@@ -456,56 +746,99 @@ class RealtimeServer:
             playback_mode = "streamaudio"
         playback_mode = "streamaudio"
 
+        # Bloco enfileirado por put (múltiplo do frame de 20ms)
+        queue_chunk_size = fs_chunk_size * max(1, FS_SEND_COALESCE_MS // PCM16_CHUNK_MS)
+
         # Calcular tamanho do frame streamAudio
         streamaudio_frame_bytes = int(fs_sample_rate * 2 * STREAMAUDIO_FRAME_MS / 1000)
         logger.info(
             f"Playback mode: {playback_mode}, frame_size: {streamaudio_frame_bytes}B ({STREAMAUDIO_FRAME_MS}ms)",
-            extra={"call_uuid": call_uuid}
+            extra=log_extra
         )
 
+        def _enqueue(item) -> None:
+            audio_out.append(item)
+            audio_out_ready.set()
+
+        async def _next_item():
+            while not audio_out:
+                audio_out_ready.clear()
+                await audio_out_ready.wait()
+            return audio_out.popleft()
+
         async def _send_rawaudio_header() -> bool:
             nonlocal format_sent
             if format_sent:
                 return True
             try:
-                format_msg = json.dumps({
-                    "type": "rawAudio",
-                    "data": {"sampleRate": fs_sample_rate}
-                })
-                await websocket.send(format_msg)
+                await websocket.send(rawaudio_header)
                 format_sent = True
                 logger.info(
                     f"Audio format sent to FreeSWITCH (rawAudio @ {fs_sample_rate}Hz)",
-                    extra={"call_uuid": call_uuid}
+                    extra=log_extra
                 )
                 return True
             except Exception as e:
-                logger.warning(f"Failed to send rawAudio header: {e}", extra={"call_uuid": call_uuid})
+                logger.warning(f"Failed to send rawAudio header: {e}", extra=log_extra)
                 return False
 
         _metrics = get_metrics()
+        _record_audio = _metrics.record_audio
+
+        # Envelope streamAudio fixo por conexão: só o base64 muda a cada frame,
+        # então o JSON é montado por concatenação (sem json.dumps/dict por frame).
+        # Base64 não tem caracteres que precisem de escape em string JSON.
+        # str (não bytes): mod_audio_stream espera frame de TEXTO.
+        streamaudio_prefix = (
+            '{"type":"streamAudio","data":{"audioDataType":"raw",'
+            f'"sampleRate":{fs_sample_rate},"audioData":"'
+        )
+        streamaudio_suffix = '"}}'
 
-        async def _send_streamaudio_chunk(chunk_bytes: bytes) -> None:
-            payload = json.dumps({
-                "type": "streamAudio",
-                "data": {
-                    "audioDataType": "raw",
-                    "sampleRate": fs_sample_rate,
-                    "audioData": base64.b64encode(chunk_bytes).decode("utf-8"),
-                }
-            })
-            await websocket.send(payload)
-            try:
-                _metrics.record_audio(call_uuid, "out", len(chunk_bytes))
-            except Exception:
-                pass
+        # Mensagens de controle constantes por conexão
+        rawaudio_header = json_codec.dumps({
+            "type": "rawAudio",
+            "data": {"sampleRate": fs_sample_rate},
+        })
+        stop_audio_msg = json_codec.dumps({"type": "stopAudio"})
+
+        # Métricas de saída acumuladas e publicadas no tick de 1s do sender loop
+        out_chunks_pending = 0
+        out_bytes_pending = 0
+
+        def _flush_out_metrics() -> None:
+            nonlocal out_chunks_pending, out_bytes_pending
+            if out_chunks_pending:
+                try:
+                    _record_audio(call_uuid, "out", out_bytes_pending, out_chunks_pending)
+                except Exception:
+                    pass
+                out_chunks_pending = out_bytes_pending = 0
+
+        # Publicado por session_ended se a sessão encerrar antes do sender
+        _metrics.register_audio_flush(call_uuid, _flush_out_metrics)
+
+        async def _send_streamaudio_chunk(chunk_bytes) -> None:
+            # Aceita bytes ou bytearray: o base64 é gerado antes do await,
+            # então o chamador pode limpar/reutilizar o buffer em seguida
+            nonlocal out_chunks_pending, out_bytes_pending
+            nbytes = len(chunk_bytes)
+            audio_b64 = b2a_base64(chunk_bytes, newline=False).decode("ascii")
+            if FS_STREAMAUDIO_FRAGMENTED:
+                # Iterável de str: websockets envia uma mensagem de texto
+                # fragmentada, sem montar o JSON completo
+                await websocket.send((streamaudio_prefix, audio_b64, streamaudio_suffix))
+            else:
+                await websocket.send(streamaudio_prefix + audio_b64 + streamaudio_suffix)
+            out_chunks_pending += 1
+            out_bytes_pending += nbytes
 
         async def _send_stop_audio() -> None:
             try:
-                await websocket.send(json.dumps({"type": "stopAudio"}))
-                logger.info("StopAudio sent to FreeSWITCH (barge-in)", extra={"call_uuid": call_uuid})
+                await websocket.send(stop_audio_msg)
+                logger.info("StopAudio sent to FreeSWITCH (barge-in)", extra=log_extra)
             except Exception as e:
-                logger.warning(f"Failed to send stopAudio: {e}", extra={"call_uuid": call_uuid})
+                logger.warning(f"Failed to send stopAudio: {e}", extra=log_extra)
 
         async def _sender_loop_rawaudio() -> None:
             nonlocal playback_mode
@@ -525,72 +858,76 @@ class RealtimeServer:
                 # - AudioBuffer faz warmup de 600ms
                 # - Este sender faz warmup de apenas 200ms (evitar micro-chunks)
                 # - Total: ~800ms antes do primeiro envio (vs 1000ms se ambos fossem 600ms)
-                warmup_bytes = 3200  # 200ms @ 8kHz L16 (evita micro-chunks iniciais)
-                batch_bytes = 3200   # 200ms @ 8kHz L16 (melhor pacing)
-                batch_duration_ms = 200.0  # 200ms entre envios
+                #
+                # Derivados do formato de saída uma vez por conexão (3200B @ 8kHz)
+                warmup_bytes = fs_bytes_per_ms * 200  # 200ms (evita micro-chunks iniciais)
+                batch_bytes = fs_bytes_per_ms * 200   # 200ms (melhor pacing)
+                batch_duration_s = 0.2  # 200ms entre envios
+
+                # Relógio monotônico para o pacing (time.time pode saltar com NTP)
+                monotonic = time.monotonic
+                get_item = _next_item
 
                 while True:
-                    item = await audio_out_queue.get()
+                    item = await get_item()
                     if item is None:
                         if batch_buffer:
-                            await _send_streamaudio_chunk(bytes(batch_buffer))
+                            await _send_streamaudio_chunk(batch_buffer)
                         return
 
-                    if isinstance(item[0], str) and item[0] == "STOP":
-                        batch_buffer.clear()
-                        warmup_complete = False
-                        last_send_time = 0.0
-                        await _send_stop_audio()
-                        continue
-
-                    if isinstance(item[0], str) and item[0] == "FLUSH":
-                        if batch_buffer:
+                    # Itens: (geração, chunk) ou (_PLAYBACK_STOP|_PLAYBACK_FLUSH, geração)
+                    tag, chunk = item
+                    if tag.__class__ is not int:
+                        if tag is _PLAYBACK_STOP:
+                            batch_buffer.clear()
+                            warmup_complete = False
+                            last_send_time = 0.0
+                            await _send_stop_audio()
+                        elif tag is _PLAYBACK_FLUSH and batch_buffer:
                             remaining_bytes = len(batch_buffer)
-                            await _send_streamaudio_chunk(bytes(batch_buffer))
+                            await _send_streamaudio_chunk(batch_buffer)
 
-                            remaining_duration_ms = (remaining_bytes / 16.0) + 50
+                            remaining_duration_ms = (remaining_bytes / fs_bytes_per_ms) + 50
                             logger.debug(
                                 f"FLUSH: sent {remaining_bytes} bytes, waiting {remaining_duration_ms:.0f}ms tail buffer",
-                                extra={"call_uuid": call_uuid}
+                                extra=log_extra
                             )
                             await asyncio.sleep(remaining_duration_ms / 1000.0)
                             batch_buffer.clear()
                         continue
 
-                    generation, chunk = item
-                    if generation != playback_generation:
+                    if tag != playback_generation:
                         continue
 
                     batch_buffer.extend(chunk)
+                    buffered = len(batch_buffer)
 
                     if not warmup_complete:
-                        if len(batch_buffer) >= warmup_bytes:
-                            warmup_complete = True
-                            last_send_time = time.time()
-                            logger.info(
-                                f"Streaming warmup complete ({len(batch_buffer)} bytes)",
-                                extra={"call_uuid": call_uuid}
-                            )
-                        else:
+                        if buffered < warmup_bytes:
                             continue
-
-                    if len(batch_buffer) >= batch_bytes:
-                        now = time.time()
-                        elapsed_ms = (now - last_send_time) * 1000
-                        if elapsed_ms < batch_duration_ms:
-                            wait_ms = batch_duration_ms - elapsed_ms
-                            await asyncio.sleep(wait_ms / 1000.0)
-
-                        await _send_streamaudio_chunk(bytes(batch_buffer))
-                        last_send_time = time.time()
+                        warmup_complete = True
+                        last_send_time = monotonic()
+                        logger.info(
+                            f"Streaming warmup complete ({buffered} bytes)",
+                            extra=log_extra
+                        )
+
+                    now = monotonic()
+                    if buffered >= batch_bytes:
+                        wait_s = batch_duration_s - (now - last_send_time)
+                        if wait_s > 0:
+                            await asyncio.sleep(wait_s)
+
+                        await _send_streamaudio_chunk(batch_buffer)
+                        now = last_send_time = monotonic()
                         chunks_sent += 1
                         batch_buffer.clear()
 
                         if chunks_sent == 1:
-                            logger.info("Streaming playback started", extra={"call_uuid": call_uuid})
+                            logger.info("Streaming playback started", extra=log_extra)
 
-                    now = time.time()
                     if now - last_health_update >= 1.0:
+                        _flush_out_metrics()
                         session_metrics = _metrics.get_session_metrics(call_uuid)
                         if session_metrics:
                             health_score = 100.0 - min(30.0, session_metrics.avg_latency_ms / 50.0)
@@ -598,41 +935,48 @@ class RealtimeServer:
                         last_health_update = now
 
             except asyncio.CancelledError:
-                logger.debug("Playback sender loop cancelled", extra={"call_uuid": call_uuid})
+                logger.debug("Playback sender loop cancelled", extra=log_extra)
             except websockets.exceptions.ConnectionClosed:
-                logger.debug("WebSocket closed during audio playback", extra={"call_uuid": call_uuid})
+                logger.debug("WebSocket closed during audio playback", extra=log_extra)
             except Exception as e:
                 logger.error(
                     f"Error in FreeSWITCH playback sender loop: {e}",
                     exc_info=True,
-                    extra={"call_uuid": call_uuid},
+                    extra=log_extra,
                 )
+            finally:
+                _flush_out_metrics()
 
         async def send_audio(audio_bytes: bytes):
-            nonlocal sender_task
+            nonlocal audio_started
             try:
                 if not audio_bytes:
                     return
 
-                if sender_task is None:
-                    sender_task = asyncio.create_task(_sender_loop_rawaudio())
-                    logger.info(
-                        f"FreeSWITCH playback sender started (mode={playback_mode})",
-                        extra={"call_uuid": call_uuid}
-                    )
-
+                audio_started = True
                 pending.extend(audio_bytes)
 
-                while len(pending) >= fs_chunk_size:
-                    chunk = bytes(pending[:fs_chunk_size])
-                    del pending[:fs_chunk_size]
-                    await audio_out_queue.put((playback_generation, chunk))
+                # Fatiar todos os blocos completos via memoryview e remover do
+                # início de pending com um único del (um memmove por chamada)
+                ready = len(pending) - len(pending) % queue_chunk_size
+                if not ready:
+                    return
+                with memoryview(pending) as view:
+                    chunks = [
+                        view[i:i + queue_chunk_size].tobytes()
+                        for i in range(0, ready, queue_chunk_size)
+                    ]
+                del pending[:ready]
+
+                generation = playback_generation
+                for chunk in chunks:
+                    _enqueue((generation, chunk))
 
             except Exception as e:
                 logger.error(
                     f"Error queueing audio for FreeSWITCH (rawAudio): {e}",
                     exc_info=True,
-                    extra={"call_uuid": call_uuid},
+                    extra=log_extra,
                 )
 
         async def clear_playback(_: str) -> None:
@@ -640,30 +984,30 @@ class RealtimeServer:
             async with playback_lock:
                 playback_generation += 1
                 pending.clear()
-                try:
-                    while True:
-                        audio_out_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                if sender_task is not None:
-                    await audio_out_queue.put(("STOP", playback_generation))
+                audio_out.clear()
+                if audio_started:
+                    _enqueue((_PLAYBACK_STOP, playback_generation))
 
         async def flush_audio():
-            await audio_out_queue.put(("FLUSH", playback_generation))
+            # Frames completos ainda retidos pela coalescência vão antes do FLUSH
+            tail = len(pending) - len(pending) % fs_chunk_size
+            if tail:
+                chunk = bytes(pending[:tail])
+                del pending[:tail]
+                _enqueue((playback_generation, chunk))
+            _enqueue((_PLAYBACK_FLUSH, playback_generation))
 
         async def cleanup_playback() -> None:
             nonlocal sender_task, cleanup_started
             if cleanup_started:
                 return
             cleanup_started = True
+            _metrics.unregister_audio_flush(call_uuid, _flush_out_metrics)
 
             if sender_task is None:
                 return
 
-            try:
-                await audio_out_queue.put(None)
-            except Exception:
-                pass
+            _enqueue(None)
 
             try:
                 await asyncio.wait_for(sender_task, timeout=1.0)
@@ -676,16 +1020,67 @@ class RealtimeServer:
             finally:
                 sender_task = None
 
+        # Sender iniciado junto com os handlers: já está aguardando na fila
+        # quando o primeiro áudio do provider chega (sem create_task nesse
+        # momento). STOP só é enviado depois que houve áudio.
+        audio_started = False
+        sender_task = asyncio.create_task(_sender_loop_rawaudio())
+        logger.info(
+            f"FreeSWITCH playback sender started (mode={playback_mode})",
+            extra=log_extra
+        )
+
         return send_audio, clear_playback, flush_audio, cleanup_playback
     
-    async def _create_session_from_db(
-        self,
-        secretary_uuid: str,
-        call_uuid: str,
-        caller_id: str,
-        websocket: ServerConnection,
-    ):
-        """Cria sessão com configuração do banco."""
+    async def _get_secretary_row(self, secretary_uuid: str):
+        """
+        Linha da secretária, provider_config parseado e campos derivados,
+        com cache TTL.
+        
+        Chamadas em rajada para a mesma secretária reutilizam o resultado;
+        misses concorrentes compartilham um único SELECT (lock por UUID).
+        
+        Returns:
+            Tuple (row, provider_config, derived); não alterar os objetos
+        """
+        if SECRETARY_CACHE_TTL <= 0:
+            return await self._load_secretary_row(secretary_uuid)
+        
+        entry = self._secretary_cache.get(secretary_uuid)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1:]
+        
+        lock = self._secretary_locks.get(secretary_uuid)
+        if lock is None:
+            lock = self._secretary_locks[secretary_uuid] = asyncio.Lock()
+        try:
+            async with lock:
+                # Outro miss pode ter preenchido o cache enquanto aguardávamos
+                entry = self._secretary_cache.get(secretary_uuid)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1:]
+                
+                loaded = await self._load_secretary_row(secretary_uuid)
+                if len(self._secretary_cache) >= SECRETARY_CACHE_MAX:
+                    del self._secretary_cache[next(iter(self._secretary_cache))]
+                self._secretary_cache[secretary_uuid] = (
+                    time.monotonic() + SECRETARY_CACHE_TTL, *loaded,
+                )
+                return loaded
+        finally:
+            if self._secretary_locks.get(secretary_uuid) is lock:
+                del self._secretary_locks[secretary_uuid]
+    
+    async def _load_secretary_row(self, secretary_uuid: str):
+        """
+        Busca a secretária no banco e pré-processa os campos da linha.
+        
+        Returns:
+            Tuple (row, provider_config dict, campos derivados)
+        
+        Raises:
+            ValueError: Secretária inexistente ou desabilitada
+        """
         from services.database import db
         
         pool = await db.get_pool()
@@ -711,73 +1106,73 @@ class RealtimeServer:
                     s.tts_voice_id,
                     s.company_name,
                     -- Fallback Configuration
-                    COALESCE(s.fallback_action, 'ticket') as fallback_action,
+                    s.fallback_action,
                     s.fallback_user_id,
-                    COALESCE(s.fallback_priority, 'medium') as fallback_priority,
-                    COALESCE(s.fallback_notify_enabled, true) as fallback_notify_enabled,
+                    s.fallback_priority,
+                    s.fallback_notify_enabled,
                     -- Handoff OmniPlay fields
-                    COALESCE(s.handoff_enabled, true) as handoff_enabled,
-                    COALESCE(s.handoff_timeout, 30) as handoff_timeout,
-                    COALESCE(s.handoff_keywords, 'atendente,humano,pessoa,operador') as handoff_keywords,
+                    s.handoff_enabled,
+                    s.handoff_timeout,
+                    s.handoff_keywords,
                     s.handoff_queue_id,
-                    COALESCE(s.handoff_tool_fallback_enabled, true) as handoff_tool_fallback_enabled,
-                    COALESCE(s.handoff_tool_timeout_seconds, 3) as handoff_tool_timeout_seconds,
-                    COALESCE(s.fallback_ticket_enabled, true) as fallback_ticket_enabled,
-                    COALESCE(s.presence_check_enabled, true) as presence_check_enabled,
+                    s.handoff_tool_fallback_enabled,
+                    s.handoff_tool_timeout_seconds,
+                    s.fallback_ticket_enabled,
+                    s.presence_check_enabled,
                     s.omniplay_webhook_url,
                     s.omniplay_company_id,
                     -- Audio Configuration fields (defaults AUMENTADOS 2026-01-25)
-                    COALESCE(s.audio_warmup_chunks, 30) as audio_warmup_chunks,
-                    COALESCE(s.audio_warmup_ms, 600) as audio_warmup_ms,
-                    COALESCE(s.audio_adaptive_warmup, true) as audio_adaptive_warmup,
-                    COALESCE(s.jitter_buffer_min, 100) as jitter_buffer_min,
-                    COALESCE(s.jitter_buffer_max, 300) as jitter_buffer_max,
-                    COALESCE(s.jitter_buffer_step, 40) as jitter_buffer_step,
-                    COALESCE(s.stream_buffer_size, 20) as stream_buffer_size,  -- 20ms default (NOT samples!)
+                    s.audio_warmup_chunks,
+                    s.audio_warmup_ms,
+                    s.audio_adaptive_warmup,
+                    s.jitter_buffer_min,
+                    s.jitter_buffer_max,
+                    s.jitter_buffer_step,
+                    s.stream_buffer_size,
                     -- Business Hours (Time Condition)
                     s.time_condition_uuid,
                     s.outside_hours_message,
                     -- Call Timeouts
-                    COALESCE(s.idle_timeout_seconds, 30) as idle_timeout_seconds,
-                    COALESCE(s.max_duration_seconds, 600) as max_duration_seconds,
+                    s.idle_timeout_seconds,
+                    s.max_duration_seconds,
                     -- Input Normalization
-                    COALESCE(s.input_normalize_enabled, false) as input_normalize_enabled,
-                    COALESCE(s.input_target_rms, 2000) as input_target_rms,
-                    COALESCE(s.input_min_rms, 300) as input_min_rms,
-                    COALESCE(s.input_max_gain, 3.0) as input_max_gain,
+                    s.input_normalize_enabled,
+                    s.input_target_rms,
+                    s.input_min_rms,
+                    s.input_max_gain,
                     -- Call State logging/metrics
-                    COALESCE(s.call_state_log_enabled, true) as call_state_log_enabled,
-                    COALESCE(s.call_state_metrics_enabled, true) as call_state_metrics_enabled,
+                    s.call_state_log_enabled,
+                    s.call_state_metrics_enabled,
                     -- Unbridge behavior
-                    COALESCE(s.unbridge_behavior, 'hangup') as unbridge_behavior,
+                    s.unbridge_behavior,
                     s.unbridge_resume_message,
                     -- Hold return message (migration 032)
-                    COALESCE(s.hold_return_message, 'Obrigado por aguardar.') as hold_return_message,
+                    s.hold_return_message,
                     -- Silence Fallback
-                    COALESCE(s.silence_fallback_enabled, false) as silence_fallback_enabled,
-                    COALESCE(s.silence_fallback_seconds, 10) as silence_fallback_seconds,
-                    COALESCE(s.silence_fallback_action, 'reprompt') as silence_fallback_action,
+                    s.silence_fallback_enabled,
+                    s.silence_fallback_seconds,
+                    s.silence_fallback_action,
                     s.silence_fallback_prompt,
-                    COALESCE(s.silence_fallback_max_retries, 2) as silence_fallback_max_retries,
+                    s.silence_fallback_max_retries,
                     -- VAD Configuration (migration 023)
                     -- high responde rápido, medium é balanceado, low é paciente
-                    COALESCE(s.vad_type, 'semantic_vad') as vad_type,
-                    COALESCE(s.vad_eagerness, 'high') as vad_eagerness,
+                    s.vad_type,
+                    s.vad_eagerness,
                     -- Guardrails Configuration (migration 023)
-                    COALESCE(s.guardrails_enabled, true) as guardrails_enabled,
+                    s.guardrails_enabled,
                     s.guardrails_topics,
                     -- Announcement TTS Provider (migration 023)
-                    COALESCE(s.announcement_tts_provider, 'elevenlabs') as announcement_tts_provider,
+                    s.announcement_tts_provider,
                     -- Push-to-talk tuning
                     s.ptt_rms_threshold,
                     s.ptt_hits,
                     -- Transfer Mode Configuration (migrations 013, 022)
-                    COALESCE(s.transfer_announce_enabled, true) as transfer_announce_enabled,
-                    COALESCE(s.transfer_realtime_enabled, false) as transfer_realtime_enabled,
+                    s.transfer_announce_enabled,
+                    s.transfer_realtime_enabled,
                     s.transfer_realtime_prompt,
-                    COALESCE(s.transfer_realtime_timeout, 15) as transfer_realtime_timeout,
+                    s.transfer_realtime_timeout,
                     -- Business Info (migration 031)
-                    COALESCE(s.business_info, '{}'::jsonb) as business_info
+                    s.business_info
                 FROM v_voice_secretaries s
                 LEFT JOIN v_voice_ai_providers p ON p.voice_ai_provider_uuid = s.realtime_provider_uuid
                 WHERE s.voice_secretary_uuid = $1::uuid
@@ -786,111 +1181,147 @@ class RealtimeServer:
                 """,
                 secretary_uuid
             )
-            
-            if not row:
-                raise ValueError(f"No secretary found with UUID {secretary_uuid}")
-            
-            # Extrair domain_uuid da row para uso posterior
-            domain_uuid = str(row["domain_uuid"]) if row["domain_uuid"] else ""
-            
-            logger.info("Secretary found", extra={
-                "domain_uuid": domain_uuid,
-                "secretary_uuid": str(row["secretary_uuid"]),
-                "secretary_name": row["name"],
-                "extension": row["extension"],
-                "provider": row["provider_name"],
-            })
         
-        # ========================================
-        # Business Hours Check (Time Condition)
-        # Ref: voice-ai-ivr/openspec/changes/intelligent-voice-handoff/tasks.md
-        # ========================================
-        time_condition_uuid = row.get("time_condition_uuid")
+        if not row:
+            raise ValueError(f"No secretary found with UUID {secretary_uuid}")
+        
+        row = dict(row)
+        for key, default in SECRETARY_DEFAULTS.items():
+            if row.get(key) is None:
+                row[key] = default
         
-        if time_condition_uuid:
+        provider_config = row.get("provider_config")
+        if isinstance(provider_config, str):
             try:
-                time_checker = get_time_condition_checker()
-                time_result = await time_checker.check(
-                    domain_uuid=domain_uuid,
-                    time_condition_uuid=str(time_condition_uuid)
-                )
-                
-                logger.info("Business hours check", extra={
+                provider_config = json_codec.loads(provider_config)
+            except Exception:
+                provider_config = {}
+        return row, provider_config or {}, _derive_secretary_fields(row)
+    
+    async def _check_business_hours(self, row, domain_uuid: str, call_uuid: str):
+        """
+        Verifica o horário comercial da secretária (fail-open).
+        
+        Ref: voice-ai-ivr/openspec/changes/intelligent-voice-handoff/tasks.md
+        
+        Returns:
+            Resultado do time condition checker, ou None (sem restrição ou erro)
+        """
+        time_condition_uuid = row.get("time_condition_uuid")
+        if not time_condition_uuid:
+            return None  # Sem restrição de horário
+        
+        try:
+            time_checker = get_time_condition_checker()
+            time_result = await time_checker.check(
+                domain_uuid=domain_uuid,
+                time_condition_uuid=str(time_condition_uuid)
+            )
+        except Exception as e:
+            # Fail-open: em caso de erro, prosseguir normalmente
+            logger.warning(
+                f"Error checking business hours, proceeding: {e}",
+                extra={
                     "call_uuid": call_uuid,
                     "domain_uuid": domain_uuid,
-                    "time_condition_uuid": str(time_condition_uuid),
-                    "is_open": time_result.is_open,
+                }
+            )
+            return None
+        
+        logger.info("Business hours check", extra={
+            "call_uuid": call_uuid,
+            "domain_uuid": domain_uuid,
+            "time_condition_uuid": str(time_condition_uuid),
+            "is_open": time_result.is_open,
+            "status": time_result.status.value,
+            "message": time_result.message,
+        })
+        
+        if not time_result.is_open:
+            # Fora do horário comercial: a sessão é criada com a flag
+            # is_outside_business_hours, para que o Voice AI informe o
+            # cliente e crie ticket/callback ao invés de recusar a chamada
+            logger.warning(
+                "Call received outside business hours",
+                extra={
+                    "call_uuid": call_uuid,
+                    "domain_uuid": domain_uuid,
+                    "secretary_name": row["name"],
                     "status": time_result.status.value,
                     "message": time_result.message,
-                })
-                
-                if not time_result.is_open:
-                    # Fora do horário comercial
-                    # Retornar None para sinalizar que deve criar ticket/callback
-                    # O caller deve tratar isso apropriadamente
-                    logger.warning(
-                        "Call received outside business hours",
-                        extra={
-                            "call_uuid": call_uuid,
-                            "domain_uuid": domain_uuid,
-                            "secretary_name": row["name"],
-                            "status": time_result.status.value,
-                            "message": time_result.message,
-                        }
-                    )
-                    
-                    # Retornar configuração especial indicando fora do horário
-                    # A sessão será criada mas com flag para executar fluxo de fora-do-horário
-                    # Isso permite que o Voice AI informe o cliente e crie ticket
-                    # ao invés de simplesmente recusar a chamada
-                    
-            except Exception as e:
-                # Fail-open: em caso de erro, prosseguir normalmente
-                logger.warning(
-                    f"Error checking business hours, proceeding: {e}",
-                    extra={
-                        "call_uuid": call_uuid,
-                        "domain_uuid": domain_uuid,
-                    }
-                )
-                time_result = None
+                }
+            )
+        
+        return time_result
+    
+    async def _create_session_from_db(
+        self,
+        secretary_uuid: str,
+        call_uuid: str,
+        caller_id: str,
+        websocket: ServerConnection,
+    ):
+        """Cria sessão com configuração do banco."""
+        row, provider_config, derived = await self._get_secretary_row(secretary_uuid)
+        
+        # Extrair domain_uuid da row para uso posterior
+        domain_uuid = str(row["domain_uuid"]) if row["domain_uuid"] else ""
+        
+        logger.info("Secretary found", extra={
+            "domain_uuid": domain_uuid,
+            "secretary_uuid": str(row["secretary_uuid"]),
+            "secretary_name": row["name"],
+            "extension": row["extension"],
+            "provider": row["provider_name"],
+        })
+        
+        secretary_uuid = str(row["secretary_uuid"])
+        
+        # Horário comercial e transfer_rules são independentes: as duas
+        # consultas rodam juntas (gather cancela ambas se esta for cancelada)
+        config_loader = get_config_loader()
+        if config_loader:
+            time_result, transfer_rules_result = await asyncio.gather(
+                self._check_business_hours(row, domain_uuid, call_uuid),
+                config_loader.get_transfer_rules(
+                    domain_uuid=domain_uuid,
+                    secretary_uuid=secretary_uuid
+                ),
+                return_exceptions=True,
+            )
         else:
-            time_result = None  # Sem restrição de horário
+            time_result = await self._check_business_hours(row, domain_uuid, call_uuid)
+            transfer_rules_result = None
+        if isinstance(time_result, BaseException):
+            raise time_result
         
         # Configurar sessão (com overrides por provider/tenant)
-        vad_threshold = float(os.getenv("REALTIME_VAD_THRESHOLD", "0.65"))
-        silence_duration_ms = int(os.getenv("REALTIME_SILENCE_MS", "900"))
-        prefix_padding_ms = int(os.getenv("REALTIME_PREFIX_PADDING_MS", "300"))
-        max_response_output_tokens = _parse_max_tokens(os.getenv("REALTIME_MAX_OUTPUT_TOKENS", "4096"))
+        vad_threshold = REALTIME_VAD_THRESHOLD
+        silence_duration_ms = REALTIME_SILENCE_MS
+        prefix_padding_ms = REALTIME_PREFIX_PADDING_MS
+        max_response_output_tokens = REALTIME_MAX_OUTPUT_TOKENS
         # Voice: prioridade 1) banco (tts_voice_id), 2) env, 3) provider_config, 4) default
-        voice = (row.get("tts_voice_id") or os.getenv("REALTIME_VOICE", "") or "").strip()
+        voice = (row.get("tts_voice_id") or REALTIME_VOICE).strip()
         # Language: prioridade 1) banco, 2) default
         language = row.get("language") or "pt-BR"
-        fallback_providers_env = os.getenv("REALTIME_FALLBACK_PROVIDERS", "").strip()
-        barge_in_enabled = os.getenv("REALTIME_BARGE_IN", "true").lower() in ("1", "true", "yes")
+        fallback_providers_env = REALTIME_FALLBACK_PROVIDERS
+        barge_in_enabled = REALTIME_BARGE_IN
         tools = None
 
-        # Provider config pode sobrescrever defaults
-        provider_config_raw = row.get("provider_config")
-        if isinstance(provider_config_raw, str):
-            try:
-                provider_config_raw = json.loads(provider_config_raw)
-            except Exception:
-                provider_config_raw = {}
-        provider_config = provider_config_raw or {}
-
+        # Provider config pode sobrescrever defaults (já parseado no cache)
         if isinstance(provider_config, dict):
             vad_threshold = float(provider_config.get("vad_threshold", vad_threshold))
             silence_duration_ms = int(provider_config.get("silence_duration_ms", silence_duration_ms))
             prefix_padding_ms = int(provider_config.get("prefix_padding_ms", prefix_padding_ms))
             max_response_output_tokens = _parse_max_tokens(provider_config.get("max_response_output_tokens"), max_response_output_tokens or 4096)
             voice = str(provider_config.get("voice", voice or "alloy")).strip()
-            barge_in_enabled = str(provider_config.get("barge_in_enabled", str(barge_in_enabled))).lower() in ("1", "true", "yes")
+            barge_in_enabled = _parse_bool(provider_config.get("barge_in_enabled"), default=barge_in_enabled)
             fallback_providers_env = str(provider_config.get("fallback_providers", fallback_providers_env)).strip()
             tools_json = provider_config.get("tools_json")
             if tools_json:
                 try:
-                    tools = json.loads(tools_json) if isinstance(tools_json, str) else tools_json
+                    # Cópia: a lista é estendida abaixo e provider_config vem do cache
+                    tools = json_codec.loads(tools_json) if isinstance(tools_json, str) else list(tools_json)
                 except Exception:
                     logger.warning("Invalid tools_json in provider_config", extra={"call_uuid": call_uuid})
 
@@ -901,7 +1332,7 @@ class RealtimeServer:
                 if isinstance(fallback_providers_env, list):
                     fallback_providers = [str(p).strip() for p in fallback_providers_env if str(p).strip()]
                 elif fallback_providers_env.startswith("["):
-                    fallback_providers = [str(p).strip() for p in json.loads(fallback_providers_env) if str(p).strip()]
+                    fallback_providers = [str(p).strip() for p in json_codec.loads(fallback_providers_env) if str(p).strip()]
                 else:
                     fallback_providers = [p.strip() for p in fallback_providers_env.split(",") if p.strip()]
             except Exception:
@@ -912,45 +1343,42 @@ class RealtimeServer:
         # Ref: openspec/changes/add-realtime-handoff-omni/tasks.md (5.1-5.2)
         # ========================================
         system_prompt_base = row["system_prompt"] or ""
-        secretary_uuid = str(row["secretary_uuid"])
         
         # Carregar transfer_rules e construir contexto para o LLM
-        config_loader = get_config_loader()
         transfer_context = ""
+        transfer_rules = None
         
-        if config_loader:
-            try:
-                transfer_rules = await config_loader.get_transfer_rules(
-                    domain_uuid=domain_uuid,
-                    secretary_uuid=secretary_uuid
-                )
+        try:
+            if isinstance(transfer_rules_result, BaseException):
+                raise transfer_rules_result
+            transfer_rules = transfer_rules_result
+            
+            if transfer_rules:
+                # Usar idioma da secretária configurado no banco
+                transfer_context = build_transfer_context(transfer_rules, language)
                 
-                if transfer_rules:
-                    # Usar idioma da secretária configurado no banco
-                    transfer_context = build_transfer_context(transfer_rules, language)
-                    
-                    # Adicionar tools de transfer se não existirem
-                    if not tools:
-                        tools = build_transfer_tools_schema()
-                    else:
-                        # Verificar se transfer_call já existe
-                        tool_names = [t.get("function", {}).get("name") for t in tools if isinstance(t, dict)]
-                        if "transfer_call" not in tool_names:
-                            tools.extend(build_transfer_tools_schema())
-                    
-                    logger.info("Transfer rules injected into session", extra={
-                        "domain_uuid": domain_uuid,
-                        "secretary_uuid": secretary_uuid,
-                        "rules_count": len(transfer_rules),
-                        "call_uuid": call_uuid,
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Failed to load transfer rules: {e}", extra={
+                # Adicionar tools de transfer se não existirem
+                if not tools:
+                    tools = list(_TRANSFER_TOOLS_SCHEMA)
+                else:
+                    # Verificar se transfer_call já existe
+                    tool_names = {t.get("function", {}).get("name") for t in tools if isinstance(t, dict)}
+                    if "transfer_call" not in tool_names:
+                        tools.extend(_TRANSFER_TOOLS_SCHEMA)
+                
+                logger.info("Transfer rules injected into session", extra={
                     "domain_uuid": domain_uuid,
                     "secretary_uuid": secretary_uuid,
+                    "rules_count": len(transfer_rules),
                     "call_uuid": call_uuid,
                 })
+                
+        except Exception as e:
+            logger.warning(f"Failed to load transfer rules: {e}", extra={
+                "domain_uuid": domain_uuid,
+                "secretary_uuid": secretary_uuid,
+                "call_uuid": call_uuid,
+            })
         
         # ========================================
         # ADICIONAR FERRAMENTAS OBRIGATÓRIAS
@@ -971,51 +1399,34 @@ class RealtimeServer:
         if not tools:
             tools = []
         
-        # Verificar nomes existentes
-        tool_names = []
-        for t in tools:
-            if isinstance(t, dict):
-                # Formato pode ser {"type": "function", "name": ...} ou {"function": {"name": ...}}
-                name = t.get("name") or (t.get("function") or {}).get("name")
-                if name:
-                    tool_names.append(name)
-        
-        # Adicionar request_handoff se não existir
-        if "request_handoff" not in tool_names:
-            tools.append(HANDOFF_FUNCTION_DEFINITION)
-        
-        # Adicionar end_call se não existir
-        if "end_call" not in tool_names:
-            tools.append(END_CALL_FUNCTION_DEFINITION)
-        
-        # Adicionar take_message se não existir (OBRIGATÓRIO para recados)
-        if "take_message" not in tool_names:
-            tools.append(TAKE_MESSAGE_FUNCTION_DEFINITION)
-        
-        # ========================================
-        # FERRAMENTAS DE CONTROLE DE CHAMADA
-        # Disponíveis em todos os modos (usam ESL adapter)
-        # Ref: openspec/changes/dual-mode-esl-websocket/
-        # ========================================
-        
-        # Adicionar ferramentas de controle de chamada
-        if "hold_call" not in tool_names:
-            tools.append(HOLD_CALL_FUNCTION_DEFINITION)
-        
-        if "unhold_call" not in tool_names:
-            tools.append(UNHOLD_CALL_FUNCTION_DEFINITION)
+        # Ferramentas obrigatórias (inclui controle de chamada, disponível em
+        # todos os modos via ESL adapter - Ref: openspec/changes/dual-mode-esl-websocket/)
+        # e opcionais via webhook OmniPlay
+        required_tools = [
+            ("request_handoff", HANDOFF_FUNCTION_DEFINITION),
+            ("end_call", END_CALL_FUNCTION_DEFINITION),
+            ("take_message", TAKE_MESSAGE_FUNCTION_DEFINITION),  # OBRIGATÓRIO para recados
+            ("hold_call", HOLD_CALL_FUNCTION_DEFINITION),
+            ("unhold_call", UNHOLD_CALL_FUNCTION_DEFINITION),
+            ("check_extension_available", CHECK_EXTENSION_FUNCTION_DEFINITION),
+        ]
+        if row.get("omniplay_webhook_url"):
+            required_tools.append(("lookup_customer", LOOKUP_CUSTOMER_FUNCTION_DEFINITION))
+            required_tools.append(("check_appointment", CHECK_APPOINTMENT_FUNCTION_DEFINITION))
         
-        if "check_extension_available" not in tool_names:
-            tools.append(CHECK_EXTENSION_FUNCTION_DEFINITION)
+        # Nomes existentes. Formato pode ser {"type": "function", "name": ...}
+        # ou {"function": {"name": ...}}
+        tool_names = {
+            t.get("name") or (t.get("function") or {}).get("name")
+            for t in tools if isinstance(t, dict)
+        }
         
-        # Ferramentas opcionais via webhook OmniPlay
-        if row.get("omniplay_webhook_url"):
-            if "lookup_customer" not in tool_names:
-                tools.append(LOOKUP_CUSTOMER_FUNCTION_DEFINITION)
-            if "check_appointment" not in tool_names:
-                tools.append(CHECK_APPOINTMENT_FUNCTION_DEFINITION)
+        for name, definition in required_tools:
+            if name not in tool_names:
+                tools.append(definition)
+                tool_names.add(name)
         
-        audio_mode = os.getenv("AUDIO_MODE", "websocket").lower()
+        audio_mode = AUDIO_MODE
         
         logger.info("Session tools configured", extra={
             "call_uuid": call_uuid,
@@ -1029,44 +1440,20 @@ class RealtimeServer:
         if transfer_context:
             final_system_prompt = f"{system_prompt_base}\n{transfer_context}"
         
-        # Incluir business_info no prompt para evitar chamadas desnecessárias à tool
-        business_info = _parse_business_info(row.get("business_info"))
-        if business_info:
-            business_info_text = "\n\n# Informações da Empresa (USE DIRETAMENTE, NÃO PRECISA CHAMAR get_business_info)\n"
-            for key, value in business_info.items():
-                if value:
-                    # Traduzir chaves para português
-                    key_pt = {
-                        "servicos": "Serviços",
-                        "precos": "Preços/Planos",
-                        "promocoes": "Promoções",
-                        "horarios": "Horários",
-                        "localizacao": "Endereço",
-                        "contato": "Contato",
-                        "sobre": "Sobre a empresa",
-                        "geral": "Informações gerais",
-                    }.get(key, key.title())
-                    business_info_text += f"- {key_pt}: {value}\n"
-            final_system_prompt = f"{final_system_prompt}\n{business_info_text}"
-
-        # Parse handoff keywords from comma-separated string
-        handoff_keywords_str = row.get("handoff_keywords") or "atendente,humano,pessoa,operador"
-        handoff_keywords = [k.strip() for k in handoff_keywords_str.split(",") if k.strip()]
-        
-        # Parse farewell keywords from newline-separated string (configurável no frontend)
-        # Cada região pode ter gírias diferentes (falou, valeu, flw, vlw, etc)
-        farewell_keywords_str = row.get("farewell_keywords") or ""
-        if farewell_keywords_str:
-            # Keywords separadas por newline no frontend
-            farewell_keywords = [k.strip().lower() for k in farewell_keywords_str.split("\n") if k.strip()]
-        else:
-            # Fallback para keywords padrão
-            farewell_keywords = None  # Usará as keywords padrão no RealtimeSession
+        # business_info e keywords já processados com a linha (cópias: o
+        # cache é compartilhado entre chamadas)
+        if derived["business_info_text"]:
+            final_system_prompt = f"{final_system_prompt}\n{derived['business_info_text']}"
+
+        handoff_keywords = list(derived["handoff_keywords"])
+        farewell_keywords = derived["farewell_keywords"]
+        if farewell_keywords is not None:
+            farewell_keywords = list(farewell_keywords)
         
         # Validar configurações de transferência para detectar conflitos
         # Ref: voice-ai-ivr/docs/TRANSFER_SETTINGS_VS_RULES.md
         transfer_extension = row.get("transfer_extension") or "200"
-        if config_loader and transfer_rules:
+        if transfer_rules:
             config_warnings = validate_transfer_config(
                 handoff_keywords=handoff_keywords,
                 transfer_extension=transfer_extension,
@@ -1083,78 +1470,43 @@ class RealtimeServer:
                         "secretary_uuid": secretary_uuid,
                     })
         
-        # Audio Configuration - extrair valores do banco ANTES de criar o config
-        db_warmup_chunks = int(row.get("audio_warmup_chunks") or 30)  # AUMENTADO 2026-01-25
-        db_warmup_ms = int(row.get("audio_warmup_ms") or 600)  # AUMENTADO 2026-01-25
-        db_adaptive_warmup = _parse_bool(row.get("audio_adaptive_warmup"), default=True)
-        db_jitter_min = int(row.get("jitter_buffer_min") or 100)
-        db_jitter_max = int(row.get("jitter_buffer_max") or 300)
-        db_jitter_step = int(row.get("jitter_buffer_step") or 40)
-        db_stream_buffer = int(row.get("stream_buffer_size") or 20)  # 20ms default
-        db_ptt_rms = row.get("ptt_rms_threshold")
-        if db_ptt_rms is not None and int(db_ptt_rms) <= 0:
-            db_ptt_rms = None
-        db_ptt_hits = row.get("ptt_hits")
-        if db_ptt_hits is not None and int(db_ptt_hits) <= 0:
-            db_ptt_hits = None
+        # Campos do config que dependem só da linha: convertidos uma vez por
+        # preenchimento do cache (_secretary_config_fields)
+        config_fields = derived["config_fields"]
         
         logger.info("Audio config from DB", extra={
             "call_uuid": call_uuid,
-            "warmup_chunks": db_warmup_chunks,
-            "warmup_ms": db_warmup_ms,
-            "adaptive": db_adaptive_warmup,
-            "jitter": f"{db_jitter_min}:{db_jitter_max}:{db_jitter_step}",
-            "stream_buffer": db_stream_buffer,
+            "warmup_chunks": config_fields["audio_warmup_chunks"],
+            "warmup_ms": config_fields["audio_warmup_ms"],
+            "adaptive": config_fields["audio_adaptive_warmup"],
+            "jitter": (
+                f"{config_fields['jitter_buffer_min']}:"
+                f"{config_fields['jitter_buffer_max']}:"
+                f"{config_fields['jitter_buffer_step']}"
+            ),
+            "stream_buffer": config_fields["stream_buffer_size"],
         })
         
+        guardrails_topics = derived["guardrails_topics"]
         config = RealtimeSessionConfig(
+            **config_fields,
             domain_uuid=domain_uuid,
             call_uuid=call_uuid,
             caller_id=caller_id or "unknown",
             secretary_uuid=secretary_uuid,
-            secretary_name=row["name"] or "Voice Secretary",
-            company_name=row.get("company_name"),
-            business_info=_parse_business_info(row.get("business_info")),
-            provider_name=row["provider_name"] or "elevenlabs_conversational",
+            business_info=dict(derived["business_info"]),
             system_prompt=final_system_prompt,
-            greeting=row["greeting"],
-            farewell=row["farewell"],
             farewell_keywords=farewell_keywords,
             vad_threshold=vad_threshold,
             silence_duration_ms=silence_duration_ms,
             prefix_padding_ms=prefix_padding_ms,
             max_response_output_tokens=max_response_output_tokens,
             voice=voice or "alloy",
-            voice_id=row.get("tts_voice_id"),  # ElevenLabs voice_id para anúncios de transferência
             language=language,
             tools=tools,
             fallback_providers=fallback_providers,
             barge_in_enabled=barge_in_enabled,
-            omniplay_webhook_url=row.get("omniplay_webhook_url"),
-            # Handoff OmniPlay config
-            handoff_enabled=_parse_bool(row.get("handoff_enabled"), default=True),
-            handoff_timeout_ms=int(row.get("handoff_timeout", 30)) * 1000,  # seconds to ms
             handoff_keywords=handoff_keywords,
-            handoff_max_ai_turns=int(row.get("max_turns", 20)),
-            handoff_queue_id=row.get("handoff_queue_id"),
-            handoff_tool_fallback_enabled=_parse_bool(row.get("handoff_tool_fallback_enabled"), default=True),
-            handoff_tool_timeout_seconds=int(row.get("handoff_tool_timeout_seconds") or 3),
-            omniplay_company_id=row.get("omniplay_company_id"),
-            # Fallback Configuration (from database)
-            fallback_ticket_enabled=_parse_bool(row.get("fallback_ticket_enabled"), default=True),
-            fallback_action=row.get("fallback_action") or "ticket",
-            fallback_user_id=row.get("fallback_user_id"),
-            fallback_priority=row.get("fallback_priority") or "medium",
-            fallback_notify_enabled=_parse_bool(row.get("fallback_notify_enabled"), default=True),
-            presence_check_enabled=_parse_bool(row.get("presence_check_enabled"), default=True),
-            # Audio Configuration
-            audio_warmup_chunks=db_warmup_chunks,
-            audio_warmup_ms=db_warmup_ms,
-            audio_adaptive_warmup=db_adaptive_warmup,
-            jitter_buffer_min=db_jitter_min,
-            jitter_buffer_max=db_jitter_max,
-            jitter_buffer_step=db_jitter_step,
-            stream_buffer_size=db_stream_buffer,
             # Business Hours
             is_outside_business_hours=(
                 time_result is not None and not time_result.is_open
@@ -1164,44 +1516,8 @@ class RealtimeServer:
                 or (time_result.message if time_result and not time_result.is_open else None)
                 or "Estamos fora do horário de atendimento."
             ),
-            # Call Timeouts (from database)
-            idle_timeout_seconds=int(row.get("idle_timeout_seconds") or 30),
-            max_duration_seconds=int(row.get("max_duration_seconds") or 600),
-            # Input Normalization
-            input_normalize_enabled=_parse_bool(row.get("input_normalize_enabled"), default=False),
-            input_target_rms=int(row.get("input_target_rms") or 2000),
-            input_min_rms=int(row.get("input_min_rms") or 300),
-            input_max_gain=float(row.get("input_max_gain") or 3.0),
-            # Call State logging/metrics
-            call_state_log_enabled=_parse_bool(row.get("call_state_log_enabled"), default=True),
-            call_state_metrics_enabled=_parse_bool(row.get("call_state_metrics_enabled"), default=True),
-            # Unbridge behavior
-            unbridge_behavior=row.get("unbridge_behavior") or "hangup",
-            unbridge_resume_message=row.get("unbridge_resume_message"),
-            # Hold return message
-            hold_return_message=row.get("hold_return_message") or "Obrigado por aguardar.",
-            # Silence Fallback
-            silence_fallback_enabled=_parse_bool(row.get("silence_fallback_enabled"), default=False),
-            silence_fallback_seconds=int(row.get("silence_fallback_seconds") or 10),
-            silence_fallback_action=row.get("silence_fallback_action") or "reprompt",
-            silence_fallback_prompt=row.get("silence_fallback_prompt"),
-            silence_fallback_max_retries=int(row.get("silence_fallback_max_retries") or 2),
-            # VAD Configuration (migration 023)
-            vad_type=row.get("vad_type") or "semantic_vad",
-            vad_eagerness=row.get("vad_eagerness") or "high",
-            # Guardrails Configuration (migration 023)
-            guardrails_enabled=_parse_bool(row.get("guardrails_enabled"), default=True),
-            guardrails_topics=_parse_guardrails_topics(row.get("guardrails_topics")),
-            # Transfer Mode Configuration (migrations 013, 022)
-            transfer_announce_enabled=_parse_bool(row.get("transfer_announce_enabled"), default=True),
-            transfer_realtime_enabled=_parse_bool(row.get("transfer_realtime_enabled"), default=False),
-            transfer_realtime_prompt=row.get("transfer_realtime_prompt"),
-            transfer_realtime_timeout=float(row.get("transfer_realtime_timeout") or 15),
-            # Announcement TTS Provider (migration 023)
-            announcement_tts_provider=row.get("announcement_tts_provider") or "elevenlabs",
-            # Push-to-talk tuning
-            ptt_rms_threshold=db_ptt_rms,
-            ptt_hits=db_ptt_hits,
+            # Cópia: a lista em cache é compartilhada entre chamadas
+            guardrails_topics=list(guardrails_topics) if guardrails_topics else guardrails_topics,
         )
         
         logger.debug("Session config created", extra={
@@ -1216,13 +1532,18 @@ class RealtimeServer:
         
         # Criar sessão via manager
         manager = get_session_manager()
-        session = await manager.create_session(
-            config=config,
-            on_audio_output=send_audio,
-            on_barge_in=clear_playback,
-            on_transfer=clear_playback,
-            on_audio_done=flush_audio,
-        )
+        try:
+            session = await manager.create_session(
+                config=config,
+                on_audio_output=send_audio,
+                on_barge_in=clear_playback,
+                on_transfer=clear_playback,
+                on_audio_done=flush_audio,
+            )
+        except BaseException:
+            # O sender de playback já está rodando: encerrar antes de propagar
+            await cleanup_playback()
+            raise
         
         return session, cleanup_playback
 
@@ -1241,5 +1562,10 @@ if __name__ == "__main__":
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
     
+    # Mesmo loop do entrypoint do pacote (uvloop, se disponível); precisa
+    # ser instalado antes de asyncio.run()
+    from .__main__ import install_uvloop
+    install_uvloop()
+    
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8085
     asyncio.run(run_server(port=port))
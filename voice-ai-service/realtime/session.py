@@ -203,6 +203,7 @@ TAKE_MESSAGE_FUNCTION_DEFINITION = {
 # Ref: docs/PROJECT_EVOLUTION.md - Melhorias Conversacionais
 # ========================================
 
+# Tuplas: compartilhadas (somente leitura) por todas as sessões
 FUNCTION_FILLERS = {
     # ========================================
     # REGRA: Fillers são a ÚNICA fonte de fala durante function calls
@@ -212,63 +213,63 @@ FUNCTION_FILLERS = {
     # Transferências - SEM FILLER
     # A instrução de fala é enviada explicitamente via _send_text_to_provider
     # com o nome do cliente e destino personalizados
-    "request_handoff": [],
+    "request_handoff": (),
     
     # Verificação de disponibilidade
-    "check_availability": [
+    "check_availability": (
         "Consultando a disponibilidade...",
         "Verificando os horários disponíveis...",
-    ],
-    "check_extension_available": [
+    ),
+    "check_extension_available": (
         "Verificando se o ramal está disponível...",
         "Consultando o ramal...",
-    ],
+    ),
     
     # Criar ticket/protocolo
-    "create_ticket": [
+    "create_ticket": (
         "Vou criar um protocolo pra você...",
         "Registrando sua solicitação...",
-    ],
+    ),
     
     # Anotar recado - SEM FILLER
     # A IA deve falar a confirmação APÓS receber o resultado da função
     # Não usamos filler porque a IA geralmente já fala algo junto com a function call
-    "take_message": [],
-    "leave_message": [
+    "take_message": (),
+    "leave_message": (
         "Anotando sua mensagem...",
-    ],
+    ),
     
     # Consultas
     # get_business_info: SEM FILLER - função rápida (<100ms), não precisa
     # search: FILLER - pode demorar (consulta externa)
-    "search": [
+    "search": (
         "Deixa eu buscar isso...",
         "Consultando aqui...",
-    ],
-    "get_business_info": [],  # Rápido, não precisa de filler
-    "lookup_customer": [],    # Rápido, não precisa de filler
+    ),
+    "get_business_info": (),  # Rápido, não precisa de filler
+    "lookup_customer": (),    # Rápido, não precisa de filler
     
     # Hold/Unhold - SEM FILLER
     # A IA já deve avisar ANTES de chamar hold_call
     # (descrição da função diz: "Lembre-se de avisar o cliente antes")
-    "hold_call": [],
-    "unhold_call": [],
+    "hold_call": (),
+    "unhold_call": (),
     
     # Callback - SEM FILLER (fluxo conversacional natural)
-    "accept_callback": [],
-    "provide_callback_number": [],
-    "confirm_callback_number": [],
-    "schedule_callback": [],
+    "accept_callback": (),
+    "provide_callback_number": (),
+    "confirm_callback_number": (),
+    "schedule_callback": (),
     
     # Encerrar chamada - SEM FILLER (ação imediata)
-    "end_call": [],
+    "end_call": (),
     
     # Fallback para function calls desconhecidas
-    "_default": [
+    "_default": (
         "Um momento só...",
         "Certo, deixa eu verificar...",
         "Só um segundo...",
-    ]
+    )
 }
 
 # ========================================
@@ -3252,7 +3253,7 @@ IA: "Recado anotado! Maria, obrigada por ligar! Tenha um ótimo dia!"
         
         if fillers is None:
             # Function desconhecida, usar default
-            fillers = FUNCTION_FILLERS.get("_default", [])
+            fillers = FUNCTION_FILLERS.get("_default", ())
         
         # Retornar filler aleatório ou None se lista vazia
         if fillers:
@@ -15,12 +15,20 @@ Reference:
 - OpenAI Realtime: https://platform.openai.com/docs/guides/realtime
 """
 
-import audioop
 import logging
 from typing import Optional
 
+try:
+    import audioop  # Removed from the stdlib in Python 3.13
+    AUDIOOP_AVAILABLE = True
+except ImportError:
+    audioop = None  # type: ignore
+    AUDIOOP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_CODEC_ERRORS = (audioop.error, ValueError) if AUDIOOP_AVAILABLE else (ValueError,)
+
 # G.711 constants
 G711_SAMPLE_RATE = 8000
 G711_BYTES_PER_SAMPLE = 1  # 8-bit compressed
@@ -30,6 +38,75 @@ L16_SAMPLE_RATE = 8000  # Can also be 16000, 24000
 L16_BYTES_PER_SAMPLE = 2  # 16-bit linear
 
 
+# =============================================================================
+# Fallback without audioop: G.711 lookup tables (NumPy)
+#
+# audioop (C) stays the fast path: a 20ms frame converts in under 1µs, below
+# the call overhead of any NumPy/JIT kernel. The tables reproduce audioop
+# bit-exactly (same ITU-T G.711 algorithm) and are only built when it is
+# missing.
+# =============================================================================
+
+if not AUDIOOP_AVAILABLE:
+    import numpy as np
+    
+    def _build_ulaw_tables():
+        """μ-law tables: decode (256 → int16) and encode (int16 → uint8)."""
+        u = ~np.arange(256, dtype=np.int32) & 0xFF
+        t = ((u & 0x0F) << 3) + 0x84
+        t <<= (u & 0x70) >> 4
+        decode = np.where(u & 0x80, 0x84 - t, t - 0x84).astype("<i2")
+        
+        # Encode over all 65536 16-bit values (14 significant bits)
+        pcm = np.arange(-32768, 32768, dtype=np.int32) >> 2
+        mask = np.where(pcm < 0, 0x7F, 0xFF)
+        pcm = np.minimum(np.abs(pcm), 8159) + 0x21  # CLIP, BIAS >> 2
+        seg = np.searchsorted(
+            np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]), pcm
+        )
+        uval = np.where(
+            seg >= 8, 0x7F, (seg << 4) | ((pcm >> (np.minimum(seg, 7) + 1)) & 0x0F)
+        )
+        encode = (uval ^ mask).astype(np.uint8)
+        return decode, encode
+    
+    def _build_alaw_tables():
+        """A-law tables: decode (256 → int16) and encode (int16 → uint8)."""
+        a = np.arange(256, dtype=np.int32) ^ 0x55
+        t = (a & 0x0F) << 4
+        seg = (a & 0x70) >> 4
+        t = np.where(seg == 0, t + 8, (t + 0x108) << np.maximum(seg - 1, 0))
+        decode = np.where(a & 0x80, t, -t).astype("<i2")
+        
+        # Encode over all 65536 16-bit values (13 significant bits)
+        pcm = np.arange(-32768, 32768, dtype=np.int32) >> 3
+        mask = np.where(pcm >= 0, 0xD5, 0x55)
+        pcm = np.where(pcm >= 0, pcm, -pcm - 1)
+        seg = np.searchsorted(
+            np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]), pcm
+        )
+        shift = np.where(seg < 2, 1, np.minimum(seg, 7))
+        aval = np.where(seg >= 8, 0x7F, (seg << 4) | ((pcm >> shift) & 0x0F))
+        encode = (aval ^ mask).astype(np.uint8)
+        return decode, encode
+    
+    _ULAW_DECODE, _ULAW_ENCODE = _build_ulaw_tables()
+    _ALAW_DECODE, _ALAW_ENCODE = _build_alaw_tables()
+    
+    def _lut_encode(pcm_data: bytes, width: int, table) -> bytes:
+        """Little-endian PCM16 → G.711 via table (index = sample + 32768)."""
+        if width != 2 or len(pcm_data) % 2:
+            raise ValueError(f"unsupported PCM data (width={width}, {len(pcm_data)} bytes)")
+        samples = np.frombuffer(pcm_data, dtype="<u2") ^ 0x8000
+        return table[samples].tobytes()
+    
+    def _lut_decode(g711_data: bytes, width: int, table) -> bytes:
+        """G.711 → little-endian PCM16 via table."""
+        if width != 2:
+            raise ValueError(f"unsupported PCM width: {width}")
+        return table[np.frombuffer(g711_data, dtype=np.uint8)].tobytes()
+
+
 def pcm_to_ulaw(pcm_data: bytes, width: int = 2) -> bytes:
     """
     Convert linear PCM to G.711 μ-law.
@@ -48,8 +125,10 @@ def pcm_to_ulaw(pcm_data: bytes, width: int = 2) -> bytes:
         return b""
     
     try:
-        return audioop.lin2ulaw(pcm_data, width)
-    except audioop.error as e:
+        if AUDIOOP_AVAILABLE:
+            return audioop.lin2ulaw(pcm_data, width)
+        return _lut_encode(pcm_data, width, _ULAW_ENCODE)
+    except _CODEC_ERRORS as e:
         logger.error(f"Failed to convert PCM to μ-law: {e}")
         return b""
 
@@ -72,8 +151,10 @@ def ulaw_to_pcm(ulaw_data: bytes, width: int = 2) -> bytes:
         return b""
     
     try:
-        return audioop.ulaw2lin(ulaw_data, width)
-    except audioop.error as e:
+        if AUDIOOP_AVAILABLE:
+            return audioop.ulaw2lin(ulaw_data, width)
+        return _lut_decode(ulaw_data, width, _ULAW_DECODE)
+    except _CODEC_ERRORS as e:
         logger.error(f"Failed to convert μ-law to PCM: {e}")
         return b""
 
@@ -93,8 +174,10 @@ def pcm_to_alaw(pcm_data: bytes, width: int = 2) -> bytes:
         return b""
     
     try:
-        return audioop.lin2alaw(pcm_data, width)
-    except audioop.error as e:
+        if AUDIOOP_AVAILABLE:
+            return audioop.lin2alaw(pcm_data, width)
+        return _lut_encode(pcm_data, width, _ALAW_ENCODE)
+    except _CODEC_ERRORS as e:
         logger.error(f"Failed to convert PCM to A-law: {e}")
         return b""
 
@@ -114,8 +197,10 @@ def alaw_to_pcm(alaw_data: bytes, width: int = 2) -> bytes:
         return b""
     
     try:
-        return audioop.alaw2lin(alaw_data, width)
-    except audioop.error as e:
+        if AUDIOOP_AVAILABLE:
+            return audioop.alaw2lin(alaw_data, width)
+        return _lut_decode(alaw_data, width, _ALAW_DECODE)
+    except _CODEC_ERRORS as e:
         logger.error(f"Failed to convert A-law to PCM: {e}")
         return b""
 
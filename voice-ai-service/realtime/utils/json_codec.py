@@ -0,0 +1,37 @@
+"""
+Codec JSON para os caminhos quentes de WebSocket dos providers.
+
+Usa orjson (parser/encoder em C) quando disponível, com fallback
+transparente para o módulo json da stdlib.
+
+Observação: `dumps` retorna str porque as APIs realtime (OpenAI,
+ElevenLabs, FreeSWITCH) esperam frames de TEXTO; `websockets.send(bytes)`
+enviaria um frame binário.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    # orjson.loads aceita str, bytes, bytearray e memoryview diretamente
+    loads = orjson.loads
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        """Serializa para JSON compacto (str)."""
+        return orjson.dumps(obj, default=default).decode("utf-8")
+
+else:
+    loads = json.loads
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        """Serializa para JSON compacto (str)."""
+        return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+
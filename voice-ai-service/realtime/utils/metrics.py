@@ -10,7 +10,7 @@ import logging
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,9 @@ class RealtimeMetrics:
     
     def __init__(self):
         self._sessions: Dict[str, SessionMetrics] = {}
+        # Callbacks que publicam áudio acumulado localmente (record_audio em
+        # lote); chamados por session_ended antes de remover a sessão
+        self._audio_flushers: Dict[str, List[Callable[[], None]]] = {}
         
         if PROMETHEUS_AVAILABLE:
             self._init_prometheus()
@@ -126,6 +129,11 @@ class RealtimeMetrics:
         return metrics
     
     def session_ended(self, call_uuid: str, outcome: str = "completed") -> Optional[SessionMetrics]:
+        for flush in self._audio_flushers.pop(call_uuid, ()):
+            try:
+                flush()
+            except Exception:
+                pass
         metrics = self._sessions.pop(call_uuid, None)
         if not metrics:
             return None
@@ -154,19 +162,44 @@ class RealtimeMetrics:
             if PROMETHEUS_AVAILABLE:
                 self.response_latency.labels(domain_uuid=metrics.domain_uuid, provider=metrics.provider).observe(latency_seconds)
 
-    def record_audio(self, call_uuid: str, direction: str, byte_count: int) -> None:
+    def record_audio(
+        self,
+        call_uuid: str,
+        direction: str,
+        byte_count: int,
+        chunk_count: int = 1,
+    ) -> None:
+        """
+        Registra áudio trafegado. chunk_count > 1 permite que o chamador
+        acumule localmente e publique em lote (ex: 1x por segundo).
+        """
         metrics = self._sessions.get(call_uuid)
         if metrics:
             if direction == "in":
-                metrics.audio_chunks_received += 1
+                metrics.audio_chunks_received += chunk_count
                 metrics.audio_bytes_received += byte_count
             else:
-                metrics.audio_chunks_sent += 1
+                metrics.audio_chunks_sent += chunk_count
                 metrics.audio_bytes_sent += byte_count
             if PROMETHEUS_AVAILABLE:
-                self.audio_chunks.labels(domain_uuid=metrics.domain_uuid, direction=direction).inc()
+                self.audio_chunks.labels(domain_uuid=metrics.domain_uuid, direction=direction).inc(chunk_count)
                 self.audio_bytes.labels(domain_uuid=metrics.domain_uuid, direction=direction).inc(byte_count)
 
+    def register_audio_flush(self, call_uuid: str, flush: Callable[[], None]) -> None:
+        """
+        Registra callback que publica o áudio acumulado pelo chamador.
+        Garante que o último lote entre na sessão antes de session_ended.
+        """
+        self._audio_flushers.setdefault(call_uuid, []).append(flush)
+
+    def unregister_audio_flush(self, call_uuid: str, flush: Callable[[], None]) -> None:
+        """Remove callback registrado (o chamador já publicou o último lote)."""
+        flushers = self._audio_flushers.get(call_uuid)
+        if flushers and flush in flushers:
+            flushers.remove(flush)
+            if not flushers:
+                del self._audio_flushers[call_uuid]
+
     def record_playback_underrun(self, call_uuid: str) -> None:
         metrics = self._sessions.get(call_uuid)
         if metrics:
@@ -0,0 +1,169 @@
+"""
+Tests for OpenAI Realtime provider outbound writer.
+
+Referências:
+- voice-ai-service/realtime/providers/openai_realtime.py
+"""
+
+import asyncio
+
+import pytest
+
+
+class FakeWebSocket:
+    """WebSocket mínimo: registra mensagens; send() pode ser travado."""
+
+    def __init__(self, error=None):
+        self.sent = []
+        self.closed = False
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error = error
+
+    async def send(self, message):
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+def _provider(ws):
+    from realtime.providers.base import RealtimeConfig
+    from realtime.providers.openai_realtime import OpenAIRealtimeProvider
+
+    provider = OpenAIRealtimeProvider(
+        credentials={"api_key": "test-api-key"},
+        config=RealtimeConfig(domain_uuid="test-domain"),
+    )
+    provider._ws = ws
+    provider._connected = True
+    provider._writer_task = asyncio.create_task(provider._writer_loop())
+    return provider
+
+
+class TestOpenAIRealtimeWriter:
+    """Testes para o escritor único do WebSocket."""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_delivers_queued_messages(self):
+        ws = FakeWebSocket()
+        provider = _provider(ws)
+
+        await provider._send("a")
+        await provider._send("b")
+        await provider.disconnect()
+
+        assert ws.sent == ["a", "b"]
+        assert ws.closed
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_stuck_writer(self, monkeypatch):
+        from realtime.providers import openai_realtime
+
+        monkeypatch.setattr(openai_realtime, "_WRITER_DRAIN_TIMEOUT_S", 0.05)
+        ws = FakeWebSocket()
+        ws.release.clear()
+        provider = _provider(ws)
+
+        await provider._send("a")
+        await provider.disconnect()
+
+        assert ws.sent == []
+        assert provider._writer_task is None
+        assert provider._out_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_send_waits_when_queue_is_full(self):
+        ws = FakeWebSocket()
+        ws.release.clear()
+        provider = _provider(ws)
+        provider._out_queue = asyncio.Queue(maxsize=1)
+        provider._writer_task.cancel()
+        provider._writer_task = asyncio.create_task(provider._writer_loop())
+
+        await provider._send("a")  # writer retira e trava no send()
+        await asyncio.sleep(0)
+        await provider._send("b")  # ocupa a fila
+        blocked = asyncio.create_task(provider._send("c"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        ws.release.set()
+        await asyncio.wait_for(blocked, 1)
+        await provider.disconnect()
+        assert ws.sent == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_send_raises_writer_error(self):
+        import websockets
+
+        error = websockets.exceptions.ConnectionClosedError(None, None)
+        ws = FakeWebSocket(error=error)
+        provider = _provider(ws)
+
+        await provider._send("a")
+        await asyncio.wait_for(provider._writer_task, 1)
+
+        with pytest.raises(websockets.exceptions.ConnectionClosed):
+            await provider._send("b")
+        await provider.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_deadline_flushes_audio(self):
+        ws = FakeWebSocket()
+        provider = _provider(ws)
+
+        await provider.send_audio(b"\x00" * 10)  # abaixo do alvo: aguarda deadline
+        assert ws.sent == []
+        await asyncio.sleep(provider._audio_coalesce_s + 0.05)
+
+        assert len(ws.sent) == 1
+        assert "input_audio_buffer.append" in ws.sent[0]
+        await provider.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_pending_deadline_flush(self, monkeypatch):
+        from realtime.providers import openai_realtime
+
+        monkeypatch.setattr(openai_realtime, "_WRITER_DRAIN_TIMEOUT_S", 0.05)
+        ws = FakeWebSocket()
+        ws.release.clear()
+        provider = _provider(ws)
+        await asyncio.sleep(0)  # writer fica na fila original
+        provider._out_queue = asyncio.Queue(maxsize=1)
+        provider._out_queue.put_nowait("busy")  # flush fica aguardando espaço
+
+        await provider.send_audio(b"\x00" * 10)
+        await asyncio.sleep(provider._audio_coalesce_s + 0.05)
+        flush_task = provider._audio_flush_task
+        assert flush_task is not None and not flush_task.done()
+
+        await provider.disconnect()
+        assert flush_task.cancelled()
+        assert provider._audio_flush_task is None
+
+
+class TestOpenAIRealtimeSessionExpiry:
+    """Testes para o timer de expiração da sessão (limite de 60 min)."""
+
+    @pytest.mark.asyncio
+    async def test_expiry_timer_rearms_when_early(self):
+        import time
+
+        provider = _provider(FakeWebSocket())
+        limit = provider._max_session_duration_seconds
+
+        provider._session_start_time = time.monotonic() - (limit - 300)
+        provider._on_session_expiry_timer()
+        assert not provider._event_waker.is_set()
+        assert provider._session_expiry_timer is not None
+
+        provider._session_expiry_timer.cancel()
+        provider._session_start_time = time.monotonic() - (limit - 30)
+        provider._on_session_expiry_timer()
+        assert provider._event_waker.is_set()
+        assert provider.is_session_expiring_soon(threshold_seconds=60)
+        await provider.disconnect()
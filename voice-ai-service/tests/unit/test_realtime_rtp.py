@@ -0,0 +1,300 @@
+"""
+Tests for Realtime RTP protocol helpers.
+
+Referências:
+- voice-ai-service/realtime/rtp/protocol.py
+"""
+
+import pytest
+
+
+class TestParseRTPFrame:
+    """Testes para o parse rápido de pacotes RTP."""
+
+    def test_matches_full_parse(self):
+        """parse_rtp_frame deve concordar com RTPPacket.parse."""
+        from realtime.rtp.protocol import RTPHeader, RTPPacket, parse_rtp_frame
+
+        header = RTPHeader(
+            marker=True,
+            payload_type=8,
+            sequence=65535,
+            timestamp=123456,
+            cc=2,
+            csrc=[1, 2],
+            extension=True,
+            extension_data=b"abcd",
+        )
+        data = RTPPacket(header=header, payload=b"\x01\x02\x03").to_bytes()
+
+        frame = parse_rtp_frame(data)
+        packet = RTPPacket.parse(data)
+
+        assert frame.sequence == packet.sequence
+        assert frame.timestamp == packet.timestamp
+        assert frame.marker == packet.header.marker
+        assert frame.payload_type == packet.payload_type
+        assert frame.payload == packet.payload
+
+    def test_strips_padding(self):
+        """Bytes de padding não fazem parte do payload."""
+        from realtime.rtp.protocol import RTPHeader, parse_rtp_frame
+
+        data = RTPHeader(padding=True).to_bytes() + b"pay" + b"\x00\x00\x03"
+
+        assert parse_rtp_frame(data).payload == b"pay"
+
+    def test_rejects_short_packet(self):
+        from realtime.rtp.protocol import parse_rtp_frame
+
+        with pytest.raises(ValueError):
+            parse_rtp_frame(b"\x80\x00\x00")
+
+
+class TestRTPPacketBuilder:
+    """Testes para o builder de pacotes de saída."""
+
+    def test_build_into_matches_build(self):
+        """build_into deve gerar os mesmos bytes, inclusive ao mudar o tamanho."""
+        from realtime.rtp.protocol import RTPPacketBuilder
+
+        builder_a = RTPPacketBuilder(payload_type=0, ssrc=99)
+        builder_b = RTPPacketBuilder(payload_type=0, ssrc=99)
+
+        for size in (160, 160, 80):
+            expected = builder_a.build(b"\x7f" * size).to_bytes()
+            assert bytes(builder_b.build_into(b"\x7f" * size)) == expected
+
+
+class TestJitterBuffer:
+    """Testes para o jitter buffer (anel indexado por sequence)."""
+
+    @staticmethod
+    def _frame(seq: int):
+        from realtime.rtp.protocol import RTPFrame
+        return RTPFrame(seq & 0xFFFF, (seq * 160) & 0xFFFFFFFF, False, 0, b"")
+
+    @staticmethod
+    def _drain(jb):
+        out = []
+        packet = jb.pop()
+        while packet is not None:
+            out.append(packet.sequence)
+            packet = jb.pop()
+        return out
+
+    def test_reorders_across_sequence_wrap(self):
+        from realtime.rtp.jitter_buffer import JitterBuffer
+
+        jb = JitterBuffer()
+        for seq in [65534, 0, 65535, 1, 2]:
+            assert jb.push(self._frame(seq))
+
+        assert self._drain(jb) == [65534, 65535, 0, 1, 2]
+        assert jb.get_stats().packets_reordered == 1
+
+    def test_rejects_duplicates(self):
+        from realtime.rtp.jitter_buffer import JitterBuffer
+
+        jb = JitterBuffer()
+        assert jb.push(self._frame(10))
+        assert not jb.push(self._frame(10))
+        assert jb.size == 1
+        assert jb.get_stats().packets_duplicated == 1
+
+    def test_skips_lost_packets_and_drops_late_ones(self):
+        from realtime.rtp.jitter_buffer import JitterBuffer
+
+        jb = JitterBuffer()
+        for seq in [1, 2, 5, 6]:
+            jb.push(self._frame(seq))
+
+        assert self._drain(jb) == [1, 2, 5, 6]
+        assert not jb.push(self._frame(3))
+        assert jb.get_stats().packets_dropped == 1
+
+    def test_sequence_restart_behind_head_is_accepted(self):
+        from realtime.rtp.jitter_buffer import JitterBuffer
+
+        jb = JitterBuffer()
+        for seq in range(1000, 1004):
+            jb.push(self._frame(seq))
+        assert self._drain(jb) == [1000, 1001, 1002, 1003]
+
+        # Novo stream com sequence bem atrás do head: reinicia, não é atraso
+        delivered = []
+        for seq in range(500):
+            assert jb.push(self._frame(seq))
+            delivered += self._drain(jb)
+
+        assert delivered == list(range(500))
+        assert jb.get_stats().packets_dropped == 0
+
+    def test_overflow_drops_oldest(self):
+        from realtime.rtp.jitter_buffer import JitterBuffer
+
+        jb = JitterBuffer(max_delay_ms=100)  # capacidade: 10 pacotes
+        for seq in range(15):
+            jb.push(self._frame(seq))
+
+        assert jb.size == 10
+        assert jb.get_stats().buffer_overflows == 5
+        assert jb.pop().sequence == 5
+
+    def test_paced_underrun_raises_playout_delay(self):
+        from realtime.rtp.jitter_buffer import JitterBuffer
+
+        jb = JitterBuffer(min_delay_ms=40, max_delay_ms=80)  # 2-4 pacotes
+        jb.push(self._frame(0))
+        jb.push(self._frame(1))
+        assert self._drain(jb) == [0, 1]
+        assert jb.pop(timeout_ms=1) is None  # prazo do playout sem pacote
+        assert jb.get_stats().buffer_underruns == 1
+
+        jb.push(self._frame(2))
+        jb.push(self._frame(3))
+        assert jb.pop() is None  # agora exige 3 pacotes
+        jb.push(self._frame(4))
+        assert jb.pop().sequence == 2
+        assert jb.get_stats().playout_delay_ms == 60
+
+
+class FakeLoop:
+    """Relógio e call_at controlados pelo teste (sem event loop real)."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.timers = []
+
+    def time(self):
+        return self.now
+
+    def call_at(self, when, callback):
+        timer = (when, callback)
+        self.timers.append(timer)
+        return timer
+
+    def advance(self, now):
+        """Avança o relógio executando os timers vencidos, em ordem."""
+        self.now = now
+        while self.timers:
+            timer = min(self.timers, key=lambda t: t[0])
+            if timer[0] > now:
+                return
+            self.timers.remove(timer)
+            timer[1]()
+
+
+class TestRTPBridgePlayout:
+    """Testes para o relógio de playout do bridge."""
+
+    @staticmethod
+    def _frame(seq: int):
+        from realtime.rtp.protocol import RTPFrame
+        return RTPFrame(seq & 0xFFFF, (seq * 160) & 0xFFFFFFFF, False, 0, bytes([seq & 0xFF]))
+
+    @staticmethod
+    def _bridge(received):
+        from realtime.rtp.bridge import RTPBridge, RTPBridgeConfig
+
+        bridge = RTPBridge(RTPBridgeConfig(), on_audio_received=received.append)
+        bridge._loop = FakeLoop()
+        bridge._running = True
+        return bridge
+
+    @staticmethod
+    def _arrive(bridge, frames, now):
+        """Como _on_readable: chegada no instante now, push e relógio."""
+        bridge._loop.advance(now)
+        bridge._jitter_buffer.push_batch(frames)
+        bridge._ensure_playout()
+
+    def test_swapped_pairs_are_not_lost(self):
+        received = []
+        bridge = self._bridge(received)
+        # 6 chega antes de 5; 13 e 14 chegam antes de 12
+        order = [0, 1, 2, 3, 4, 6, 5, 7, 8, 9, 10, 11, 13, 14, 12, 15, 16, 17, 18, 19]
+        try:
+            for i, seq in enumerate(order):
+                self._arrive(bridge, [self._frame(seq)], i * 0.02)
+            bridge._loop.advance(1.0)
+        finally:
+            bridge._loop = None
+            bridge.stop()
+
+        assert received == [bytes([seq]) for seq in range(20)]
+        assert bridge.get_stats().packets_dropped == 0
+
+    def test_playout_delay_adapts_to_stall(self, monkeypatch):
+        """Stall na chegada gera underrun no playout; fluxo estável reduz."""
+        from realtime.rtp import jitter_buffer
+        from realtime.rtp.jitter_buffer import ADAPT_DECREASE_POPS
+
+        received = []
+        bridge = self._bridge(received)
+        loop = bridge._loop
+        monkeypatch.setattr(jitter_buffer, "_now", loop.time)
+        try:
+            t = 0.0
+            for seq in range(50):
+                self._arrive(bridge, [self._frame(seq)], t)
+                t += 0.02
+            t += 0.2  # rede parada por 200ms
+            for seq in range(50, 60):
+                self._arrive(bridge, [self._frame(seq)], t)
+                t += 0.02
+
+            stats = bridge.get_stats()
+            assert stats.buffer_underruns == 1
+            assert stats.playout_delay_ms == 80
+
+            for seq in range(60, 60 + ADAPT_DECREASE_POPS + 10):
+                self._arrive(bridge, [self._frame(seq)], t)
+                t += 0.02
+        finally:
+            bridge._loop = None
+            bridge.stop()
+
+        stats = bridge.get_stats()
+        assert stats.buffer_underruns == 1
+        assert stats.playout_delay_ms == 60
+
+
+class TestPortPool:
+    """Testes para o pool de portas RTP."""
+
+    def test_allocates_unique_pairs_until_exhausted(self):
+        from realtime.rtp.port_pool import PortPool
+
+        pool = PortPool(start_port=41000, end_port=41020, shards=3)
+        allocated = [pool.allocate() for _ in range(pool.total_ports)]
+
+        assert None not in allocated
+        assert len(set(allocated)) == pool.total_ports
+        assert all(rtcp == rtp + 1 and rtp % 2 == 0 for rtp, rtcp in allocated)
+        assert pool.allocate() is None
+        assert pool.in_use_count == pool.total_ports
+
+    def test_release_returns_port_to_pool(self):
+        from realtime.rtp.port_pool import PortPool
+
+        pool = PortPool(start_port=41100, end_port=41104)
+        rtp_port, _ = pool.allocate()
+
+        assert pool.release(rtp_port)
+        assert not pool.release(rtp_port)
+        assert pool.available_count == 2
+
+    def test_mark_in_use_externally_quarantines_port(self):
+        from realtime.rtp.port_pool import PortPool
+
+        pool = PortPool(start_port=41200, end_port=41204, shards=1)
+        rtp_port, _ = pool.allocate()
+
+        assert pool.mark_in_use_externally(rtp_port)
+        assert not pool.release(rtp_port)
+        assert pool.allocate()[0] != rtp_port
+        assert pool.allocate() is None
+
+        pool._recheck_quarantine()
+        assert pool.allocate()[0] == rtp_port
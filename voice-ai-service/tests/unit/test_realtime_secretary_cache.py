@@ -0,0 +1,104 @@
+"""
+Tests for the Realtime server secretary cache.
+
+Referências:
+- voice-ai-service/realtime/server.py
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+
+def _server(monkeypatch, rows):
+    """RealtimeServer com _load_secretary_row contando os SELECTs."""
+    from realtime.server import RealtimeServer
+
+    server = RealtimeServer()
+    loads = []
+
+    async def load(secretary_uuid):
+        loads.append(secretary_uuid)
+        await asyncio.sleep(0.01)  # simula o SELECT
+        return rows[secretary_uuid], {}, {}
+
+    monkeypatch.setattr(server, "_load_secretary_row", load)
+    return server, loads
+
+
+class TestSecretaryCache:
+    """Testes para o cache TTL da linha da secretária."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self, monkeypatch):
+        server, loads = _server(monkeypatch, {"s1": {"name": "A"}})
+
+        first = await server._get_secretary_row("s1")
+        second = await server._get_secretary_row("s1")
+
+        assert loads == ["s1"]
+        assert second[0] is first[0]
+
+    @pytest.mark.asyncio
+    async def test_miss_after_expiry(self, monkeypatch):
+        server, loads = _server(monkeypatch, {"s1": {"name": "A"}})
+
+        await server._get_secretary_row("s1")
+        entry = server._secretary_cache["s1"]
+        server._secretary_cache["s1"] = (0.0, *entry[1:])  # expirada
+        await server._get_secretary_row("s1")
+
+        assert loads == ["s1", "s1"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_select(self, monkeypatch):
+        server, loads = _server(monkeypatch, {"s1": {"name": "A"}})
+
+        results = await asyncio.gather(
+            *(server._get_secretary_row("s1") for _ in range(5))
+        )
+
+        assert loads == ["s1"]
+        assert all(r[0] is results[0][0] for r in results)
+        assert not server._secretary_locks
+
+    @pytest.mark.asyncio
+    async def test_defaults_replace_null_columns(self, monkeypatch):
+        import services.database as database
+        from realtime.server import RealtimeServer, SECRETARY_DEFAULTS
+
+        row = {key: None for key in SECRETARY_DEFAULTS}
+        row.update({
+            "secretary_uuid": "s1",
+            "name": "Recepção",
+            "provider_name": "openai",
+            "greeting": None,
+            "farewell": None,
+            "provider_config": '{"voice": "echo"}',
+            "max_turns": 7,
+            "business_info": None,
+        })
+
+        class FakeConn:
+            async def fetchrow(self, query, *args):
+                return row
+
+        class FakePool:
+            @asynccontextmanager
+            async def acquire(self):
+                yield FakeConn()
+
+        class FakeDB:
+            async def get_pool(self):
+                return FakePool()
+
+        monkeypatch.setattr(database, "db", FakeDB())
+
+        loaded, provider_config, _ = await RealtimeServer()._load_secretary_row("s1")
+
+        for key, default in SECRETARY_DEFAULTS.items():
+            if key != "max_turns":
+                assert loaded[key] == default
+        assert loaded["max_turns"] == 7
+        assert provider_config == {"voice": "echo"}